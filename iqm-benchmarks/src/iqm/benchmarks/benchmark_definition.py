@@ -26,12 +26,13 @@ import uuid
 
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
+import numpy as np
 import xarray as xr
 
 from iqm.benchmarks.benchmark import BenchmarkConfigurationBase
 from iqm.benchmarks.circuit_containers import BenchmarkCircuit, Circuits
 from iqm.benchmarks.logging_config import qcvv_logger
-from iqm.benchmarks.utils import get_iqm_backend, timeit
+from iqm.benchmarks.utils import get_iqm_backend, timeit, xrvariable_to_counts_entries
 from iqm.iqm_client.models import CircuitCompilationOptions, DDMode
 from iqm.qiskit_iqm.iqm_backend import IQMBackendBase
 from iqm.qiskit_iqm.iqm_provider import IQMBackend, IQMFacadeBackend
@@ -163,6 +164,13 @@ def add_counts_to_dataset(counts: List[Dict[str, int]], identifier: str, dataset
     """Adds the counts from a cortex job result to the given dataset.
     If counts with the same identifier are already present in the old dataset, then both counts are added together.
 
+    The counts of all circuits are stored together as a single circuits × outcomes variable ``{identifier}_counts``,
+    with the outcome bitstrings as the ``{identifier}_outcome`` coordinate. If most entries of that matrix would be
+    zero, or if some bitstrings are reported with zero counts, only the entries present in the counts are stored,
+    together with their ``{identifier}_circuit_index`` and ``{identifier}_outcome_index``. Either way,
+    xrvariable_to_counts reads back each circuit's bitstrings, including those with zero counts, and
+    xrvariable_to_counts_matrix the full matrix.
+
     Args:
         counts (List[Dict[str, int]]): A list of dictionaries with counts of bitstrings.
         identifier (str): A string to identify the current data, for instance the qubit layout.
@@ -174,19 +182,63 @@ def add_counts_to_dataset(counts: List[Dict[str, int]], identifier: str, dataset
     qcvv_logger.info(f"Adding counts to dataset")
     if not isinstance(counts, list):
         counts = [counts]
-    datasets = []
-    for ii, _ in enumerate(counts):
-        ds_temp = xr.Dataset()
-        counts_dict = dict(counts[ii])
-        counts_array = xr.DataArray(list(counts_dict.values()), {f"{identifier}_state_{ii}": list(counts_dict.keys())})
-        if f"{identifier}_counts_{ii}" in dataset.variables:
-            counts_array = counts_array + dataset[f"{identifier}_counts_{ii}"]
-        counts_array = counts_array.sortby(counts_array[f"{identifier}_state_{ii}"])
-        ds_temp.update({f"{identifier}_counts_{ii}": counts_array})
-        datasets.append(ds_temp)
-    dataset_new = merge_datasets_dac(datasets)
-    dataset_merged = dataset.merge(dataset_new, compat="override")
-    return dataset_merged
+    counts = [dict(c) for c in counts]
+    new_outcomes = {k for c in counts for k in c}
+    circuit_index = np.repeat(np.arange(len(counts)), [len(c) for c in counts])
+    values = np.array([v for c in counts for v in c.values()]) if len(circuit_index) else np.array([], dtype=np.int64)
+    num_circuits = len(counts)
+
+    counts_variables = [
+        f"{identifier}_{name}" for name in ("counts", "outcome", "circuit_index", "outcome_index", "circuit", "entry")
+    ]
+    if f"{identifier}_counts" in dataset.variables or f"{identifier}_counts_0" in dataset.variables:
+        old_outcomes, old_num_circuits, old_circuit_index, old_outcome_index, old_values = xrvariable_to_counts_entries(
+            dataset, identifier
+        )
+        outcomes = np.array(sorted(new_outcomes.union(old_outcomes)), dtype=str)
+        circuit_index = np.concatenate([circuit_index, old_circuit_index])
+        values = np.concatenate([values, old_values])
+        outcome_index = np.concatenate(
+            [
+                np.searchsorted(outcomes, [k for c in counts for k in c]).astype(np.intp),
+                np.searchsorted(outcomes, old_outcomes[old_outcome_index]).astype(np.intp),
+            ]
+        )
+        num_circuits = max(num_circuits, old_num_circuits)
+        counts_variables += [
+            name
+            for name in dataset.variables
+            if str(name).startswith((f"{identifier}_counts_", f"{identifier}_state_"))
+        ]
+    else:
+        outcomes = np.array(sorted(new_outcomes), dtype=str)
+        outcome_index = np.searchsorted(outcomes, [k for c in counts for k in c]).astype(np.intp)
+
+    # Accumulate entries of the same circuit and outcome, sorted by circuit
+    entries, inverse = np.unique(circuit_index * len(outcomes) + outcome_index, return_inverse=True)
+    summed_values = np.zeros(len(entries), dtype=values.dtype)
+    np.add.at(summed_values, inverse.ravel(), values)
+    circuit_index, outcome_index = np.divmod(entries, max(len(outcomes), 1))
+
+    dataset_merged = dataset.drop_vars(counts_variables, errors="ignore")
+    # A sparse entry takes three values, so it only pays off below a third of the matrix being filled. Bitstrings
+    # reported with zero counts are kept as entries, as the dense matrix cannot tell them apart from missing ones.
+    if 3 * len(entries) < num_circuits * len(outcomes) or not np.all(summed_values):
+        return dataset_merged.assign(
+            {
+                f"{identifier}_counts": xr.DataArray(
+                    summed_values, dims=f"{identifier}_entry", attrs={"num_circuits": num_circuits}
+                ),
+                f"{identifier}_circuit_index": (f"{identifier}_entry", circuit_index),
+                f"{identifier}_outcome_index": (f"{identifier}_entry", outcome_index),
+            }
+        ).assign_coords({f"{identifier}_outcome": outcomes})
+    matrix = np.zeros((num_circuits, len(outcomes)), dtype=summed_values.dtype)
+    matrix[circuit_index, outcome_index] = summed_values
+    counts_array = xr.DataArray(
+        matrix, dims=(f"{identifier}_circuit", f"{identifier}_outcome"), coords={f"{identifier}_outcome": outcomes}
+    )
+    return dataset_merged.assign({f"{identifier}_counts": counts_array})
 
 
 def show_figure(fig):
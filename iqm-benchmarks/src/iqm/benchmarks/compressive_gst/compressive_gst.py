@@ -27,7 +27,7 @@ The full benchmark executes the following steps:
     9) Generation of matrix plots for the reconstructed gate set
 """
 
-from typing import Any, Dict, List, Tuple, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
 from qiskit.circuit.library import CZGate, RGate
@@ -325,6 +325,10 @@ class GSTConfiguration(BenchmarkConfigurationBase):
         max_inits (int): If from_init = False, random initial points are tried and this parameter limits the amount of
             retries.
             * Default: 20
+        num_workers (int): If from_init = False, the number of worker processes over which the random initial points are
+            distributed. With more than one worker, the first initialization to converge is returned, which makes the
+            result depend on process timing.
+            * Default: 1 (initial points are tried one after another, reproducibly)
         opt_method (str): Which optimization method is used, can be either of "GD" or "SFN", for gradient descent or
             saddle free Newton, respectively.
             * Default: "auto" (Method is automatically selected based on qubit count and rank)
@@ -345,6 +349,8 @@ class GSTConfiguration(BenchmarkConfigurationBase):
             * Default: "auto"
         bootstrap_samples (int): The number of times the optimization algorithm is repeated on fake data to estimate
             the uncertainty via bootstrapping.
+        bootstrap_seed (Optional[int]): The seed of the random number generator used to resample the bootstrap data.
+            * Default: None (fresh randomness on every analysis)
         verbose_level (int): The level of verbosity of the output. 0 is minimal, 1 gives optimization updates, 2 outputs optimization plots
             * Default: 1
         parallel_execution (bool): Whether to run the circuits for all layouts in parallel on the backend.
@@ -361,11 +367,13 @@ class GSTConfiguration(BenchmarkConfigurationBase):
     seq_len_list: list[int] = [1, 8, 14]
     from_init: bool = True
     max_inits: int = 20
+    num_workers: int = 1
     opt_method: str = "auto"
     max_iterations: Union[str, List[int], int] = "auto"
     convergence_criteria: Union[str, List[float]] = [4, 1e-5]
     batch_size: Union[str, int] = "auto"
     bootstrap_samples: int = 0
+    bootstrap_seed: Optional[int] = None
     verbose_level: int = 1
     parallel_execution: bool = False
 
@@ -3,7 +3,6 @@ Data analysis code for compressive gate set tomography
 """
 
 import ast
-import multiprocessing as mp
 from time import perf_counter
 from typing import Any, List, Tuple, Union
 
@@ -26,8 +25,10 @@ from iqm.benchmarks.benchmark_definition import (
     BenchmarkRunResult,
 )
 from iqm.benchmarks.logging_config import qcvv_logger
+from iqm.benchmarks.utils import bootstrap_counts_matrix, marginalize_counts_matrix, xrvariable_to_counts_matrix
 from mGST import additional_fns, algorithm, compatibility
 from mGST.low_level_jit import contract
+from mGST.parallel import SharedArrays, available_workers, shared_pool, worker_state
 from mGST.qiskit_interface import qiskit_gate_to_operator
 from mGST.reporting import figure_gen, reporting
 
@@ -107,6 +108,26 @@ def process_bootstrap_samples(
     return X_opt_pp, E_opt_pp, rho_opt_pp, df_g.values, df_o.values, opt_success
 
 
+def process_shared_bootstrap_sample(
+    index: int,
+) -> tuple[ndarray, ndarray, ndarray, ndarray, ndarray, bool]:
+    """Process a single bootstrap sample inside a worker of the shared-memory bootstrap pool.
+
+    Args:
+        index: int
+            Index of the bootstrap sample in the shared array of resampled outcome probabilities
+
+    Returns:
+        The results of process_bootstrap_samples for the bootstrap sample
+    """
+    arrays, context, _ = worker_state()
+    attrs = {**context["attrs"], "J": arrays["J"]}
+    init = [arrays["K"].copy(), arrays["E"].copy(), arrays["rho"].copy()]
+    return process_bootstrap_samples(
+        arrays["y_sampled"][index].copy(), attrs, init, context["target_mdl"], context["identifier"]
+    )
+
+
 def bootstrap_errors(
     dataset: xr.Dataset,
     y: ndarray,
@@ -180,52 +201,43 @@ def bootstrap_errors(
     num_physical_cores = psutil.cpu_count(logical=False)
     num_workers = max(1, num_physical_cores - 1)
 
-    # Prepare arguments for each process
-    args_list = [
-        (
-            additional_fns.sampled_measurements(y, dataset.attrs["shots"]).copy(),
-            dataset.attrs,
-            [K, E, rho],
-            target_mdl,
-            identifier,
-        )
-        for _ in range(bootstrap_samples)
-    ]
+    # Draw all resampled datasets at once, with probabilities capped to [0, 1] as in additional_fns.sampled_measurements
+    rgen = np.random.default_rng(dataset.attrs.get("bootstrap_seed"))
+    shots = dataset.attrs["shots"]
+    y_sampled = bootstrap_counts_matrix(np.clip(y, 0, 1).T, bootstrap_samples, rgen, shots=shots) / shots
 
     # process layouts sequentially if the parallelizing bootstrapping is faster
-    if dataset.attrs["parallelization_path"] == "layout":
+    if dataset.attrs["parallelization_path"] == "layout" or available_workers(num_workers) == 1:
         qcvv_logger.info(f"Bootstrapping of layout {identifier}")
         all_results = []
         with logging_redirect_tqdm(loggers=[qcvv_logger]):
-            for i in trange(len(args_list)):
-                arg = args_list[i]
-                all_results.append(process_bootstrap_samples(*arg))
+            for i in trange(bootstrap_samples):
+                all_results.append(
+                    process_bootstrap_samples(y_sampled[i].T.copy(), dataset.attrs, [K, E, rho], target_mdl, identifier)
+                )
     else:
         qcvv_logger.info(f"Parallel bootstrapping using {num_workers} out of {num_physical_cores} physical cores")
-        # Execute in parallel
-        with mp.Manager() as manager:
-            all_results = []
-
-            # Create a shared counter to track completed tasks
-            counter = manager.Value("i", 0)
-
-            # Create a progress bar that will be updated by all processes
-            with logging_redirect_tqdm(loggers=[qcvv_logger]):
-                pbar = tqdm(total=bootstrap_samples, desc="Bootstrap samples")
-
-                def update_progress(_=None):
-                    counter.value += 1
-                    pbar.update(1)
-
-                # Execute in parallel
-                with mp.Pool(num_workers) as pool:
-                    results = [
-                        pool.apply_async(process_bootstrap_samples, args=arg, callback=update_progress)
-                        for arg in args_list
-                    ]
-                    all_results = [res.get() for res in results]  # Wait for all results
-
-                pbar.close()
+        # Resampled data, sequences and the initialization are placed once in shared memory,
+        # while the remaining attributes and the target model are sent once per worker instead of once per sample
+        shared_arrays = {"y_sampled": y_sampled.transpose(0, 2, 1), "J": dataset.attrs["J"], "K": K, "E": E, "rho": rho}
+        context = {
+            "attrs": {key: value for key, value in dataset.attrs.items() if key != "J"},
+            "target_mdl": target_mdl,
+            "identifier": identifier,
+        }
+        with SharedArrays(shared_arrays) as shared, logging_redirect_tqdm(loggers=[qcvv_logger]):
+            pool, _ = shared_pool(shared, num_workers, context)
+            with pool:
+                # imap keeps the order of the bootstrap samples while the progress bar is updated upon completion
+                all_results = list(
+                    tqdm(
+                        pool.imap(process_shared_bootstrap_sample, range(bootstrap_samples)),
+                        total=bootstrap_samples,
+                        desc="Bootstrap samples",
+                    )
+                )
+                pool.close()
+                pool.join()
 
     for i, (X_opt_pp, E_opt_pp, rho_opt_pp, df_g_values, df_o_values, success) in enumerate(all_results):
         X_list.append(X_opt_pp)
@@ -556,40 +568,22 @@ def dataset_counts_to_mgst_format(dataset: xr.Dataset, qubit_layout: List[int])
     """
     num_qubits = len(qubit_layout)
     num_povm = dataset.attrs["num_povm"]
-    y_list = []
-    for run_index in range(dataset.attrs["num_circuits"]):
-        if dataset.attrs["parallel_execution"]:
-            result_da = dataset[f"parallel_results_counts_{run_index}"].copy()
-            bit_pos = dataset.attrs["qubit_layouts"].index(qubit_layout)
-            # Create a new coordinate of bits at the position given by the qubit layout and reverse order
-            new_coords = [
-                coord[::-1][bit_pos * num_qubits : (bit_pos + 1) * num_qubits]
-                for coord in result_da.coords[result_da.dims[0]].values
-            ]
-        else:
-            result_da = dataset[f"{qubit_layout}_counts_{run_index}"].copy()
-            # Reverse order since counts are stored in qiskit order (bottom to top in circuit diagram)
-            new_coords = [coord[::-1] for coord in result_da.coords[result_da.dims[0]].values]
-        result_da.coords["new_coord"] = (result_da.dims[0], new_coords)
-        result_da = result_da.groupby("new_coord").sum()
-
-        coord_strings = list(result_da.coords[result_da.dims[0]].values)
-        # Translating from binary basis labels to integer POVM labels
-        basis_dict = {entry: int(entry, 2) for entry in coord_strings}
-        # Sort by index:
-        basis_dict = dict(sorted(basis_dict.items(), key=lambda item: item[1]))
-
-        counts_normalized = result_da / result_da.sum()
-        row = [float(counts_normalized.loc[key].data) for key in basis_dict]
-        # row = [result[key] for key in basis_dict]
-        if len(row) < num_povm:
-            missing_entries = list(np.arange(num_povm))
-            for given_entry in basis_dict.values():
-                missing_entries.remove(given_entry)
-            for missing_entry in missing_entries:
-                row.insert(missing_entry, 0)  # 0 measurement outcomes in not recorded entry
-        y_list.append(row)
-    y = np.array(y_list).T
+    num_circuits = dataset.attrs["num_circuits"]
+    if dataset.attrs["parallel_execution"]:
+        outcomes, counts = xrvariable_to_counts_matrix(dataset, "parallel_results")
+        bit_pos = dataset.attrs["qubit_layouts"].index(qubit_layout)
+        # Keep the bits at the position given by the qubit layout in reversed order
+        label_length = len(outcomes[0])
+        indices = [label_length - 1 - i for i in range(bit_pos * num_qubits, (bit_pos + 1) * num_qubits)]
+    else:
+        outcomes, counts = xrvariable_to_counts_matrix(dataset, f"{qubit_layout}")
+        # Reverse order since counts are stored in qiskit order (bottom to top in circuit diagram)
+        indices = list(reversed(range(len(outcomes[0]))))
+    outcomes, counts = marginalize_counts_matrix(outcomes, counts[:num_circuits], indices)
+
+    # Translating from binary basis labels to integer POVM labels, 0 measurement outcomes in not recorded entries
+    y = np.zeros((num_povm, num_circuits))
+    y[[int(entry, 2) for entry in outcomes]] = (counts / counts.sum(axis=1, keepdims=True)).T
     return y
 
 
@@ -672,6 +666,7 @@ def run_mGST_wrapper(
         target_rel_prec=dataset.attrs["convergence_criteria"][1],
         init=init_params,
         verbose_level=dataset.attrs["verbose_level"],
+        num_workers=dataset.attrs.get("num_workers", 1),
     )
 
     return K, X, E, rho, K_target, X_target, E_target, rho_target
@@ -682,18 +677,59 @@ def process_layout(
 ) -> Tuple[List[int], dict[str, Any], List[BenchmarkObservation], DataFrame, DataFrame, DataFrame]:
     """Process a single qubit layout for Gate Set Tomography analysis.
 
-    This function performs the full GST workflow for a single qubit layout:
-    1. Convert counts to mGST format
-    2. Run mGST reconstruction
-    3. Perform gauge optimization
-    4. Generate reports and metrics
-    5. Run bootstrap analysis if configured
-    6. Format results into dataframes and observations
-
     Args:
         args: Tuple
             containing: dataset: xr.Dataset, qubit_layout: List[int], pdim: int
 
+    Returns:
+        The results of process_layout_probabilities for the circuit outcome probabilities of the layout
+    """
+    dataset, qubit_layout, pdim = args
+    y = dataset_counts_to_mgst_format(dataset, qubit_layout)
+    return process_layout_probabilities(dataset, qubit_layout, pdim, y)
+
+
+def process_shared_layout(
+    index: int,
+) -> Tuple[List[int], dict[str, Any], List[BenchmarkObservation], DataFrame, DataFrame, DataFrame]:
+    """Process a single qubit layout inside a worker of the shared-memory layout pool.
+
+    Args:
+        index: int
+            Index of the qubit layout in dataset.attrs["qubit_layouts"] and in the shared array of outcome probabilities
+
+    Returns:
+        The results of process_layout_probabilities for the qubit layout
+    """
+    arrays, context, _ = worker_state()
+    # The analysis only needs the attributes of the dataset, the counts are replaced by the shared probabilities
+    dataset = xr.Dataset(attrs={**context["attrs"], "J": arrays["J"]})
+    qubit_layout = dataset.attrs["qubit_layouts"][index]
+    return process_layout_probabilities(dataset, qubit_layout, dataset.attrs["pdim"], arrays["y"][index].copy())
+
+
+def process_layout_probabilities(
+    dataset: xr.Dataset, qubit_layout: List[int], pdim: int, y: ndarray
+) -> Tuple[List[int], dict[str, Any], List[BenchmarkObservation], DataFrame, DataFrame, DataFrame]:
+    """Process a single qubit layout for Gate Set Tomography analysis from its circuit outcome probabilities.
+
+    This function performs the full GST workflow for a single qubit layout:
+    1. Run mGST reconstruction
+    2. Perform gauge optimization
+    3. Generate reports and metrics
+    4. Run bootstrap analysis if configured
+    5. Format results into dataframes and observations
+
+    Args:
+        dataset: xarray.Dataset
+            A dataset containing the configurations of the experiment in its attributes
+        qubit_layout: List[int]
+            The list of qubits for the current GST experiment
+        pdim: int
+            Physical dimension of the qubit layout
+        y: ndarray
+            The circuit outcome probabilities as a num_povm x num_circuits array
+
     Returns:
         qubit_layout: List[int]
             The input qubit layout being processed
@@ -708,14 +744,10 @@ def process_layout(
         df_g_evals: DataFrame
             DataFrame containing Choi matrix eigenvalues (for rank > 1)
     """
-    dataset, qubit_layout, pdim = args
     identifier = BenchmarkObservationIdentifier(qubit_layout).string_identifier
 
     qcvv_logger.info(f"Running mGST analysis for layout {qubit_layout}")
 
-    # Computing circuit outcome probabilities from counts
-    y = dataset_counts_to_mgst_format(dataset, qubit_layout)
-
     # Main GST reconstruction
     start_timer = perf_counter()
     K, X, E, rho, K_target, X_target, E_target, rho_target = run_mGST_wrapper(dataset, y)
@@ -904,22 +936,25 @@ def mgst_analysis(run: BenchmarkRunResult) -> BenchmarkAnalysisResult:
             all_results.append(process_layout(args))
     else:
         qcvv_logger.info(f"Parallel layout processing using {num_workers} out of {num_physical_cores} physical cores")
-        # Execute in parallel
-        with mp.Manager() as manager:
-            all_results = []
-            # Create a shared counter to track completed tasks
-            counter = manager.Value("i", 0)
-            total_layouts = len(dataset.attrs["qubit_layouts"])
-
-            # Define a callback function to update progress
-            def update_progress(_=None):
-                counter.value += 1
-                qcvv_logger.info(f"Completed estimation for {counter.value}/{total_layouts} qubit layouts")
-
-            # Execute in parallel using apply_async with callback
-            with mp.Pool(num_workers) as pool:
+        # Outcome probabilities of all layouts and the sequences are placed once in shared memory,
+        # while the remaining attributes are sent once per worker instead of the full dataset once per layout
+        shared_arrays = {
+            "y": np.array([dataset_counts_to_mgst_format(dataset, args[1]) for args in args_list]),
+            "J": dataset.attrs["J"],
+        }
+        context = {"attrs": {key: value for key, value in dataset.attrs.items() if key != "J"}}
+        completed = []
+
+        def update_progress(_=None):
+            completed.append(None)
+            qcvv_logger.info(f"Completed estimation for {len(completed)}/{n_layouts} qubit layouts")
+
+        with SharedArrays(shared_arrays) as shared:
+            pool, _ = shared_pool(shared, min(num_workers, n_layouts), context)
+            with pool:
                 async_results = [
-                    pool.apply_async(process_layout, args=(arg,), callback=update_progress) for arg in args_list
+                    pool.apply_async(process_shared_layout, args=(i,), callback=update_progress)
+                    for i in range(n_layouts)
                 ]
                 all_results = []
                 for i, res in enumerate(async_results):
@@ -940,6 +975,8 @@ def mgst_analysis(run: BenchmarkRunResult) -> BenchmarkAnalysisResult:
                             pd.DataFrame(),
                         )
                         all_results.append(error_result)
+                pool.close()
+                pool.join()
 
         # Collect results
     observations_list, df_g_list, df_o_list, df_g_evals_list = [], [], [], []
@@ -83,13 +83,12 @@ def fidelity_ghz_randomized_measurements(
 
     # Loop through RMs and add each contribution
     num_rms = len(circuits["transpiled_circuits"][f"{idx}_native_ghz"].circuits)
+    all_counts = xrvariable_to_counts(dataset, idx, num_rms)
     for u in range(num_rms):
         # Probability estimates for noisy measurements
-        probabilities_sample = {}
-        c_keys = dataset[f"{idx}_state_{u}"].data  # measurements[u].keys()
-        num_shots_noisy = sum(dataset[f"{idx}_counts_{u}"].data)
-        for k, key in enumerate(c_keys):
-            probabilities_sample[key] = dataset[f"{idx}_counts_{u}"].data[k] / num_shots_noisy
+        c_keys = all_counts[u].keys()  # measurements[u].keys()
+        num_shots_noisy = sum(all_counts[u].values())
+        probabilities_sample = {key: value / num_shots_noisy for key, value in all_counts[u].items()}
         # Keys for corresponding ideal probabilities
         c_id_keys = ideal_probabilities[u].keys()
 
@@ -104,13 +103,12 @@ def fidelity_ghz_randomized_measurements(
 
     if dataset.attrs["rem"]:
         fid_rm_rem = []
+        all_counts_rem = xrvariable_to_counts(dataset, f"{idx}_rem", num_rms)
         for u in range(num_rms):
             # Probability estimates for noisy measurements
-            probabilities_sample = {}
-            c_keys = dataset[f"{idx}_rem_state_{u}"].data  # measurements[u].keys()
-            num_shots_noisy = sum(dataset[f"{idx}_rem_counts_{u}"].data)
-            for k, key in enumerate(c_keys):
-                probabilities_sample[key] = dataset[f"{idx}_rem_counts_{u}"].data[k] / num_shots_noisy
+            c_keys = all_counts_rem[u].keys()  # measurements[u].keys()
+            num_shots_noisy = sum(all_counts_rem[u].values())
+            probabilities_sample = {key: value / num_shots_noisy for key, value in all_counts_rem[u].items()}
             # Keys for corresponding ideal probabilities
             c_id_keys = ideal_probabilities[u].keys()
 
@@ -57,7 +57,12 @@ from iqm.benchmarks.utils import (  # marginal_distribution, perform_backend_tra
     xrvariable_to_counts,
 )
 from iqm.benchmarks.utils_plots import GraphPositions, rx_to_nx_graph
-from iqm.benchmarks.utils_shadows import get_local_shadow, get_negativity, local_shadow_tomography
+from iqm.benchmarks.utils_shadows import (
+    LocalShadowAccumulator,
+    counts_to_bit_array,
+    get_negativity,
+    local_shadow_tomography,
+)
 from iqm.qiskit_iqm.iqm_backend import IQMBackendBase
 
 
@@ -614,6 +619,12 @@ def shadow_tomography_analysis(
                 shadows_per_projection[str(qubit_pair)][MoMs] = {
                     projection: [] for projection in all_projection_bit_strings
                 }
+                shadow_accumulator = LocalShadowAccumulator(
+                    subsystem_bit_indices=list(range(2)),
+                    clifford_or_haar="clifford",
+                    cliffords_1q=clifford_1q_dict,
+                    num_groups=len(all_projection_bit_strings),
+                )
                 for RM_idx, counts in enumerate(partitioned_counts_RMs[pair_idx][MoMs]):
                     # Retrieve both Cliffords (i.e. for each qubit)
                     cliffords_rm = [all_unitaries[group_idx][MoMs][str(q)][RM_idx] for q in qubit_pair]
@@ -624,37 +635,23 @@ def shadow_tomography_analysis(
                     #                   '100 10': 34, '100 11': 26, '101 00': 26, '101 01': 26, '101 10': 37, '101 11': 30,
                     #                   '110 00': 36, '110 01': 35, '110 10': 31, '110 11': 35, '111 00': 31, '111 01': 32,
                     #                   '111 10': 37, '111 11': 36}
-                    # organize to projected_counts['000'] ~ {'00': 31, '01': 31, '10': 38, '11': 41},
-                    #             projected_counts['001'] ~ {'00': 28, '01': 33, '10': 31, '11': 37}
-                    #             ...
-                    projected_counts = {
-                        projection: {
-                            b_s[-2:]: b_c
-                            for b_s, b_c in counts.items()
-                            if b_s[:neighbor_bit_strings_length] == projection
-                        }
-                        for projection in all_projection_bit_strings
-                    }
+                    # The last two bits belong to qubit_pair, and the leading neighbor bits give the projection,
+                    # e.g. '001 10' contributes the outcome '10' to the shadow of projection '001'.
+                    # The shadows of all projections are obtained at once from the array of bits.
+                    bits, weights = counts_to_bit_array(counts)
+                    projections = bits[:, 2:][:, ::-1] @ (1 << np.arange(neighbor_bit_strings_length - 1, -1, -1))
 
                     # Get the individual shadow for each projection
-                    for projected_bit_string in all_projection_bit_strings:
+                    shadows = shadow_accumulator.add(bits, weights, cliffords_rm, groups=projections)
+                    for projection_idx, projected_bit_string in enumerate(all_projection_bit_strings):
                         shadows_per_projection[str(qubit_pair)][MoMs][projected_bit_string].append(
-                            get_local_shadow(
-                                counts=projected_counts[projected_bit_string],
-                                unitary_arg=cliffords_rm,
-                                subsystem_bit_indices=list(range(2)),
-                                clifford_or_haar="clifford",
-                                cliffords_1q=clifford_1q_dict,
-                            )
+                            shadows[projection_idx]
                         )
 
                 # Average the shadows for each projection and MoMs sample
-                average_shadows_per_projection[str(qubit_pair)][MoMs] = {
-                    projected_bit_string: np.mean(
-                        shadows_per_projection[str(qubit_pair)][MoMs][projected_bit_string], axis=0
-                    )
-                    for projected_bit_string in all_projection_bit_strings
-                }
+                average_shadows_per_projection[str(qubit_pair)][MoMs] = dict(
+                    zip(all_projection_bit_strings, shadow_accumulator.mean)
+                )
 
                 # Compute the negativity of the shadow of each projection
                 qcvv_logger.info(
@@ -776,6 +773,7 @@ def state_tomography_analysis(
     execution_results = {}
 
     num_bootstraps = dataset.attrs["num_bootstraps"]
+    rgen = np.random.default_rng(dataset.attrs.get("bootstrap_seed"))
 
     tomography_state: Dict[int, Dict[str, Dict[str, np.ndarray]]] = {}
     # tomography_state: group_idx -> qubit_pair -> {projection:numpy array}
@@ -874,7 +872,7 @@ def state_tomography_analysis(
                     if b_s[:neighbor_bit_strings_length] == max_negativity_bitstring
                 }
                 all_bootstrapped_counts = bootstrap_counts(
-                    projected_counts, num_bootstraps, include_original_counts=True
+                    projected_counts, num_bootstraps, rgen=rgen, include_original_counts=True
                 )
                 for bootstrap in range(num_bootstraps):
                     bootstrapped_pauli_expectations[bootstrap] = update_pauli_expectations(
@@ -1334,6 +1332,8 @@ class GraphStateConfiguration(BenchmarkConfigurationBase):
             * Default is "state_tomography".
         num_bootstraps (int): The amount of bootstrap samples to use with state tomography.
             * Default is 50.
+        bootstrap_seed (Optional[int]): The seed of the random number generator used for bootstrapping.
+            * Default is None (fresh randomness on every analysis).
         n_random_unitaries (int): The number of Haar random single-qubit unitaries to use for (local) shadow tomography.
             * Default is 100.
         n_median_of_means(int): The number of mean samples over n_random_unitaries to generate a median of means estimator for shadow tomography.
@@ -1346,5 +1346,6 @@ class GraphStateConfiguration(BenchmarkConfigurationBase):
     qubits: Sequence[int]
     tomography: Literal["state_tomography", "shadow_tomography"] = "state_tomography"
     num_bootstraps: int = 50
+    bootstrap_seed: Optional[int] = None
     n_random_unitaries: int = 100
     n_median_of_means: int = 1
@@ -19,12 +19,13 @@ CLOPS benchmark
 from datetime import datetime
 from math import floor, pi
 from time import perf_counter, strftime
-from typing import Any, Dict, List, Sequence, Tuple, Type
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
 
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
+from more_itertools import chunked
 import numpy as np
-from qiskit.circuit import ParameterVector
+from qiskit.circuit import Parameter, ParameterExpression, ParameterVector
 import xarray as xr
 
 from iqm.benchmarks import Benchmark
@@ -40,6 +41,7 @@ from iqm.benchmarks.logging_config import qcvv_logger
 from iqm.benchmarks.utils import (
     count_2q_layers,
     count_native_gates,
+    get_batching_size,
     perform_backend_transpilation,
     retrieve_all_counts,
     retrieve_all_job_metadata,
@@ -48,8 +50,11 @@ from iqm.benchmarks.utils import (
     submit_execute,
     timeit,
 )
+from iqm.iqm_client.models import CircuitCompilationOptions
 from iqm.qiskit_iqm import IQMCircuit as QuantumCircuit
 from iqm.qiskit_iqm.iqm_backend import IQMBackendBase
+from iqm.qiskit_iqm.iqm_job import IQMJob
+from iqm.qiskit_iqm.iqm_provider import IQMBackend, IQMFacadeBackend
 from iqm.qiskit_iqm.iqm_transpilation import optimize_single_qubit_gates
 
 
@@ -313,6 +318,110 @@ def clops_analysis(run: BenchmarkRunResult) -> BenchmarkAnalysisResult:
     return BenchmarkAnalysisResult(dataset=dataset, plots=plots, observations=observations)
 
 
+class SerializedTemplateBatch:
+    """A batch of parametrized circuit templates serialized once into the IQM circuit format.
+
+    New parameter values are written directly into the arguments of the serialized PRX instructions, so that
+    parameter updates neither copy Qiskit circuits nor serialize them again.
+
+    Args:
+        backend (IQMBackend): the backend to submit the circuits to.
+        templates (Sequence[QuantumCircuit]): the transpiled parametrized quantum circuits of the batch.
+        parameters (Sequence[Parameter]): the parameters the values given to bind refer to, in order.
+            * Templates may contain only some of them.
+        shots (int): the number of shots per circuit.
+        calset_id (Optional[str]): the calibration set ID, passed on as in submit_execute.
+            * Default is None: uses the latest calibration ID.
+        circuit_compilation_options (Optional[CircuitCompilationOptions]): the circuit compilation options.
+
+    Raises:
+        ValueError: if the serialized instructions of a template cannot be matched to its Qiskit instructions.
+    """
+
+    def __init__(
+        self,
+        backend: IQMBackend,
+        templates: Sequence[QuantumCircuit],
+        parameters: Sequence[Parameter],
+        shots: int,
+        calset_id: Optional[str] = None,
+        circuit_compilation_options: Optional[CircuitCompilationOptions] = None,
+    ):
+        self.backend = backend
+        self.templates = list(templates)
+        self.parameters = list(parameters)
+        self.run_request = backend.create_run_request(
+            [qc.assign_parameters(dict.fromkeys(qc.parameters, 0.0)) for qc in self.templates],
+            shots=shots,
+            calibration_set_id=calset_id,
+            circuit_compilation_options=circuit_compilation_options,
+        )
+        parameter_index = {p: i for i, p in enumerate(self.parameters)}
+
+        # For each template: the (args, key) slots holding parametrized values, the positions of its parameters in
+        # the bound values, and the matrix and offset mapping them to the slots, plus the slots whose values are not
+        # affine in the parameters
+        self.bindings: List[Tuple[List[Tuple[dict, str]], np.ndarray, np.ndarray, np.ndarray, List[Tuple]]] = []
+        for qc, circuit in zip(self.templates, self.run_request.circuits):
+            parameters = list(qc.parameters)
+            indices = np.array([parameter_index[p] for p in parameters], dtype=np.intp)
+            operations = [instruction.operation for instruction in qc.data if instruction.operation.name != "id"]
+            if len(operations) != len(circuit.instructions):
+                raise ValueError(f"Could not match the serialized instructions of circuit {qc.name} to its template.")
+
+            slots: List[Tuple[Dict[str, Any], str]] = []
+            rows: List[List[float]] = []
+            offsets: List[float] = []
+            general: List[Tuple] = []
+            for operation, native in zip(operations, circuit.instructions):
+                if operation.name != "r":
+                    continue
+                # PRX arguments are given either in turns or in radians, depending on the IQM client version
+                if "angle_t" in native.args:
+                    keys, scale = ("angle_t", "phase_t"), 1 / (2 * pi)
+                else:
+                    keys, scale = ("angle", "phase"), 1.0
+                for param, key in zip(operation.params, keys):
+                    if not isinstance(param, ParameterExpression) or not param.parameters:
+                        continue
+                    gradient = [param.gradient(p) if p in param.parameters else 0.0 for p in parameters]
+                    if any(isinstance(g, ParameterExpression) for g in gradient):
+                        general.append((native.args, key, param, scale))
+                        continue
+                    slots.append((native.args, key))
+                    rows.append([scale * float(np.real(g)) for g in gradient])
+                    offsets.append(scale * float(param.bind(dict.fromkeys(param.parameters, 0.0))))
+            self.bindings.append(
+                (slots, indices, np.array(rows).reshape(len(slots), len(parameters)), np.array(offsets), general)
+            )
+
+    def bind(self, parameter_values: np.ndarray) -> None:
+        """Writes new parameter values into the serialized circuits.
+
+        Args:
+            parameter_values (np.ndarray): the values of the parameters of the batch for each template, with shape
+                (templates, parameters).
+        """
+        for (slots, indices, matrix, offsets, general), values in zip(self.bindings, parameter_values):
+            for (args, key), value in zip(slots, (matrix @ values[indices] + offsets).tolist()):
+                args[key] = value
+            if general:
+                param_dict = dict(zip(self.parameters, values))
+                for args, key, param, scale in general:
+                    args[key] = scale * float(param.bind({p: param_dict[p] for p in param.parameters}))
+
+    def submit(self) -> IQMJob:
+        """Submits the serialized circuits with their current parameter values for execution.
+
+        Returns:
+            IQMJob: the job of the submitted circuits.
+        """
+        job_id = self.backend.client.submit_run_request(self.run_request)
+        job = IQMJob(self.backend, str(job_id), shots=self.run_request.shots)
+        job.circuit_metadata = [circuit.metadata for circuit in self.run_request.circuits]
+        return job
+
+
 class CLOPSBenchmark(Benchmark):
     """
     CLOPS reflect the speed of execution of parametrized QV circuits.
@@ -347,6 +456,7 @@ class CLOPSBenchmark(Benchmark):
 
         self.qiskit_optim_level = configuration.qiskit_optim_level
         self.optimize_sqg = configuration.optimize_sqg
+        self.fast_parameter_binding = configuration.fast_parameter_binding
 
         # POST-EXPERIMENT AND VARIABLES TO STORE
         self.clops_h_bool = configuration.clops_h_bool
@@ -358,6 +468,7 @@ class CLOPSBenchmark(Benchmark):
         self.time_circuit_generate: float = 0.0
         self.time_transpile: float = 0.0
         self.time_sort_batches: float = 0.0
+        self.time_serialize_templates: float = 0.0
 
         self.session_timestamp = strftime("%Y-%m-%d_%H:%M:%S")
         self.execution_timestamp: str = ""
@@ -528,17 +639,78 @@ class CLOPSBenchmark(Benchmark):
 
         return param_values, sorted_dict_parametrized
 
+    @timeit
+    def generate_serialized_templates(
+        self,
+        backend: IQMBackend,
+        sorted_transpiled_qc_list: Dict[Tuple, List[QuantumCircuit]],
+    ) -> Optional[List[SerializedTemplateBatch]]:
+        """Serializes the transpiled templates once, divided into the same batches as submit_execute would use.
+
+        Args:
+            backend (IQMBackend): the backend to execute the jobs with
+            sorted_transpiled_qc_list (Dict[str, List[QuantumCircuit]]): A dictionary of lists of transpiled quantum circuits
+        Returns:
+            Optional[List[SerializedTemplateBatch]]: the serialized template batches, in submission order, or None if
+                some template could not be serialized for fast parameter binding
+        """
+        template_batches = []
+        for k in sorted(
+            sorted_transpiled_qc_list.keys(),
+            key=lambda x: len(sorted_transpiled_qc_list[x]),
+            reverse=True,
+        ):
+            _, batching_size = get_batching_size(
+                sorted_transpiled_qc_list[k], self.max_gates_per_batch, self.configuration.max_circuits_per_batch
+            )
+            for qc_batch in chunked(sorted_transpiled_qc_list[k], batching_size):
+                try:
+                    template_batches.append(
+                        SerializedTemplateBatch(
+                            backend,
+                            qc_batch,
+                            self.param_vector,
+                            self.num_shots,
+                            self.calset_id,
+                            self.circuit_compilation_options,
+                        )
+                    )
+                except ValueError as e:
+                    qcvv_logger.warning(f"{e} Falling back to assigning parameters to copies of the circuits.")
+                    return None
+        return template_batches
+
+    @timeit
+    def bind_random_parameters_to_templates(self, template_batches: List[SerializedTemplateBatch]) -> List[List[float]]:
+        """Writes random parameters into all serialized circuit templates.
+
+        Args:
+            template_batches (List[SerializedTemplateBatch]): the serialized template batches
+        Returns:
+            List[List[float]]: the parameter values of each circuit, in submission order
+        """
+        total_circuits = sum(len(batch.templates) for batch in template_batches)
+        all_parameters = np.random.uniform(low=-pi, high=pi, size=(total_circuits, self.num_parameters))
+        start = 0
+        for batch in template_batches:
+            batch.bind(all_parameters[start : start + len(batch.templates)])
+            start += len(batch.templates)
+        return all_parameters.tolist()
+
     def clops_cycle(
         self,
         backend: IQMBackendBase,
         sorted_transpiled_qc_list: Dict[Tuple, List[QuantumCircuit]],
         update: int,
+        template_batches: Optional[List[SerializedTemplateBatch]] = None,
     ) -> Tuple[float, float, float]:
         """Executes a single CLOPS cycle (parameter assignment and execution) for the given update
         Args:
             backend (IQMBackendBase): the backend to execute the jobs with
             sorted_transpiled_qc_list (Dict[str, List[QuantumCircuit]]): A dictionary of lists of transpiled quantum circuits
             update (int): The current cycle update
+            template_batches (Optional[List[SerializedTemplateBatch]]): The serialized templates to rebind parameters in
+                * Default is None: parameters are assigned to copies of the transpiled quantum circuits
         Returns:
             Tuple[float, float, float]: The elapsed times for parameter assignment, submission and retrieval of jobs
         """
@@ -549,21 +721,29 @@ class CLOPSBenchmark(Benchmark):
         qcvv_logger.info(
             f"Assigning random parameters to all {self.num_circuits} circuits"
         )
-        (all_param_updates, sorted_transpiled_qc_list_parametrized), time_parameter_assign = (
-            self.assign_random_parameters_to_all(sorted_transpiled_qc_list, self.optimize_sqg)
-        )
+        if template_batches is not None:
+            all_param_updates, time_parameter_assign = self.bind_random_parameters_to_templates(template_batches)
+
+            qcvv_logger.info(f"Executing the corresponding circuit batch")
+            start_submit = perf_counter()
+            all_jobs = [batch.submit() for batch in template_batches]
+            time_submit = perf_counter() - start_submit
+        else:
+            (all_param_updates, sorted_transpiled_qc_list_parametrized), time_parameter_assign = (
+                self.assign_random_parameters_to_all(sorted_transpiled_qc_list, self.optimize_sqg)
+            )
 
-        qcvv_logger.info(f"Executing the corresponding circuit batch")
-        # Submit all circuits to execute
-        all_jobs, time_submit = submit_execute(
-            sorted_transpiled_qc_list_parametrized,
-            backend,
-            self.num_shots,
-            self.calset_id,
-            max_gates_per_batch=self.max_gates_per_batch,
-            max_circuits_per_batch=self.configuration.max_circuits_per_batch,
-            circuit_compilation_options=self.circuit_compilation_options,
-        )
+            qcvv_logger.info(f"Executing the corresponding circuit batch")
+            # Submit all circuits to execute
+            all_jobs, time_submit = submit_execute(
+                sorted_transpiled_qc_list_parametrized,
+                backend,
+                self.num_shots,
+                self.calset_id,
+                max_gates_per_batch=self.max_gates_per_batch,
+                max_circuits_per_batch=self.configuration.max_circuits_per_batch,
+                circuit_compilation_options=self.circuit_compilation_options,
+            )
 
         qcvv_logger.info(f"Retrieving counts")
         # Retrieve counts - the precise outputs do not matter
@@ -644,6 +824,15 @@ class CLOPSBenchmark(Benchmark):
 
         sorted_transpiled_qc_list = self.generate_transpiled_clops_templates()
 
+        # Serialize the templates once, if parameters can be rebound directly in the IQM circuit format
+        template_batches = None
+        use_templates = isinstance(backend, IQMBackend) and not isinstance(backend, IQMFacadeBackend)
+        if self.fast_parameter_binding and use_templates:
+            qcvv_logger.info("Serializing the circuit templates for fast parameter binding")
+            template_batches, self.time_serialize_templates = self.generate_serialized_templates(
+                backend, sorted_transpiled_qc_list
+            )
+
         # *********************************************
         # Start CLOPS timer
         # *********************************************
@@ -653,7 +842,9 @@ class CLOPSBenchmark(Benchmark):
         all_times_submit = {}
         all_times_retrieve = {}
         for n in range(self.num_updates):
-            time_parameter_assign, time_submit, time_retrieve = self.clops_cycle(backend, sorted_transpiled_qc_list, n)
+            time_parameter_assign, time_submit, time_retrieve = self.clops_cycle(
+                backend, sorted_transpiled_qc_list, n, template_batches
+            )
             all_times_parameter_assign["update_" + str(n + 1)] = time_parameter_assign
             all_times_submit["update_" + str(n + 1)] = time_submit
             all_times_retrieve["update_" + str(n + 1)] = time_retrieve
@@ -674,6 +865,7 @@ class CLOPSBenchmark(Benchmark):
                 "time_circuit_generate": self.time_circuit_generate,
                 "time_transpile": self.time_transpile,
                 "time_sort_batches": self.time_sort_batches,
+                "time_serialize_templates": self.time_serialize_templates,
                 "parameters_per_update": self.parameters_per_update,
                 "job_meta_per_update": self.job_meta_per_update,
                 "counts_per_update": self.counts_per_update,
@@ -715,6 +907,12 @@ class CLOPSConfiguration(BenchmarkConfigurationBase):
                             - "fixed": Restricts the coupling map to only the specified qubits.
                             - "batching": Considers the full coupling map of the backend and circuit execution is batched per final layout.
                             * Default is "fixed".
+        fast_parameter_binding (bool): Whether the transpiled templates are serialized once into the IQM circuit format
+                            and parameter updates are written directly into them, instead of copying and serializing
+                            every circuit in every update.
+                            * Only used with IQM backends executing on hardware; other backends use the regular path.
+                            * Single qubit gate optimization is then only applied to the templates, not per update.
+                            * Default is True
     """
 
     benchmark: Type[Benchmark] = CLOPSBenchmark
@@ -725,3 +923,4 @@ class CLOPSConfiguration(BenchmarkConfigurationBase):
     clops_h_bool: bool = False
     qiskit_optim_level: int = 3
     optimize_sqg: bool = True
+    fast_parameter_binding: bool = True
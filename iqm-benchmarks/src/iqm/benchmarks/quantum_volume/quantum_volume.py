@@ -16,7 +16,7 @@
 Quantum Volume benchmark
 """
 
-from copy import deepcopy
+from collections import OrderedDict
 from time import strftime
 from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Type
 
@@ -26,7 +26,8 @@ from mthree.classes import QuasiCollection
 from mthree.utils import expval
 import numpy as np
 from qiskit.circuit.library import QuantumVolume
-from qiskit_aer import StatevectorSimulator
+from qiskit.quantum_info import Statevector
+from qiskit.utils import parallel_map
 import xarray as xr
 
 from iqm.benchmarks.benchmark import BenchmarkConfigurationBase
@@ -42,6 +43,7 @@ from iqm.benchmarks.circuit_containers import BenchmarkCircuit, CircuitGroup, Ci
 from iqm.benchmarks.logging_config import qcvv_logger
 from iqm.benchmarks.readout_mitigation import apply_readout_error_mitigation
 from iqm.benchmarks.utils import (  # execute_with_dd,
+    circuit_fingerprint,
     count_native_gates,
     perform_backend_transpilation,
     retrieve_all_counts,
@@ -101,40 +103,88 @@ def cumulative_std(hops: List[float]) -> List[float]:
     return c_s
 
 
+IDEAL_HEAVY_OUTPUTS_CACHE_SIZE = 8192
+"""Maximum number of circuits whose ideal heavy outputs are kept by get_ideal_heavy_outputs."""
+_ideal_heavy_outputs_cache: OrderedDict[Tuple[Any, ...], np.ndarray] = OrderedDict()
+
+
+def clear_ideal_heavy_outputs_cache() -> None:
+    """Empties the cache of ideal heavy outputs kept by get_ideal_heavy_outputs."""
+    _ideal_heavy_outputs_cache.clear()
+
+
+def heavy_output_indices(probabilities: np.ndarray) -> np.ndarray:
+    """Select the heavy outputs of a probability vector, i.e., those with probability above the median.
+
+    Args:
+        probabilities (np.ndarray): The probabilities of all computational basis states, indexed by their integer value.
+
+    Returns:
+        np.ndarray: The sorted integer values of the heavy output bitstrings.
+    """
+    return np.flatnonzero(probabilities > np.median(probabilities))
+
+
+def ideal_heavy_output_indices(qc: QuantumCircuit) -> np.ndarray:
+    """Computes the heavy outputs of the noiseless output distribution of a quantum circuit.
+
+    Args:
+        qc (QuantumCircuit): the quantum circuit, final measurements are ignored.
+    Returns:
+        np.ndarray: The sorted integer values of the heavy output bitstrings.
+    """
+    return heavy_output_indices(Statevector(qc.remove_final_measurements(inplace=False)).probabilities())
+
+
 def get_ideal_heavy_outputs(
     qc_list: List[QuantumCircuit],
     sorted_qc_list_indices: Dict[Tuple[int, ...], List[int]],
+    num_processes: Optional[int] = None,
 ) -> List[Dict[str, float]]:
     """Calculate the heavy output bitrstrings of a list of quantum circuits.
 
+    Circuits are simulated in parallel processes, and the heavy outputs of structurally identical circuits are
+    computed only once and kept in a cache; see clear_ideal_heavy_outputs_cache.
+
     Args:
         qc_list (List[QuantumCircuit]): the list of quantum circuits.
         sorted_qc_list_indices (Dict[Tuple, List[int]]): dictionary of indices (integers) corresponding to those in the original (untranspiled) list of circuits, with keys being final physical qubit measurements
+        num_processes (Optional[int]): the maximum number of processes used for the simulation.
+            * Default is None, i.e., as chosen by Qiskit.
     Returns:
         List[Dict[str, float]]: the list of heavy output dictionaries of each of the quantum circuits.
     """
-    simulable_circuits = deepcopy(qc_list)
+    # Order the circuits as their counts, separated according to sorted indices
+    ordered_circuits = [
+        qc_list[i]
+        for k in sorted(sorted_qc_list_indices.keys(), key=lambda x: len(sorted_qc_list_indices[x]), reverse=True)
+        for i in sorted_qc_list_indices[k]
+    ]
+    # Circuits without a fingerprint get a key of their own and are left out of the cache
+    fingerprints = [circuit_fingerprint(qc) for qc in ordered_circuits]
+    keys = [fp if fp is not None else (None, i) for i, fp in enumerate(fingerprints)]
+
+    missing: Dict[Tuple[Any, ...], QuantumCircuit] = {}
+    for key, qc in zip(keys, ordered_circuits):
+        if key in _ideal_heavy_outputs_cache:
+            _ideal_heavy_outputs_cache.move_to_end(key)
+        else:
+            missing.setdefault(key, qc)
+    heavy_indices = {key: _ideal_heavy_outputs_cache[key] for key in keys if key not in missing}
+
+    if missing:
+        simulated = parallel_map(ideal_heavy_output_indices, list(missing.values()), num_processes=num_processes)
+        heavy_indices.update(zip(missing, simulated))
+        _ideal_heavy_outputs_cache.update((key, h) for key, h in zip(missing, simulated) if key[0] is not None)
+        while len(_ideal_heavy_outputs_cache) > IDEAL_HEAVY_OUTPUTS_CACHE_SIZE:
+            _ideal_heavy_outputs_cache.popitem(last=False)
+
     ideal_heavy_outputs: List[Dict[str, float]] = []
-    ideal_simulator = StatevectorSimulator()
-
-    # Separate according to sorted indices
-    circuit_batches = {
-        k: [simulable_circuits[i] for i in sorted_qc_list_indices[k]] for k in sorted_qc_list_indices.keys()
-    }
-
-    for k in sorted(
-        circuit_batches.keys(),
-        key=lambda x: len(circuit_batches[x]),
-        reverse=True,
-    ):
-        for qc in circuit_batches[k]:
-            qc.remove_final_measurements()
-            ideal_probabilities = ideal_simulator.run(qc).result().get_counts()
-            heavy_projectors = heavy_projector(ideal_probabilities)
-            if isinstance(heavy_projectors, list):
-                ideal_heavy_outputs.extend(heavy_projectors)
-            elif isinstance(heavy_projectors, dict):
-                ideal_heavy_outputs.append(heavy_projectors)
+    for key, qc in zip(keys, ordered_circuits):
+        # Bitstrings with qubit 0 as the rightmost character, as in the counts
+        bits = (heavy_indices[key][:, None] >> np.arange(qc.num_qubits - 1, -1, -1)) & 1
+        bitstrings = (bits + ord("0")).astype(np.uint8).view(f"S{qc.num_qubits}").ravel().astype(str)
+        ideal_heavy_outputs.append(dict.fromkeys(bitstrings.tolist(), 1.0))
 
     return ideal_heavy_outputs
 
@@ -157,21 +207,6 @@ def get_rem_hops(
     return qv_result_rem
 
 
-def heavy_projector(probabilities: Dict[str, float]) -> Dict[str, float]:
-    """
-        Project (select) the samples from a given probability distribution onto heavy outputs.
-
-    Args:
-        probabilities (Dict[str, float]): A dictionary of bitstrings and associated probabilities.
-
-    Returns:
-        Dict[str, float]: The dictionary of heavy output bitstrings, all with weight 1.
-    """
-    median_prob = np.median(list(probabilities.values()))
-    heavy_outputs = {k: 1.0 for k, v in probabilities.items() if v > median_prob}
-    return heavy_outputs
-
-
 def is_successful(
     heavy_output_probabilities: List[float],
     num_sigmas: int = 2,
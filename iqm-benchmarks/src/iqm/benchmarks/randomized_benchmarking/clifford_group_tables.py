@@ -0,0 +1,338 @@
+# Copyright 2024 IQM Benchmarks developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Integer-indexed Clifford group tables for fast generation of Randomized Benchmarking sequences
+"""
+
+import ast
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from numpy.random import Generator
+from qiskit.circuit import Barrier, CircuitInstruction
+from qiskit.quantum_info import Clifford
+
+from iqm.qiskit_iqm import IQMCircuit as QuantumCircuit
+
+
+_PAULI_BITS = {"I": (0, 0), "X": (1, 0), "Y": (1, 1), "Z": (0, 1)}
+
+
+def _parse_clifford_label(label: str, num_qubits: int) -> tuple[np.ndarray, np.ndarray]:
+    """Parses a Clifford dictionary key into its symplectic matrix and phase vector.
+
+    Args:
+        label (str): A key of the Clifford dictionaries, i.e., the string representation of
+            ``Clifford.to_labels(mode="B")``: destabilizers followed by stabilizers, qubit 0 being the rightmost.
+        num_qubits (int): The number of qubits of the Clifford.
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The rows (images of X_0..X_n-1, Z_0..Z_n-1) as x bits followed by z bits, and
+            the sign bits of the rows.
+    """
+    rows = ast.literal_eval(label)
+    matrix = np.zeros((2 * num_qubits, 2 * num_qubits), dtype=np.uint8)
+    phases = np.zeros(2 * num_qubits, dtype=np.uint8)
+    for i, row in enumerate(rows):
+        phases[i] = row[0] == "-"
+        for qubit, pauli in enumerate(reversed(row[1:])):
+            matrix[i, qubit], matrix[i, num_qubits + qubit] = _PAULI_BITS[pauli]
+    return matrix, phases
+
+
+def _pack_bits(bits: np.ndarray) -> np.ndarray:
+    """Packs the last axis of a bit array into integers, the first bit being the least significant."""
+    return (bits.astype(np.int64) << np.arange(bits.shape[-1])).sum(axis=-1)
+
+
+@dataclass(frozen=True)
+class CliffordGroupTables:
+    """Composition and inverse tables of the n-qubit Clifford group, indexed by integers.
+
+    Every Clifford is the product of a Pauli and a symplectic part, so that it is indexed by
+    ``symplectic_index * 4**n + phase_bits`` where phase_bits packs the signs of its tableau rows.
+    Composition then only needs tables over the symplectic group, which has 6 elements for one qubit and 720 for
+    two qubits, instead of a table over the whole group.
+
+    Attributes:
+        num_qubits (int): The number of qubits.
+        labels (List[str]): The Clifford dictionary keys, indexed by group element.
+        circuits (List[QuantumCircuit]): The native gate circuits, indexed by group element.
+        symplectic_compose (np.ndarray): Index of the symplectic part of ``C1 C2``, by symplectic parts of C1 and C2.
+        phase_cocycle (np.ndarray): Phase bits of ``C1 C2`` for Cliffords with trivial phases, by symplectic parts.
+        phase_transform (np.ndarray): Phase bits of C1 as seen through C2, by symplectic part of C2 and phases of C1.
+        inverse (np.ndarray): Index of the inverse of each group element.
+        identity (int): Index of the identity.
+    """
+
+    num_qubits: int
+    labels: List[str]
+    circuits: List[QuantumCircuit]
+    symplectic_compose: np.ndarray
+    phase_cocycle: np.ndarray
+    phase_transform: np.ndarray
+    inverse: np.ndarray
+    identity: int
+
+    @classmethod
+    def from_clifford_dict(cls, clifford_dict: Dict[str, QuantumCircuit]) -> "CliffordGroupTables":
+        """Builds the group tables from a dictionary of Clifford circuits, e.g. from import_native_gate_cliffords.
+
+        Args:
+            clifford_dict (Dict[str, QuantumCircuit]): A dictionary of all Clifford gates labeled by (de)stabilizers.
+        Returns:
+            CliffordGroupTables: The group tables.
+        Raises:
+            ValueError: If the dictionary does not contain the whole Clifford group.
+        """
+        labels = list(clifford_dict.keys())
+        num_qubits = next(iter(clifford_dict.values())).num_qubits
+        dim = 2 * num_qubits
+        num_phases = 2**dim
+
+        parsed = [_parse_clifford_label(label, num_qubits) for label in labels]
+        matrices = np.array([matrix for matrix, _ in parsed])
+        phases = _pack_bits(np.array([phase for _, phase in parsed]))
+        matrix_keys = _pack_bits(matrices.reshape(len(labels), -1))
+        symplectic_keys, symplectic_index = np.unique(matrix_keys, return_inverse=True)
+        symplectic_index = symplectic_index.ravel()
+        if len(labels) != len(symplectic_keys) * num_phases:
+            raise ValueError(f"The Clifford dictionary does not contain the whole {num_qubits}-qubit Clifford group")
+        symplectic_matrices = matrices[np.unique(symplectic_index, return_index=True)[1]]
+
+        element_index = symplectic_index * num_phases + phases
+        order = np.argsort(element_index)
+        if not np.array_equal(element_index[order], np.arange(len(labels))):
+            raise ValueError(f"The Clifford dictionary does not contain the whole {num_qubits}-qubit Clifford group")
+        labels = [labels[i] for i in order]
+
+        # Symplectic part of C1 C2, whose rows are the rows of C2 expressed in the rows of C1
+        products = np.einsum("bij,ajk->abik", symplectic_matrices, symplectic_matrices) % 2
+        symplectic_compose = np.searchsorted(symplectic_keys, _pack_bits(products.reshape(*products.shape[:2], -1)))
+
+        # Signs picked up when C1 maps the Hermitian Paulis in the rows of C2, for Cliffords with trivial phases
+        phase_cocycle = _pack_bits(_cocycle_bits(symplectic_matrices, num_qubits))
+
+        # Signs of the rows of C1 that each row of C2 picks up
+        phase_bits = (np.arange(num_phases)[:, None] >> np.arange(dim)) & 1
+        phase_transform = _pack_bits(np.einsum("sij,pj->spi", symplectic_matrices, phase_bits) % 2)
+
+        identity_symplectic = int(np.searchsorted(symplectic_keys, _pack_bits(np.eye(dim, dtype=np.uint8).ravel())))
+        tables = cls(
+            num_qubits=num_qubits,
+            labels=labels,
+            circuits=[clifford_dict[label] for label in labels],
+            symplectic_compose=symplectic_compose,
+            phase_cocycle=phase_cocycle,
+            phase_transform=phase_transform,
+            inverse=np.zeros(len(labels), dtype=np.int64),
+            identity=identity_symplectic * num_phases,
+        )
+
+        # The inverse of C1 has the symplectic part s2 with s1 s2 = 1 and the phases cancelling those of C1 s2
+        elements = np.arange(len(labels))
+        symplectic_inverse = np.argmax(symplectic_compose == identity_symplectic, axis=1)[elements // num_phases]
+        partial = tables.compose(elements, symplectic_inverse * num_phases)
+        tables.inverse[:] = symplectic_inverse * num_phases + (partial % num_phases)
+        return tables
+
+    def compose(self, first: np.ndarray | int, second: np.ndarray | int) -> np.ndarray:
+        """Composes Cliffords given by their indices as operators, i.e., ``first`` is applied after ``second``.
+
+        Args:
+            first (np.ndarray | int): Index or array of indices of the Cliffords applied last.
+            second (np.ndarray | int): Index or array of indices of the Cliffords applied first.
+        Returns:
+            np.ndarray: The indices of the products.
+        """
+        num_phases = 4**self.num_qubits
+        symplectic_1, phases_1 = np.divmod(first, num_phases)
+        symplectic_2, phases_2 = np.divmod(second, num_phases)
+        phases = (
+            phases_2 ^ self.phase_transform[symplectic_2, phases_1] ^ self.phase_cocycle[symplectic_1, symplectic_2]
+        )
+        return self.symplectic_compose[symplectic_1, symplectic_2] * num_phases + phases
+
+    def index_of(self, circuit: QuantumCircuit) -> int:
+        """Returns the group index of a Clifford circuit.
+
+        Args:
+            circuit (QuantumCircuit): A Clifford circuit on num_qubits qubits.
+        Returns:
+            int: The index of the corresponding group element.
+        """
+        matrix, phases = _parse_clifford_label(str(Clifford(circuit).to_labels(mode="B")), self.num_qubits)
+        symplectic = np.flatnonzero(np.all(self._symplectic_matrices() == matrix, axis=(1, 2)))[0]
+        return int(symplectic * 4**self.num_qubits + _pack_bits(phases))
+
+    def _symplectic_matrices(self) -> np.ndarray:
+        """Returns the symplectic matrices indexed by symplectic part."""
+        num_phases = 4**self.num_qubits
+        return np.array(
+            [
+                _parse_clifford_label(self.labels[s * num_phases], self.num_qubits)[0]
+                for s in range(len(self.symplectic_compose))
+            ]
+        )
+
+    def random_sequences(
+        self,
+        seq_length: int,
+        num_samples: int,
+        rgen: Optional[Generator] = None,
+        interleaved_index: Optional[int] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Draws random Clifford sequences as index arrays, together with the Cliffords inverting them.
+
+        Args:
+            seq_length (int): The number of random Cliffords in each sequence.
+            num_samples (int): The number of sequences.
+            rgen (Optional[Generator]): The random number generator.
+                * Default is None: assigns numpy's default_rng().
+            interleaved_index (Optional[int]): Index of a Clifford interleaved after each random Clifford.
+                * Default is None: no interleaved Clifford.
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The (num_samples, seq_length) array of Clifford indices, and the
+                num_samples indices of the inverting Cliffords.
+        """
+        if rgen is None:
+            rgen = np.random.default_rng()
+        sequences = rgen.integers(0, len(self.labels), size=(num_samples, seq_length))
+        total = np.full(num_samples, self.identity)
+        for step in range(seq_length):
+            total = self.compose(sequences[:, step], total)
+            if interleaved_index is not None:
+                total = self.compose(interleaved_index, total)
+        return sequences, self.inverse[total]
+
+
+_tables_cache: Dict[tuple[str, ...], CliffordGroupTables] = {}
+
+
+def get_clifford_group_tables(clifford_dict: Dict[str, QuantumCircuit]) -> CliffordGroupTables:
+    """Returns the group tables of a Clifford dictionary, building them only once per dictionary content.
+
+    Args:
+        clifford_dict (Dict[str, QuantumCircuit]): A dictionary of all Clifford gates labeled by (de)stabilizers.
+    Returns:
+        CliffordGroupTables: The group tables.
+    """
+    key = tuple(clifford_dict.keys())
+    if key not in _tables_cache:
+        _tables_cache[key] = CliffordGroupTables.from_clifford_dict(clifford_dict)
+    return _tables_cache[key]
+
+
+def materialize_clifford_sequences(
+    sequences: Sequence[Sequence[int]],
+    inverses: Sequence[int],
+    tables: Sequence[CliffordGroupTables],
+    qubits: Sequence[Sequence[int]],
+    num_qubits: int,
+    interleaved_gate: Optional[QuantumCircuit] = None,
+) -> List[QuantumCircuit]:
+    """Builds RB circuits from Clifford index sequences drawn in parallel on disjoint groups of qubits.
+
+    Each layer of Cliffords is followed by a barrier, as is each layer of interleaved gates, and the circuits end with
+    the inverting Cliffords and measurements.
+
+    Args:
+        sequences (Sequence[Sequence[int]]): For each qubit group, the (num_samples, seq_length) Clifford indices.
+        inverses (Sequence[int]): For each qubit group, the num_samples indices of the inverting Cliffords.
+        tables (Sequence[CliffordGroupTables]): For each qubit group, the group tables of the indices.
+        qubits (Sequence[Sequence[int]]): For each qubit group, the circuit qubits it acts on.
+        num_qubits (int): The number of qubits of the circuits.
+        interleaved_gate (Optional[QuantumCircuit]): Clifford native gate interleaved after each layer.
+            * Default is None: no interleaved gate.
+    Returns:
+        List[QuantumCircuit]: The RB circuits.
+    """
+    # Instructions of each Clifford with qubits already mapped onto a template circuit, so that materializing only
+    # appends them; QuantumCircuit._append skips the argument broadcasting and validation of append
+    template = QuantumCircuit(num_qubits)
+
+    def mapped_instructions(circuit: QuantumCircuit, group_qubits: Sequence[int]) -> List[CircuitInstruction]:
+        return [
+            CircuitInstruction(
+                instruction.operation,
+                tuple(template.qubits[group_qubits[circuit.find_bit(q).index]] for q in instruction.qubits),
+            )
+            for instruction in circuit.data
+        ]
+
+    instructions = [
+        [mapped_instructions(circuit, group_qubits) for circuit in table.circuits]
+        for table, group_qubits in zip(tables, qubits)
+    ]
+    interleaved = (
+        [instruction for group_qubits in qubits for instruction in mapped_instructions(interleaved_gate, group_qubits)]
+        if interleaved_gate is not None
+        else None
+    )
+    barrier = CircuitInstruction(Barrier(num_qubits), tuple(template.qubits))
+
+    circuits = []
+    for sample in range(len(inverses[0])):
+        circuit = template.copy_empty_like()
+        for step in range(len(sequences[0][sample])):
+            for group, group_instructions in enumerate(instructions):
+                for instruction in group_instructions[sequences[group][sample][step]]:
+                    circuit._append(instruction)  # pylint: disable=protected-access
+            circuit._append(barrier)  # pylint: disable=protected-access
+            if interleaved is not None:
+                for instruction in interleaved:
+                    circuit._append(instruction)  # pylint: disable=protected-access
+                circuit._append(barrier)  # pylint: disable=protected-access
+        for group, group_instructions in enumerate(instructions):
+            for instruction in group_instructions[inverses[group][sample]]:
+                circuit._append(instruction)  # pylint: disable=protected-access
+        circuit.measure_all()
+        circuits.append(circuit)
+    return circuits
+
+
+def _cocycle_bits(symplectic_matrices: np.ndarray, num_qubits: int) -> np.ndarray:
+    """Computes the sign bits of ``C1 C2`` for all pairs of Cliffords with trivial phases.
+
+    Row i of ``C1 C2`` is C1 applied to the Hermitian Pauli ``i^(x.z) X^x Z^z`` of row i of C2, that is the ordered
+    product of the rows of C1 selected by (x, z), each being a Hermitian Pauli itself.
+
+    Args:
+        symplectic_matrices (np.ndarray): The symplectic matrices of the group, with shape (num, 2n, 2n).
+        num_qubits (int): The number of qubits n.
+    Returns:
+        np.ndarray: The sign bits, with shape (num, num, 2n), indexed by C1, C2 and row.
+    """
+    num = len(symplectic_matrices)
+    dim = 2 * num_qubits
+    # Row selection bits of C2 and the rows of C1, broadcast to (C1, C2, row, factor); powers of i are kept modulo 4,
+    # which uint8 arithmetic wrapping modulo 256 preserves
+    selection = np.broadcast_to(symplectic_matrices[None, :, :, :], (num, num, dim, dim)).astype(np.uint8)
+    factors_x = symplectic_matrices[:, None, None, :, :num_qubits].astype(np.uint8)
+    factors_z = symplectic_matrices[:, None, None, :, num_qubits:].astype(np.uint8)
+
+    # Powers of i: from the Hermitian Pauli of the row of C2, and from each Hermitian factor
+    phase = (selection[..., :num_qubits] * selection[..., num_qubits:]).sum(axis=-1, dtype=np.uint8)
+    phase += (selection * (factors_x * factors_z).sum(axis=-1, dtype=np.uint8)).sum(axis=-1, dtype=np.uint8)
+    acc_x = np.zeros((num, num, dim, num_qubits), dtype=np.uint8)
+    acc_z = np.zeros((num, num, dim, num_qubits), dtype=np.uint8)
+    for k in range(dim):
+        selected = selection[..., k : k + 1]
+        # Moving the Z part of the accumulated product past the X part of the next factor
+        phase += 2 * selected[..., 0] * (acc_z * factors_x[..., k, :]).sum(axis=-1, dtype=np.uint8)
+        acc_x ^= selected * factors_x[..., k, :]
+        acc_z ^= selected * factors_z[..., k, :]
+    # The product is i^phase X^x Z^z, i.e., (-1)^sign times the Hermitian Pauli i^(x.z) X^x Z^z
+    return ((phase - (acc_x * acc_z).sum(axis=-1, dtype=np.uint8)) % 4) // 2
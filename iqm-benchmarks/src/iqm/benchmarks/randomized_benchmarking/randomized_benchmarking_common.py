@@ -34,6 +34,10 @@ from qiskit.quantum_info import Clifford, random_clifford
 import xarray as xr
 
 from iqm.benchmarks.logging_config import qcvv_logger
+from iqm.benchmarks.randomized_benchmarking.clifford_group_tables import (
+    get_clifford_group_tables,
+    materialize_clifford_sequences,
+)
 from iqm.benchmarks.randomized_benchmarking.multi_lmfit import create_multi_dataset_params, multi_dataset_residual
 from iqm.benchmarks.utils import get_iqm_backend, marginal_distribution, submit_execute, timeit
 from iqm.iqm_client.models import CircuitCompilationOptions
@@ -428,58 +432,28 @@ def generate_fixed_depth_parallel_rb_circuits(
     # The total amount of qubits the circuits will have
     n_qubits = sum(qubit_counts)
 
-    # Get the keys of the Clifford dictionaries
-    clifford_1q_keys = list(cliffords_1q.keys())
-    clifford_2q_keys = list(cliffords_2q.keys())
+    # Draw the Clifford sequences of each qubit group as indices of the Clifford group, following Python's random state
+    rgen = np.random.default_rng(random.getrandbits(64))
+    tables = [get_clifford_group_tables(cliffords_1q if n == 1 else cliffords_2q) for n in qubit_counts]
+    sequences = []
+    inverses = []
+    for group_tables in tables:
+        interleaved_index = group_tables.index_of(interleaved_gate) if interleaved_gate is not None else None
+        group_sequences, group_inverses = group_tables.random_sequences(
+            sequence_length, num_samples, rgen, interleaved_index
+        )
+        sequences.append(group_sequences)
+        inverses.append(group_inverses)
 
     # Generate the circuit samples
-    circuits_list: List[QuantumCircuit] = []
+    circuits_list = materialize_clifford_sequences(
+        sequences, inverses, tables, shuffled_qubits_array, n_qubits, interleaved_gate
+    )
     circuits_transpiled_list: List[QuantumCircuit] = []
-    for _ in range(num_samples):
-        circuit = QuantumCircuit(n_qubits)
-        # Need to track inverses on each qubit, or each pair of qubits, separately
-        circ_inverses = [QuantumCircuit(n) for n in qubit_counts]
-        # Place Clifford sequences on each
-        for _ in range(sequence_length):
-            # Sample the random Cliffords for each qubit or qubits
-            cliffords = []
-            for n in qubit_counts:
-                if n == 1:
-                    rand_key = random.choice(clifford_1q_keys)
-                    c_1q = cast(dict, cliffords_1q)[rand_key]
-                    cliffords.append(c_1q)
-                else:
-                    rand_key = random.choice(clifford_2q_keys)
-                    c_2q = cast(dict, cliffords_2q)[rand_key]
-                    cliffords.append(c_2q)
-            # Compose the sampled Cliffords in the circuit and add barrier
-            for n, shuffled_qubits in enumerate(shuffled_qubits_array):
-                circuit.compose(cliffords[n], qubits=shuffled_qubits, inplace=True)
-                circ_inverses[n].compose(cliffords[n], qubits=list(range(qubit_counts[n])), inplace=True)
-            circuit.barrier()  # NB: mind the barriers!
-
-            if interleaved_gate is not None:
-                for n, shuffled_qubits in enumerate(shuffled_qubits_array):
-                    circuit.compose(interleaved_gate, qubits=shuffled_qubits, inplace=True)
-                    circ_inverses[n].compose(interleaved_gate, qubits=list(range(qubit_counts[n])), inplace=True)
-                circuit.barrier()
-
-        # Compile and compose the inverse
-        # compiled_inverse_clifford = []
-        for n, shuffled_qubits in enumerate(shuffled_qubits_array):
-            clifford_dict = cliffords_1q if qubit_counts[n] == 1 else cliffords_2q
-            circuit.compose(
-                compute_inverse_clifford(circ_inverses[n], clifford_dict),
-                qubits=shuffled_qubits,
-                inplace=True,
-            )
-        # Add measurement
-        circuit.measure_all()
-
-        circuits_list.append(circuit)
+    qubits_array_flat = [x for y in qubits_array for x in y]
+    for circuit in circuits_list:
         # Transpilation here only means to the layout - avoid using automated transpilers!
         circuit_transpiled = QuantumCircuit(backend.num_qubits)
-        qubits_array_flat = [x for y in qubits_array for x in y]
         circuit_transpiled.compose(circuit, qubits=qubits_array_flat, inplace=True)
         circuits_transpiled_list.append(circuit_transpiled)
 
@@ -511,7 +485,6 @@ def generate_random_clifford_seq_circuits(
     else:
         backend = backend_arg
 
-    qc_list = []  # List of random Clifford circuits
     qc_list_transpiled = []
     num_qubits = len(qubits)
     logic_qubits = list(range(num_qubits))
@@ -519,36 +492,17 @@ def generate_random_clifford_seq_circuits(
     if num_qubits > 2:
         raise ValueError("Please specify qubit layouts with only n=1 or n=2 qubits. Run MRB for n>2 instead.")
 
-    clifford_keys = []
-    if clifford_dict is not None:
-        clifford_keys = list(clifford_dict.keys())
-
-    for _ in range(num_circ_samples):
-        qc = QuantumCircuit(num_qubits)
-        qc_inv = QuantumCircuit(num_qubits)
-        # Compose circuit with random Clifford gates
-        for _ in range(seq_length):
-            rand_key = random.choice(clifford_keys)
-            clifford = cast(dict, clifford_dict)[rand_key]
-            # Append clifford
-            qc.compose(clifford, qubits=logic_qubits, inplace=True)
-            # Append clifford gate to circuit to invert
-            qc_inv.compose(clifford, qubits=logic_qubits, inplace=True)
-            qc.barrier()
-            # Append interleaved if not None
-            if interleaved_gate is not None:
-                qc.compose(interleaved_gate, qubits=logic_qubits, inplace=True)
-                qc_inv.compose(interleaved_gate, qubits=logic_qubits, inplace=True)
-                qc.barrier()
-        # Append the inverse
-        qc.compose(
-            compute_inverse_clifford(qc_inv, clifford_dict),
-            qubits=logic_qubits,
-            inplace=True,
-        )
-        qc.measure_all()
+    # Draw the Clifford sequences as indices of the Clifford group, following Python's random state
+    tables = get_clifford_group_tables(clifford_dict)
+    interleaved_index = tables.index_of(interleaved_gate) if interleaved_gate is not None else None
+    sequences, inverses = tables.random_sequences(
+        seq_length, num_circ_samples, np.random.default_rng(random.getrandbits(64)), interleaved_index
+    )
 
-        qc_list.append(qc)
+    qc_list = materialize_clifford_sequences(
+        [sequences], [inverses], [tables], [logic_qubits], num_qubits, interleaved_gate
+    )
+    for qc in qc_list:
         qc_transpiled = QuantumCircuit(backend.num_qubits)
         qc_transpiled.compose(qc, qubits=qubits, inplace=True)
         qc_list_transpiled.append(qc_transpiled)
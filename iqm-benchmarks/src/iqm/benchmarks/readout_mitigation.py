@@ -15,7 +15,8 @@
 import logging
 from math import ceil
 import threading
-from typing import Any, Dict, Iterable, List
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 import warnings
 
 import mthree
@@ -24,6 +25,7 @@ from mthree.classes import QuasiCollection
 from mthree.exceptions import M3Error
 from mthree.mitigation import _job_thread
 from mthree.utils import final_measurement_mapping
+import numpy as np
 from qiskit import transpile  # pylint: disable = no-name-in-module
 from qiskit.providers import BackendV1, BackendV2
 
@@ -33,6 +35,14 @@ from iqm.qiskit_iqm import IQMCircuit as QuantumCircuit
 from iqm.qiskit_iqm.iqm_backend import IQMBackendBase
 
 
+# Maximum age in seconds of cached readout calibration matrices before qubits are calibrated again
+READOUT_CALIBRATION_MAX_AGE = 3600.0
+
+# 1q readout calibration matrices keyed by (backend name, calibration set id, calibration shots, physical qubit),
+# together with the time at which they were measured. The cache lives in the memory of the current process only.
+_readout_calibration_cache: Dict[Tuple[str, Any, int, int], Tuple[np.ndarray, float]] = {}
+
+
 # The code here is close to the original M3 code licenced under Apache 2 as well (https://github.com/Qiskit/qiskit-addon-mthree/blob/main/LICENSE.txt).
 # We deactivate this to not break functionality.
 # pylint: disable=too-many-instance-attributes, too-many-arguments, too-many-locals, too-many-branches, too-many-statements,
@@ -240,12 +250,71 @@ def readout_error_m3(counts: Dict[str, float], mit: M3IQM, qubits: Iterable) ->
     return mit.apply_correction(counts, qubits)
 
 
+def clear_readout_calibration_cache() -> None:
+    """Removes all cached readout calibration matrices, forcing new calibration circuits to be run."""
+    _readout_calibration_cache.clear()
+
+
+def get_readout_mitigator(
+    backend: IQMBackendBase,
+    qubits: Sequence[Dict[int, int] | Iterable[int]],
+    mit_shots: int = 1000,
+    max_calibration_age: Optional[float] = READOUT_CALIBRATION_MAX_AGE,
+) -> M3IQM:
+    """Returns an M3IQM mitigator calibrated on all given qubits, reusing cached 1q calibration matrices.
+
+    Calibration circuits are only executed for qubits without a cached calibration matrix for the same backend,
+    calibration set and number of shots, or whose cached matrix is older than max_calibration_age. The cache is kept
+    per process and is not persisted, so every new process calibrates again.
+
+    Args:
+        backend (IQMBackendBase): the backend to calibrate an M3 mitigator against.
+        qubits (Sequence[Dict[int, int] | Iterable[int]]): the measured qubits of each circuit, either as mappings
+            coming from `mthree.utils.final_measurement_mapping` or as sequences of physical qubits.
+        mit_shots (int): number of shots per calibration circuit.
+            * Default is 1000.
+        max_calibration_age (Optional[float]): maximum age in seconds of reused calibration matrices.
+            * Default is READOUT_CALIBRATION_MAX_AGE; None reuses cached matrices regardless of their age.
+    Returns:
+        M3IQM: the calibrated mitigator.
+    """
+    physical_qubits = sorted(
+        {int(q) for mapping in qubits for q in (mapping.values() if isinstance(mapping, dict) else mapping)}
+    )
+    calibration_set_id = backend.architecture.calibration_set_id
+    cache_keys = {q: (backend.name, calibration_set_id, mit_shots, q) for q in physical_qubits}
+    now = time.time()
+    uncalibrated_qubits = []
+    for q in physical_qubits:
+        cached = _readout_calibration_cache.get(cache_keys[q])
+        if cached is None or (max_calibration_age is not None and now - cached[1] > max_calibration_age):
+            uncalibrated_qubits.append(q)
+
+    mit = M3IQM(backend)
+    if uncalibrated_qubits:
+        mit.cals_from_system(uncalibrated_qubits, shots=mit_shots)
+        for q in uncalibrated_qubits:
+            if mit.single_qubit_cals[q] is not None:
+                _readout_calibration_cache[cache_keys[q]] = (mit.single_qubit_cals[q], now)
+    else:
+        qcvv_logger.info(f"REM: reusing cached calibration data of qubits {physical_qubits}")
+
+    matrices = list(mit.single_qubit_cals) if mit.single_qubit_cals is not None else [None] * mit.num_qubits
+    for q in physical_qubits:
+        if cache_keys[q] in _readout_calibration_cache:
+            matrices[q] = _readout_calibration_cache[cache_keys[q]][0]
+    mit.cal_shots = mit_shots
+    mit.cals_from_matrices(matrices)
+    return mit
+
+
 @timeit
 def apply_readout_error_mitigation(
     backend_arg: str | IQMBackendBase,
     transpiled_circuits: List[QuantumCircuit],
     counts: List[Dict[str, int]],
     mit_shots: int = 1000,
+    max_calibration_age: Optional[float] = READOUT_CALIBRATION_MAX_AGE,
 ) -> List[tuple[Any, Any]] | List[tuple[QuasiCollection, list]] | List[QuasiCollection]:
     """
     Args:
@@ -253,6 +322,8 @@ def apply_readout_error_mitigation(
         transpiled_circuits (List[QuantumCircuit]): the list of transpiled quantum circuits.
         counts (List[Dict[str, int]]): the measurement counts corresponding to the circuits.
         mit_shots (int): number of shots per circuit.
+        max_calibration_age (Optional[float]): maximum age in seconds of cached calibration matrices to reuse.
+            * Default is READOUT_CALIBRATION_MAX_AGE; None reuses cached matrices regardless of their age.
     Returns:
         tuple[Any, Any] | tuple[QuasiCollection, list] | QuasiCollection: a list of dictionaries with REM-corrected quasiprobabilities for each outcome.
     """
@@ -263,13 +334,12 @@ def apply_readout_error_mitigation(
     else:
         backend = backend_arg
 
-    # Initialize with the given system and get calibration data
+    # Initialize with the given system and get calibration data, reusing cached calibrations where possible
     qubits_rem = [final_measurement_mapping(c) for c in transpiled_circuits]
 
-    mit = M3IQM(backend)
-    mit.cals_from_system(qubits_rem, shots=mit_shots)
-    # Apply the REM correction to the given measured counts
-    rem_quasidistro = [mit.apply_correction(c, q) for c, q in zip(counts, qubits_rem)]
+    mit = get_readout_mitigator(backend, qubits_rem, mit_shots, max_calibration_age)
+    # Apply the REM correction to all the given measured counts in a single call
+    rem_quasidistro = list(mit.apply_correction(counts, qubits_rem)) if counts else []
     logging.getLogger().setLevel(logging.INFO)
 
     return rem_quasidistro
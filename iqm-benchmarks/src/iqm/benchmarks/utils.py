@@ -15,7 +15,7 @@
 """
 General utility functions
 """
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from functools import wraps
 import itertools
 from math import floor
@@ -31,16 +31,20 @@ import networkx as nx
 import numpy as np
 from numpy.random import Generator
 from qiskit import ClassicalRegister, transpile
+from qiskit.circuit import Barrier, ParameterExpression
+from qiskit.circuit import QuantumCircuit as QiskitQuantumCircuit
+from qiskit.circuit.library import UnitaryGate, get_standard_gate_name_mapping
 from qiskit.converters import circuit_to_dag
 from qiskit.quantum_info import Pauli
 from qiskit.transpiler import CouplingMap
+from qiskit.utils import parallel_map
 import requests
 import xarray as xr
 
 from iqm.benchmarks.logging_config import qcvv_logger
 from iqm.iqm_client.models import CircuitCompilationOptions
 from iqm.qiskit_iqm import IQMCircuit as QuantumCircuit
-from iqm.qiskit_iqm import IQMFakeDeneb, optimize_single_qubit_gates, transpile_to_IQM
+from iqm.qiskit_iqm import IQMFakeDeneb, MoveGate, optimize_single_qubit_gates, transpile_to_IQM
 from iqm.qiskit_iqm.fake_backends.fake_adonis import IQMFakeAdonis
 from iqm.qiskit_iqm.fake_backends.fake_apollo import IQMFakeApollo
 from iqm.qiskit_iqm.iqm_backend import IQMBackendBase
@@ -94,35 +98,53 @@ def bootstrap_counts(
     Returns:
         List[Dict[str, int]]: A list of bootstrapped counts.
     """
-    if rgen is None:
-        rgen = np.random.default_rng()
-
     keys = list(original_counts.keys())
-    values = list(original_counts.values())
-    tot_shots = int(sum(values))
-
-    # Pre-calculate cumulative sum and create bins
-    cumulative_sum = np.cumsum(values)
-    bins = np.insert(cumulative_sum, 0, 0)
+    samples = bootstrap_counts_matrix(np.array([list(original_counts.values())]), num_bootstrap_samples, rgen)
 
     if include_original_counts:
         bs_counts_fast = [original_counts]
     else:
         bs_counts_fast = []
-
-    for _ in range(num_bootstrap_samples):
-        # Generate random integers
-        random_integers = rgen.integers(low=0, high=tot_shots, size=tot_shots)
-        # Bin the random integers
-        binned_integers = np.digitize(random_integers, bins) - 1
-        # Count occurrences in each bin
-        occurrences = np.bincount(binned_integers, minlength=len(keys))
-        # Create dictionary mapping keys to occurrence counts
-        bs_counts_fast.append(dict(zip(keys, occurrences)))
+    bs_counts_fast.extend(dict(zip(keys, occurrences)) for occurrences in samples[:, 0])
 
     return bs_counts_fast
 
 
+def bootstrap_counts_matrix(
+    counts_matrix: np.ndarray,
+    num_bootstrap_samples: int = 100,
+    rgen: Optional[Generator] = None,
+    shots: Optional[int | np.ndarray] = None,
+) -> np.ndarray:
+    """Returns num_bootstrap_samples multinomial resamples of every row of a circuits × outcomes counts matrix.
+
+    All resamples of all circuits are drawn in a single call to the random number generator.
+
+    Args:
+        counts_matrix (np.ndarray): The circuits × outcomes matrix of counts (or probabilities) to bootstrap from.
+        num_bootstrap_samples (int): The number of bootstrapping samples to generate.
+            * Default is 100.
+        rgen (Optional[Generator]): The random number generator. Pass the same generator to successive calls for a
+            reproducible stream of samples.
+            * Default is None: assigns numpy's default_rng().
+        shots (Optional[int | np.ndarray]): The number of shots to draw for each circuit.
+            * Default is None: uses the total counts of each circuit.
+    Returns:
+        np.ndarray: The bootstrapped counts, with shape (num_bootstrap_samples, circuits, outcomes).
+    """
+    if rgen is None:
+        rgen = np.random.default_rng()
+
+    counts_matrix = np.asarray(counts_matrix, dtype=float)
+    totals = counts_matrix.sum(axis=1)
+    if shots is None:
+        shots = np.rint(totals).astype(np.int64)
+    probabilities = np.divide(
+        counts_matrix, totals[:, None], out=np.zeros_like(counts_matrix), where=totals[:, None] > 0
+    )
+    return rgen.multinomial(shots, probabilities, size=(num_bootstrap_samples, len(counts_matrix)))
+
+
 @timeit
 def count_2q_layers(circuit_list: List[QuantumCircuit]) -> List[int]:
     """Calculate the number of layers of parallel 2-qubit gates in a list of circuits.
@@ -200,6 +222,33 @@ def count_native_gates(
     return avg_native_operations
 
 
+def counts_to_matrix(
+    counts: Sequence[Dict[str, float | int]], outcomes: Optional[Sequence[str]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Converts a list of counts dictionaries into a dense circuits × outcomes matrix.
+
+    Each outcome bitstring is encoded as an integer column index into the returned array of outcome labels.
+
+    Args:
+        counts (Sequence[Dict[str, float | int]]): A list of counts or quasi-probability dictionaries, one per
+            circuit.
+        outcomes (Optional[Sequence[str]]): The outcome labels defining the columns of the matrix.
+            * Default is None: uses the sorted union of all outcomes observed in counts.
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The array of outcome labels and the matrix of counts with shape
+            (len(counts), len(outcomes)).
+    """
+    if outcomes is None:
+        outcomes = sorted(set().union(*(c.keys() for c in counts)))
+    outcome_index = {outcome: i for i, outcome in enumerate(outcomes)}
+    circuit_index = np.repeat(np.arange(len(counts)), [len(c) for c in counts])
+    column_index = np.fromiter((outcome_index[k] for c in counts for k in c), dtype=np.intp, count=len(circuit_index))
+    values = np.array([v for c in counts for v in c.values()]) if len(circuit_index) else np.array([], dtype=np.int64)
+    matrix = np.zeros((len(counts), len(outcomes)), dtype=values.dtype)
+    matrix[circuit_index, column_index] = values
+    return np.array(outcomes, dtype=str), matrix
+
+
 @timeit
 def generate_state_tomography_circuits(
     qc: QuantumCircuit,
@@ -392,6 +441,53 @@ def extract_fidelities(cal_url: str, all_metrics: bool = False) -> Union[
 
 
 # pylint: disable=too-many-branches
+def get_batching_size(
+    qc_list: Sequence[QuantumCircuit],
+    max_gates_per_batch: Optional[int] = None,
+    max_circuits_per_batch: Optional[int] = None,
+) -> Tuple[Optional[str], int]:
+    """Determine the number of circuits per batch sent to a backend, given maximum gate and circuit counts per batch.
+
+    Args:
+        qc_list (Sequence[QuantumCircuit]): the quantum circuits to be divided into batches.
+        max_gates_per_batch (Optional[int]): the maximum number of gates per batch.
+            * Default is None.
+        max_circuits_per_batch (Optional[int]): the maximum number of circuits per batch.
+            * Default is None.
+    Returns:
+        Tuple[Optional[str], int]: the name of the restriction determining the batch size (None if there is no
+            restriction, in which case all circuits form a single batch) and the number of circuits per batch.
+    """
+    if max_gates_per_batch is None and max_circuits_per_batch is None:
+        return None, len(qc_list)
+
+    if max_gates_per_batch is None and max_circuits_per_batch is not None:
+        restriction = "max_circuits_per_batch"
+        batching_size = max_circuits_per_batch
+
+    elif max_circuits_per_batch is None and max_gates_per_batch is not None:
+        restriction = "max_gates_per_batch"
+        # Calculate average gate count per quantum circuit
+        avg_gates_per_qc = sum(sum(qc.count_ops().values()) for qc in qc_list) / len(qc_list)
+        batching_size = max(1, floor(max_gates_per_batch / avg_gates_per_qc))
+
+    else:  # Both are not None - select the one rendering the smallest batches.
+        # Calculate average gate count per quantum circuit
+        avg_gates_per_qc = sum(sum(qc.count_ops().values()) for qc in qc_list) / len(qc_list)
+        qcvv_logger.warning(
+            "Both max_gates_per_batch and max_circuits_per_batch are not None. Selecting the one giving the smallest batches."
+        )
+        batching_size = min(
+            cast(int, max_circuits_per_batch), max(1, floor(cast(int, max_gates_per_batch) / avg_gates_per_qc))
+        )
+        if batching_size == max_circuits_per_batch:
+            restriction = "max_circuits_per_batch"
+        else:
+            restriction = "max_gates_per_batch"
+
+    return restriction, batching_size
+
+
 def get_iqm_backend(backend_label: str) -> IQMBackendBase:
     """Get the IQM backend object from a backend name (str).
 
@@ -577,6 +673,53 @@ def marginal_distribution(prob_dist_or_counts: Dict[str, float | int], indices:
     return dict(marginal_dist)
 
 
+def marginalize_counts_matrix(
+    outcomes: np.ndarray, matrix: np.ndarray, indices: Sequence[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the marginal counts of every circuit of a counts matrix at once.
+
+    Unlike marginal_distribution, the characters of the marginalized bitstrings follow the order of indices,
+    which allows marginalizing and reordering bits in a single pass.
+
+    Args:
+        outcomes (np.ndarray): The outcome labels of the matrix columns, all bitstrings of the same length.
+        matrix (np.ndarray): The circuits × outcomes matrix of counts or probabilities.
+        indices (Sequence[int]): The positions of the characters of the outcome labels to keep.
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The sorted marginal outcome labels and the marginalized counts matrix.
+    """
+    if len(outcomes) == 0:
+        return np.array([], dtype=str), np.zeros((matrix.shape[0], 0), dtype=matrix.dtype)
+    label_length = len(outcomes[0])
+    if any(len(o) != label_length for o in outcomes):
+        raise ValueError("All outcome labels must have the same length to be marginalized")
+    chars = np.frombuffer("".join(outcomes).encode("ascii"), dtype="S1").reshape(len(outcomes), label_length)
+    marginal_chars, inverse = np.unique(chars[:, list(indices)], axis=0, return_inverse=True)
+    marginal_matrix = np.zeros((len(marginal_chars), matrix.shape[0]), dtype=matrix.dtype)
+    np.add.at(marginal_matrix, inverse.ravel(), matrix.T)
+    new_outcomes = np.ascontiguousarray(marginal_chars).view(f"S{len(indices)}").ravel().astype(str)
+    return new_outcomes, marginal_matrix.T
+
+
+def matrix_to_counts(outcomes: np.ndarray, matrix: np.ndarray) -> List[Dict[str, float | int]]:
+    """Converts a circuits × outcomes matrix back into a list of counts dictionaries.
+
+    Outcomes with zero counts are omitted, so that each dictionary only contains the observed bitstrings.
+
+    Args:
+        outcomes (np.ndarray): The outcome labels of the matrix columns.
+        matrix (np.ndarray): The circuits × outcomes matrix of counts or probabilities.
+    Returns:
+        List[Dict[str, float | int]]: A list of counts dictionaries, one per row of the matrix.
+    """
+    outcome_list = np.asarray(outcomes, dtype=str)
+    counts = []
+    for row in matrix:
+        observed = np.flatnonzero(row)
+        counts.append(dict(zip(outcome_list[observed].tolist(), row[observed].tolist())))
+    return counts
+
+
 def median_with_uncertainty(observations: Sequence[float]) -> Dict[str, float]:
     """Computes the median of a Sequence of float observations and returns value and propagated uncertainty.
     Reference: https://mathworld.wolfram.com/StatisticalMedian.html
@@ -595,6 +738,126 @@ def median_with_uncertainty(observations: Sequence[float]) -> Dict[str, float]:
     return {"value": float(median), "uncertainty": float(median_uncertainty)}
 
 
+TRANSPILATION_CACHE_SIZE = 4096
+"""Maximum number of transpiled circuits kept by perform_backend_transpilation."""
+_transpilation_cache: OrderedDict[Tuple[Any, ...], QuantumCircuit] = OrderedDict()
+
+
+def clear_transpilation_cache() -> None:
+    """Empties the cache of transpiled circuits kept by perform_backend_transpilation."""
+    _transpilation_cache.clear()
+
+
+_KNOWN_OPERATIONS = {
+    **{name: operation.base_class for name, operation in get_standard_gate_name_mapping().items()},
+    "barrier": Barrier,
+    "move": MoveGate,
+    "unitary": UnitaryGate,
+}
+"""Operations whose action is fully determined by their name and parameters."""
+
+
+def _hashable_param(param: Any) -> Any:
+    """Returns a hashable key for the content of an instruction parameter, which may be an array or a nested circuit.
+
+    Raises:
+        TypeError: if the content of the parameter cannot be turned into a key.
+    """
+    if isinstance(param, np.ndarray):
+        return param.dtype.str, param.shape, param.tobytes()
+    if isinstance(param, np.generic):
+        return param.item()
+    if isinstance(param, (ParameterExpression, int, float, complex, str)) or param is None:
+        return param
+    if isinstance(param, (list, tuple)):
+        return tuple(_hashable_param(p) for p in param)
+    if isinstance(param, QiskitQuantumCircuit):
+        return _circuit_key(param)
+    raise TypeError(f"Cannot derive a key from parameter of type {type(param).__name__}")
+
+
+def _operation_key(operation: Any) -> Tuple[Any, ...]:
+    """Returns a key for an operation; operations not known by name are identified by their definition.
+
+    Raises:
+        TypeError: if the operation is neither known by name nor has a definition to derive a key from.
+    """
+    params = tuple(_hashable_param(param) for param in operation.params)
+    if _KNOWN_OPERATIONS.get(operation.name) is getattr(operation, "base_class", type(operation)):
+        return operation.name, params
+    definition = getattr(operation, "definition", None)
+    if definition is None:
+        raise TypeError(f"Cannot derive a key from operation {operation.name} without definition")
+    return operation.name, params, _circuit_key(definition)
+
+
+def _condition_key(condition: Any, clbit_indices: Dict[Any, int]) -> Any:
+    """Returns a key for the classical condition of an instruction, if any.
+
+    Raises:
+        TypeError: if the condition is not a simple comparison of a register or bit with a value.
+    """
+    if condition is None:
+        return None
+    target, value = condition
+    if isinstance(target, ClassicalRegister):
+        return target.name, target.size, value
+    if target in clbit_indices:
+        return clbit_indices[target], value
+    raise TypeError("Cannot derive a key from the classical condition")
+
+
+def _circuit_key(qc: QiskitQuantumCircuit) -> Tuple[Any, ...]:
+    """Returns a key for the content of a circuit; see circuit_fingerprint.
+
+    Raises:
+        TypeError: if some instruction of the circuit cannot be turned into a key.
+    """
+    qubit_indices = {bit: i for i, bit in enumerate(qc.qubits)}
+    clbit_indices = {bit: i for i, bit in enumerate(qc.clbits)}
+    return (
+        tuple((reg.name, reg.size) for reg in qc.qregs),
+        tuple((reg.name, reg.size) for reg in qc.cregs),
+        _hashable_param(qc.global_phase),
+        tuple(
+            (
+                _operation_key(instruction.operation),
+                tuple(qubit_indices[q] for q in instruction.qubits),
+                tuple(clbit_indices[c] for c in instruction.clbits),
+                _condition_key(getattr(instruction.operation, "condition", None), clbit_indices),
+            )
+            for instruction in qc.data
+        ),
+    )
+
+
+def circuit_fingerprint(qc: QiskitQuantumCircuit) -> Optional[Tuple[Any, ...]]:
+    """Returns a key that is equal for structurally identical circuits, regardless of their name and metadata.
+
+    Operations other than the standard gates are identified by their definition, so that custom gates sharing a name
+    get different keys. Returns None if some instruction has no content to derive a key from, such as an opaque gate.
+    """
+    try:
+        return _circuit_key(qc)
+    except TypeError:
+        return None
+
+
+def _target_fingerprint(backend: IQMBackendBase) -> Tuple[Any, ...]:
+    """Returns a key for the operations and qubits of the target of a backend, including its resonators."""
+    target = backend.target_with_resonators
+    return (
+        backend.name,
+        tuple(backend.physical_qubits),
+        tuple(
+            sorted(
+                (name, tuple(sorted(target.qargs_for_operation_name(name) or ())))
+                for name in target.operation_names
+            )
+        ),
+    )
+
+
 @timeit
 def perform_backend_transpilation(
     qc_list: List[QuantumCircuit],
@@ -606,10 +869,15 @@ def perform_backend_transpilation(
     optimize_sqg: bool = False,
     drop_final_rz: bool = True,
     routing_method: Optional[str] = "sabre",
+    num_processes: Optional[int] = None,
 ) -> List[QuantumCircuit]:
     """
     Transpile a list of circuits to backend specifications.
 
+    Structurally identical circuits are transpiled only once, and transpiled circuits are cached for subsequent calls
+    with the same backend, qubits, coupling map and options; see clear_transpilation_cache. Circuits that are not
+    cached are transpiled in parallel processes where Qiskit allows it.
+
     Args:
         qc_list (List[QuantumCircuit]): The original (untranspiled) list of quantum circuits.
         backend (IQMBackendBase ): The backend to execute the benchmark on.
@@ -620,6 +888,8 @@ def perform_backend_transpilation(
         optimize_sqg (bool): Whether SQG optimization is performed taking into account virtual Z.
         drop_final_rz (bool): Whether the SQG optimizer drops a final RZ gate.
         routing_method (Optional[str]): The routing method employed by Qiskit's transpilation pass.
+        num_processes (Optional[int]): The maximum number of processes used to transpile the circuits.
+            * Default is None: Qiskit's default (the number of CPUs, unless parallelism is disabled).
 
     Returns:
         List[QuantumCircuit]: A list of transpiled quantum circuits.
@@ -627,50 +897,94 @@ def perform_backend_transpilation(
     Raises:
         ValueError: if Star topology and label 0 is in qubit layout.
     """
+    qcvv_logger.info(
+        f"Transpiling for backend {backend.name} with optimization level {qiskit_optim_level}, "
+        f"{routing_method} routing method{' including SQG optimization' if qiskit_optim_level>0 else ''} all circuits"
+    )
+
+    # The coupling map will be reduced if the physical layout is to be fixed
+    reduce_layout = coupling_map != backend.coupling_map
+    edges = coupling_map.get_edges() if isinstance(coupling_map, CouplingMap) else coupling_map
+    options_key = (
+        _target_fingerprint(backend),
+        tuple(qubits),
+        tuple(tuple(edge) for edge in edges),
+        tuple(basis_gates),
+        qiskit_optim_level,
+        optimize_sqg,
+        drop_final_rz,
+        routing_method,
+        reduce_layout,
+    )
+    # Circuits without a fingerprint get a key of their own and are left out of the cache
+    fingerprints = [circuit_fingerprint(qc) for qc in qc_list]
+    keys = [(fp, options_key) if fp is not None else (None, i) for i, fp in enumerate(fingerprints)]
+
+    # Structurally identical circuits missing from the cache are transpiled only once
+    transpiled_by_key: Dict[Tuple[Any, ...], QuantumCircuit] = {}
+    missing: Dict[Tuple[Any, ...], QuantumCircuit] = {}
+    for key, qc in zip(keys, qc_list):
+        if key in transpiled_by_key or key in missing:
+            continue
+        if key in _transpilation_cache:
+            _transpilation_cache.move_to_end(key)
+            transpiled_by_key[key] = _transpilation_cache[key]
+        else:
+            missing[key] = qc
 
-    # Helper function considering whether optimize_sqg is done,
-    # and whether the coupling map is reduced (whether final physical layout must be fixed onto an auxiliary QC)
-    def transpile_and_optimize(qc, aux_qc=None):
+    if missing:
+        untranspiled = list(missing.values())
         if backend.has_resonators():
-            coupling_map_red = (
-                backend.coupling_map.reduce(qubits[: qc.num_qubits]) if aux_qc is not None else coupling_map
-            )
-            transpiled = transpile_to_IQM(
-                qc,
-                backend=backend,
-                optimize_single_qubits=optimize_sqg,
-                remove_final_rzs=drop_final_rz,
-                coupling_map=coupling_map_red,
-                # initial_layout=qubits if aux_qc is None else None,
-            )
+            # transpile_to_IQM handles a single circuit and needs the backend, which may not be picklable
+            transpiled_list = [
+                transpile_to_IQM(
+                    qc,
+                    backend=backend,
+                    optimize_single_qubits=optimize_sqg,
+                    remove_final_rzs=drop_final_rz,
+                    coupling_map=(
+                        backend.coupling_map.reduce(qubits[: qc.num_qubits]) if reduce_layout else coupling_map
+                    ),
+                    # initial_layout=qubits if not reduce_layout else None,
+                )
+                for qc in untranspiled
+            ]
         else:
-            transpiled = transpile(
-                qc,
+            transpiled_list = transpile(
+                untranspiled,
                 basis_gates=basis_gates,
                 coupling_map=coupling_map,
                 optimization_level=qiskit_optim_level,
-                initial_layout=qubits if aux_qc is None else None,
+                initial_layout=None if reduce_layout else qubits,
                 routing_method=routing_method,
+                num_processes=num_processes,
             )
-            if aux_qc is not None:
-                transpiled = aux_qc.compose(transpiled, qubits=qubits, clbits=list(range(qc.num_clbits)))
+            if reduce_layout:
+                # Fix the final physical layout onto an auxiliary circuit on all qubits of the backend
+                transpiled_list = [
+                    QuantumCircuit(backend.num_qubits, qc.num_clbits).compose(
+                        transpiled, qubits=qubits, clbits=list(range(qc.num_clbits))
+                    )
+                    for qc, transpiled in zip(untranspiled, transpiled_list)
+                ]
             if optimize_sqg:
-                transpiled = optimize_single_qubit_gates(transpiled, drop_final_rz=drop_final_rz)
-        return transpiled
-
-    qcvv_logger.info(
-        f"Transpiling for backend {backend.name} with optimization level {qiskit_optim_level}, "
-        f"{routing_method} routing method{' including SQG optimization' if qiskit_optim_level>0 else ''} all circuits"
-    )
-
-    if coupling_map == backend.coupling_map:
-        transpiled_qc_list = [transpile_and_optimize(qc) for qc in qc_list]
-    else:  # The coupling map will be reduced if the physical layout is to be fixed
-        if backend.has_resonators():
-            aux_qc_list = [QuantumCircuit(backend.num_qubits, q.num_clbits) for q in qc_list]
-        else:
-            aux_qc_list = [QuantumCircuit(backend.num_qubits, q.num_clbits) for q in qc_list]
-        transpiled_qc_list = [transpile_and_optimize(qc, aux_qc=aux_qc_list[idx]) for idx, qc in enumerate(qc_list)]
+                transpiled_list = parallel_map(
+                    optimize_single_qubit_gates,
+                    transpiled_list,
+                    task_kwargs={"drop_final_rz": drop_final_rz},
+                    num_processes=num_processes,
+                )
+        transpiled_by_key.update(zip(missing, transpiled_list))
+        _transpilation_cache.update((key, qc) for key, qc in zip(missing, transpiled_list) if key[0] is not None)
+        while len(_transpilation_cache) > TRANSPILATION_CACHE_SIZE:
+            _transpilation_cache.popitem(last=False)
+
+    # Hand out copies, so that callers modifying their circuits do not corrupt the cache
+    transpiled_qc_list = []
+    for key, qc in zip(keys, qc_list):
+        transpiled = transpiled_by_key[key].copy(name=qc.name)
+        transpiled.metadata = qc.metadata
+        transpiled_qc_list.append(transpiled)
 
     return transpiled_qc_list
 
@@ -988,39 +1302,14 @@ def submit_execute(
             f"Submitting batch with {len(sorted_transpiled_qc_list[k])} circuits corresponding to qubits {list(k)}"
         )
         # Divide into batches according to maximum gate count per batch
-        if max_gates_per_batch is None and max_circuits_per_batch is None:
+        restriction, batching_size = get_batching_size(
+            sorted_transpiled_qc_list[k], max_gates_per_batch, max_circuits_per_batch
+        )
+        if restriction is None:
             jobs = backend.run(sorted_transpiled_qc_list[k], shots=shots, calibration_set_id=calset_id)
             final_jobs.append(jobs)
 
         else:
-            if max_gates_per_batch is None and max_circuits_per_batch is not None:
-                restriction = "max_circuits_per_batch"
-                batching_size = max_circuits_per_batch
-
-            elif max_circuits_per_batch is None and max_gates_per_batch is not None:
-                restriction = "max_gates_per_batch"
-                # Calculate average gate count per quantum circuit
-                avg_gates_per_qc = sum(sum(qc.count_ops().values()) for qc in sorted_transpiled_qc_list[k]) / len(
-                    sorted_transpiled_qc_list[k]
-                )
-                batching_size = max(1, floor(max_gates_per_batch / avg_gates_per_qc))
-
-            else:  # Both are not None - select the one rendering the smallest batches.
-                # Calculate average gate count per quantum circuit
-                avg_gates_per_qc = sum(sum(qc.count_ops().values()) for qc in sorted_transpiled_qc_list[k]) / len(
-                    sorted_transpiled_qc_list[k]
-                )
-                qcvv_logger.warning(
-                    "Both max_gates_per_batch and max_circuits_per_batch are not None. Selecting the one giving the smallest batches."
-                )
-                batching_size = min(
-                    cast(int, max_circuits_per_batch), max(1, floor(cast(int, max_gates_per_batch) / avg_gates_per_qc))
-                )
-                if batching_size == max_circuits_per_batch:
-                    restriction = "max_circuits_per_batch"
-                else:
-                    restriction = "max_gates_per_batch"
-
             final_batch_jobs = []
             for index, qc_batch in enumerate(chunked(sorted_transpiled_qc_list[k], batching_size)):
                 qcvv_logger.info(
@@ -1048,7 +1337,74 @@ def xrvariable_to_counts(dataset: xr.Dataset, identifier: str, counts_range: int
     Returns:
         List[Dict[str, int]]: A list of counts dictionaries from the dataset.
     """
-    return [
-        dict(zip(list(dataset[f"{identifier}_state_{u}"].data), dataset[f"{identifier}_counts_{u}"].data))
-        for u in range(counts_range)
-    ]
+    if f"{identifier}_counts" not in dataset.variables:
+        # Datasets stored before the introduction of counts matrices have one variable per circuit
+        return [
+            dict(zip(list(dataset[f"{identifier}_state_{u}"].data), dataset[f"{identifier}_counts_{u}"].data))
+            for u in range(counts_range)
+        ]
+    outcomes, _, circuit_index, outcome_index, values = xrvariable_to_counts_entries(dataset, identifier)
+    outcomes = outcomes[outcome_index].tolist()
+    values = values.tolist()
+    bounds = np.searchsorted(circuit_index, np.arange(counts_range + 1))
+    return [dict(zip(outcomes[start:stop], values[start:stop])) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def xrvariable_to_counts_entries(
+    dataset: xr.Dataset, identifier: str
+) -> Tuple[np.ndarray, int, np.ndarray, np.ndarray, np.ndarray]:
+    """Retrieve the stored counts of all circuits of an identifier from xarray dataset.
+
+    Counts may be stored either densely, as a circuits × outcomes variable, or sparsely, as a list of
+    (circuit index, outcome index, count) entries; see add_counts_to_dataset. Entries of bitstrings reported with
+    zero counts are retrieved as well, while dense matrices never hold such bitstrings.
+
+    Args:
+        dataset (xr.Dataset): the dataset to extract counts from.
+        identifier (str): the identifier for the dataset counts.
+    Returns:
+        Tuple[np.ndarray, int, np.ndarray, np.ndarray, np.ndarray]: The array of outcome labels, the number of
+            circuits, and the circuit indices, outcome indices and values of the stored counts sorted by circuit.
+    """
+    if f"{identifier}_counts" not in dataset.variables:
+        # Datasets stored before the introduction of counts matrices have one variable per circuit
+        num_circuits = 0
+        while f"{identifier}_counts_{num_circuits}" in dataset.variables:
+            num_circuits += 1
+        counts = xrvariable_to_counts(dataset, identifier, num_circuits)
+        outcomes = np.array(sorted({k for c in counts for k in c}), dtype=str)
+        return (
+            outcomes,
+            num_circuits,
+            np.repeat(np.arange(num_circuits), [len(c) for c in counts]),
+            np.searchsorted(outcomes, [k for c in counts for k in c]).astype(np.intp),
+            np.array([v for c in counts for v in c.values()]),
+        )
+    if f"{identifier}_outcome_index" in dataset.variables:
+        return (
+            dataset[f"{identifier}_outcome"].values.astype(str),
+            int(dataset[f"{identifier}_counts"].attrs["num_circuits"]),
+            dataset[f"{identifier}_circuit_index"].values,
+            dataset[f"{identifier}_outcome_index"].values,
+            dataset[f"{identifier}_counts"].values,
+        )
+    outcomes, matrix = dataset[f"{identifier}_outcome"].values.astype(str), dataset[f"{identifier}_counts"].values
+    circuit_index, outcome_index = np.nonzero(matrix)
+    return outcomes, len(matrix), circuit_index, outcome_index, matrix[circuit_index, outcome_index]
+
+
+def xrvariable_to_counts_matrix(dataset: xr.Dataset, identifier: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Retrieve the counts of all circuits of an identifier from xarray dataset as a dense matrix.
+
+    Args:
+        dataset (xr.Dataset): the dataset to extract counts from.
+        identifier (str): the identifier for the dataset counts.
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The array of outcome labels and the circuits × outcomes matrix of counts.
+    """
+    if f"{identifier}_counts" in dataset.variables and f"{identifier}_outcome_index" not in dataset.variables:
+        return dataset[f"{identifier}_outcome"].values.astype(str), dataset[f"{identifier}_counts"].values
+    outcomes, num_circuits, circuit_index, outcome_index, values = xrvariable_to_counts_entries(dataset, identifier)
+    matrix = np.zeros((num_circuits, len(outcomes)), dtype=values.dtype)
+    matrix[circuit_index, outcome_index] = values
+    return outcomes, matrix
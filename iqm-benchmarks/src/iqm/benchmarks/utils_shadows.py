@@ -17,7 +17,7 @@ Shadow Tomography utility functions
 """
 
 import random
-from typing import Dict, List, Literal, Optional, Sequence, Tuple, cast
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, cast
 
 import numpy as np
 from numpy.random import RandomState
@@ -25,7 +25,7 @@ from qiskit import ClassicalRegister, QuantumCircuit, quantum_info
 from qiskit.circuit.library import UnitaryGate
 import scipy.linalg as spl
 
-from iqm.benchmarks.utils import timeit
+from iqm.benchmarks.utils import circuit_fingerprint, timeit
 
 
 def CUE(random_gen: RandomState, n: int) -> np.ndarray:
@@ -137,6 +137,111 @@ def local_shadow_tomography(
     return unitaries, qclist
 
 
+# Single-qubit snapshot tensors of Clifford dictionaries, keyed by the Clifford labels and circuits
+_clifford_snapshots_cache: Dict[Tuple[Tuple[str, Any], ...], Dict[str, np.ndarray]] = {}
+
+
+def unitary_snapshots(unitaries: np.ndarray) -> np.ndarray:
+    """Computes the single-qubit snapshot operators 3 U^dagger |s><s| U - I of local random unitaries.
+
+    Args:
+        unitaries (np.ndarray): local random unitaries stacked along the first axis, with shape (n, 2, 2).
+    Returns:
+        np.ndarray: snapshot operators with shape (n, 2, 2, 2), where the second axis is the measured bit s.
+    """
+    unitaries = np.asarray(unitaries, dtype=complex)
+    return 3 * np.einsum("ksa,ksb->ksab", unitaries.conj(), unitaries) - np.eye(2)
+
+
+def get_clifford_snapshots(cliffords_1q: Dict[str, QuantumCircuit]) -> Dict[str, np.ndarray]:
+    """Returns the single-qubit snapshot operators of every Clifford in a dictionary of 1-qubit Cliffords.
+
+    The snapshots are computed once per dictionary of Clifford labels and circuits, and cached.
+
+    Args:
+        cliffords_1q (Dict[str, QuantumCircuit]): dictionary of 1-qubit Cliffords in terms of IQM-native r and CZ gates.
+    Returns:
+        Dict[str, np.ndarray]: snapshot operators with shape (2, 2, 2) for each Clifford label.
+    """
+    key = tuple((label, circuit_fingerprint(clifford)) for label, clifford in cliffords_1q.items())
+    if key in _clifford_snapshots_cache:
+        return _clifford_snapshots_cache[key]
+    unitaries = np.array([quantum_info.Operator(clifford).to_matrix() for clifford in cliffords_1q.values()])
+    snapshots = dict(zip(cliffords_1q.keys(), unitary_snapshots(unitaries)))
+    # Circuits without a fingerprint cannot be told apart by their key
+    if all(fingerprint is not None for _, fingerprint in key):
+        _clifford_snapshots_cache[key] = snapshots
+    return snapshots
+
+
+def counts_to_bit_array(counts: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Converts a dictionary of bit-string counts into an integer array of bits.
+
+    Args:
+        counts (Dict[str, int]): a dictionary of bit-string counts, all bit-strings having the same length.
+            Spaces separating classical registers are ignored.
+    Returns:
+        Tuple[np.ndarray, np.ndarray]:
+        - np.ndarray: bits with shape (number of bit-strings, number of bits); column j contains bit index j,
+            i.e., bit-strings are read from right to left.
+        - np.ndarray: the counts of each bit-string.
+    """
+    bit_strings = [bit_string.replace(" ", "") for bit_string in counts.keys()]
+    weights = np.fromiter(counts.values(), dtype=float, count=len(bit_strings))
+    if not bit_strings:
+        return np.zeros((0, 0), dtype=np.int64), weights
+    characters = np.frombuffer("".join(bit_strings).encode(), dtype=np.uint8).reshape(len(bit_strings), -1)
+    return (characters[:, ::-1] - ord("0")).astype(np.int64), weights
+
+
+def local_shadows(
+    bits: np.ndarray,
+    weights: np.ndarray,
+    snapshots: np.ndarray,
+    groups: Optional[np.ndarray] = None,
+    num_groups: int = 1,
+) -> np.ndarray:
+    """Constructs the shadows of a subsystem from an array of measured bits, optionally for several groups of bit-strings.
+
+    The weights of all bit-strings are first accumulated per subsystem outcome; the shadow of each group is then the
+    weighted sum of the tensor products of single-qubit snapshots, built once for all 2**n subsystem outcomes.
+
+    Args:
+        bits (np.ndarray): measured bits of the subsystem with shape (number of bit-strings, n).
+        weights (np.ndarray): the counts of each bit-string.
+        snapshots (np.ndarray): single-qubit snapshot operators of the subsystem qubits with shape (n, 2, 2, 2).
+        groups (Optional[np.ndarray]): group index of each bit-string, e.g., the projection of neighboring qubits.
+            * Default is None: all bit-strings belong to a single group.
+        num_groups (int): the number of groups.
+            * Default is 1.
+    Returns:
+        np.ndarray: shadows with shape (num_groups, 2**n, 2**n), each normalized by the total counts of its group.
+            Groups without counts have a vanishing shadow.
+    """
+    nqubits = len(snapshots)
+    num_outcomes = 2**nqubits
+    outcomes = bits @ (1 << np.arange(nqubits - 1, -1, -1))
+    if groups is None:
+        groups = np.zeros(len(bits), dtype=np.int64)
+    outcome_weights = (
+        np.bincount(np.asarray(groups) * num_outcomes + outcomes, weights=weights, minlength=num_groups * num_outcomes)
+        .astype(float)
+        .reshape(num_groups, num_outcomes)
+    )
+    shots = outcome_weights.sum(axis=1, keepdims=True)
+    outcome_weights = np.divide(outcome_weights, shots, out=np.zeros_like(outcome_weights), where=shots > 0)
+
+    # Tensor products of the snapshots of all subsystem outcomes, most significant qubit first
+    outcome_bits = (np.arange(num_outcomes)[:, None] >> np.arange(nqubits - 1, -1, -1)) & 1
+    products = np.ones((num_outcomes, 1, 1), dtype=complex)
+    for qubit_idx in range(nqubits):
+        factors = snapshots[qubit_idx, outcome_bits[:, qubit_idx]]
+        dim = products.shape[1] * 2
+        products = np.einsum("oab,ocd->oacbd", products, factors).reshape(num_outcomes, dim, dim)
+
+    return np.tensordot(outcome_weights, products, axes=1)
+
+
 def get_local_shadow(
     counts: Dict[str, int],
     unitary_arg: np.ndarray | Sequence[str],
@@ -171,37 +276,102 @@ def get_local_shadow(
             "If clifford_or_haar is 'clifford', the unitary operator must be specified as a Sequence of strings."
         )
 
-    nqubits = len(subsystem_bit_indices)
-    rhoshadows = np.zeros([2**nqubits, 2**nqubits], dtype=complex)
-    proj = np.zeros((2, 2, 2), dtype=complex)
-    proj[0, :, :] = np.array([[1, 0], [0, 0]])
-    proj[1, :, :] = np.array([[0, 0], [0, 1]])
-    shots = sum(list(counts.values()))
-
-    unitary_op: np.ndarray
+    snapshots: np.ndarray
     if clifford_or_haar == "haar":
-        unitary_op = cast(np.ndarray, unitary_arg)
+        snapshots = unitary_snapshots(cast(np.ndarray, unitary_arg))
     else:
-        unitary_op = np.zeros((nqubits, 2, 2), dtype=complex)
-        for qubit_idx, clif_label in enumerate(unitary_arg):
-            unitary_op[qubit_idx, :, :] = quantum_info.Operator(cast(dict, cliffords_1q)[clif_label]).to_matrix()
-
-    for bit_strings in counts.keys():
-        rho_j: int | np.ndarray = 1
-        for j in subsystem_bit_indices:
-            s_j = int(bit_strings[::-1][j])
-            rho_j = np.kron(
-                rho_j,
-                3
-                * np.einsum(
-                    "ab,bc,cd", np.transpose(np.conjugate(unitary_op[j, :, :])), proj[s_j, :, :], unitary_op[j, :, :]
-                )
-                - np.array([[1, 0], [0, 1]]),
-            )
-
-        rhoshadows += rho_j * counts[bit_strings] / shots
-
-    return rhoshadows
+        clifford_snapshots = get_clifford_snapshots(cast(dict, cliffords_1q))
+        snapshots = np.array([clifford_snapshots[clif_label] for clif_label in unitary_arg])
+
+    nqubits = len(subsystem_bit_indices)
+    if not counts:
+        return np.zeros([2**nqubits, 2**nqubits], dtype=complex)
+    bits, weights = counts_to_bit_array(counts)
+    return local_shadows(bits[:, subsystem_bit_indices], weights, snapshots[list(subsystem_bit_indices)])[0]
+
+
+class LocalShadowAccumulator:
+    """Streaming average of the local shadows of a subsystem over many random unitaries.
+
+    Only the running sum of shadows is stored, so that arbitrarily many randomized measurements can be added.
+
+    Args:
+        subsystem_bit_indices (Sequence[int]): Bit indices in the counts of the subsystem to construct the shadow of.
+        clifford_or_haar (Literal["clifford", "haar"]): Whether to use Clifford or Haar random 1Q gates.
+            * Default is "clifford".
+        cliffords_1q (Optional[Dict[str, QuantumCircuit]]): dictionary of 1-qubit Cliffords in terms of IQM-native r and CZ gates
+            * Default is None.
+        num_groups (int): the number of groups of bit-strings, e.g., projections of neighboring qubits, to average separately.
+            * Default is 1.
+    """
+
+    def __init__(
+        self,
+        subsystem_bit_indices: Sequence[int],
+        clifford_or_haar: Literal["clifford", "haar"] = "clifford",
+        cliffords_1q: Optional[Dict[str, QuantumCircuit]] = None,
+        num_groups: int = 1,
+    ):
+        if clifford_or_haar not in ["clifford", "haar"]:
+            raise ValueError("clifford_or_haar must be either 'clifford' or 'haar'.")
+        if clifford_or_haar == "clifford" and cliffords_1q is None:
+            raise ValueError("cliffords_1q dictionary must be provided if clifford_or_haar is 'clifford'.")
+        self.subsystem_bit_indices = list(subsystem_bit_indices)
+        self.clifford_or_haar = clifford_or_haar
+        self.clifford_snapshots = get_clifford_snapshots(cliffords_1q) if cliffords_1q is not None else {}
+        self.num_groups = num_groups
+        dim = 2 ** len(self.subsystem_bit_indices)
+        self.shadow_sum = np.zeros((num_groups, dim, dim), dtype=complex)
+        self.num_unitaries = 0
+
+    def add(
+        self,
+        bits: np.ndarray,
+        weights: np.ndarray,
+        unitary_arg: np.ndarray | Sequence[str],
+        groups: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Adds the shadows of one randomized measurement to the running sum.
+
+        Args:
+            bits (np.ndarray): measured bits with shape (number of bit-strings, number of bits), see counts_to_bit_array.
+            weights (np.ndarray): the counts of each bit-string.
+            unitary_arg (np.ndarray | Sequence[str]): local random unitaries of the randomized measurement, either as a
+                numpy array or as a Sequence of Clifford labels, indexed by bit index.
+            groups (Optional[np.ndarray]): group index of each bit-string.
+                * Default is None: all bit-strings belong to the first group.
+        Returns:
+            np.ndarray: the shadows of the randomized measurement with shape (num_groups, 2**n, 2**n).
+        """
+        if self.clifford_or_haar == "haar":
+            snapshots = unitary_snapshots(cast(np.ndarray, unitary_arg)[self.subsystem_bit_indices])
+        else:
+            snapshots = np.array([self.clifford_snapshots[unitary_arg[j]] for j in self.subsystem_bit_indices])
+        shadows = local_shadows(bits[:, self.subsystem_bit_indices], weights, snapshots, groups, self.num_groups)
+        self.shadow_sum += shadows
+        self.num_unitaries += 1
+        return shadows
+
+    def add_counts(self, counts: Dict[str, int], unitary_arg: np.ndarray | Sequence[str]) -> np.ndarray:
+        """Adds the shadow of one randomized measurement given as a dictionary of bit-string counts.
+
+        Args:
+            counts (Dict[str, int]): a dictionary of bit-string counts.
+            unitary_arg (np.ndarray | Sequence[str]): local random unitaries of the randomized measurement.
+        Returns:
+            np.ndarray: the shadow of the randomized measurement.
+        """
+        bits, weights = counts_to_bit_array(counts)
+        if not counts:
+            bits = np.zeros((0, max(self.subsystem_bit_indices, default=-1) + 1), dtype=np.int64)
+        return self.add(bits, weights, unitary_arg)[0]
+
+    @property
+    def mean(self) -> np.ndarray:
+        """The average shadow of each group over all added randomized measurements, with shape (num_groups, 2**n, 2**n)."""
+        if self.num_unitaries == 0:
+            return self.shadow_sum
+        return self.shadow_sum / self.num_unitaries
 
 
 def get_negativity(rho: np.ndarray, NA: int, NB: int) -> float:
@@ -15,7 +15,7 @@ from tqdm.contrib.logging import logging_redirect_tqdm
 
 from iqm.benchmarks.logging_config import qcvv_logger
 from mGST.additional_fns import batch, random_gs, transp
-from mGST.low_level_jit import ddA_derivs, ddB_derivs, ddM, dK, dK_dMdM, objf
+from mGST.low_level_jit import SequenceTries, ddA_derivs, ddB_derivs, ddM, dK_dMdM, dK_trie, objf_trie, sequence_tries
 from mGST.optimization import (
     lineobjf_A_geodesic,
     lineobjf_B_geodesic,
@@ -25,6 +25,7 @@ from mGST.optimization import (
     update_B_geodesic,
     update_K_geodesic,
 )
+from mGST.parallel import SharedArrays, available_workers, shared_pool, worker_state
 from mGST.reporting.figure_gen import plot_objf
 
 
@@ -290,7 +291,8 @@ def gd(K, E, rho, y, J, d, r, rK, fixed_gates, ls="COBYLA", mle=False):
     Delta = np.zeros((d, n, pdim)).astype(np.complex128)
     X = np.einsum("ijkl,ijnm -> iknlm", K, K.conj()).reshape((d, r, r))
 
-    dK_ = dK(X, K, E, rho, J, y, d, r, rK, mle=mle)
+    # Batches are redrawn in every iteration, building their tries is cheaper than contracting each sequence per gate
+    dK_ = dK_trie(X, K, E, rho, sequence_tries(J), y, d, r, rK, mle=mle)
     for k in np.where(~fixed_gates)[0]:
         # derivative
         Fy = dK_[k].reshape(n, pdim)
@@ -611,6 +613,205 @@ def optimize(y, J, d, r, rK, n_povm, method, K, rho, A, B, fixed_elements, mle=F
     return K_new, X_new, E_new, rho_new, A_new, B_new
 
 
+def batch_optimization(
+    K,
+    X,
+    E,
+    rho,
+    y,
+    J,
+    d,
+    r,
+    rK,
+    n_povm,
+    bsize,
+    method,
+    max_iter,
+    delta,
+    fixed_elements,
+    tries,
+    verbose_level=0,
+    stop_event=None,
+):  # pylint: disable=too-many-arguments
+    """Batch optimization phase of mGST starting from a single initialization
+
+    Parameters
+    ----------
+    K, X, E, rho : numpy arrays
+        Initial Kraus operators, superoperators, POVM and initial state
+    y, J, d, r, rK, n_povm, bsize, method, fixed_elements :
+        See run_mGST
+    max_iter : int
+        Maximum number of iterations on batches
+    delta : float
+        Value of the objective function over the full data set below which the optimization is successful
+    tries : SequenceTries
+        Prefix and suffix tries of J used to evaluate the objective function over the full data set
+    stop_event : multiprocessing.Event
+        If given, the optimization terminates early once the event is set by another process
+
+    Returns
+    -------
+    K, X, E, rho, A, B : numpy arrays
+        Updated gate set estimate and Cholesky factors of POVM and initial state
+    res_list : list
+        Objective function values over the full data set after each iteration
+    success : bool
+        Whether the objective function fell below delta
+    """
+    pdim = int(np.sqrt(r))
+    A = np.array([la.cholesky(E[k].reshape(pdim, pdim) + 1e-14 * np.eye(pdim)).T.conj() for k in range(n_povm)])
+    B = la.cholesky(rho.reshape(pdim, pdim))
+    res_list = [objf_trie(X, E, rho, tries, y)]
+    success = False
+    with logging_redirect_tqdm(loggers=[qcvv_logger] if verbose_level > 0 else None):
+        for _ in trange(max_iter, disable=verbose_level == 0):
+            if stop_event is not None and stop_event.is_set():
+                break
+            yb, Jb = batch(y, J, bsize)
+            K, X, E, rho, A, B = optimize(yb, Jb, d, r, rK, n_povm, method, K, rho, A, B, fixed_elements)
+            res_list.append(objf_trie(X, E, rho, tries, y))
+            if res_list[-1] < delta:
+                success = True
+                break
+    return K, X, E, rho, A, B, res_list, success
+
+
+def _multi_start_task(seed):
+    """Runs the batch optimization from one random initialization inside a worker of multi_start"""
+    arrays, context, stop_event = worker_state()
+    if stop_event.is_set():
+        return None
+    np.random.seed(seed)
+    d, r, rK, n_povm = context["d"], context["r"], context["rK"], context["n_povm"]
+    tries = SequenceTries(*(arrays[field] for field in SequenceTries._fields))
+    K, X, E, rho = random_gs(d, r, rK, n_povm)
+    result = batch_optimization(
+        K,
+        X,
+        E,
+        rho,
+        arrays["y"],
+        arrays["J"],
+        d,
+        r,
+        rK,
+        n_povm,
+        context["bsize"],
+        context["method"],
+        context["max_iter"],
+        context["delta"],
+        context["fixed_elements"],
+        tries,
+        stop_event=stop_event,
+    )
+    if result[-1]:
+        stop_event.set()
+    return result
+
+
+def multi_start(
+    y,
+    J,
+    d,
+    r,
+    rK,
+    n_povm,
+    bsize,
+    method,
+    max_inits,
+    max_iter,
+    delta,
+    fixed_elements,
+    tries,
+    verbose_level=0,
+    num_workers=1,
+):  # pylint: disable=too-many-arguments
+    """Runs the batch optimization from max_inits random initializations in parallel worker processes
+
+    The data y, J and the sequence tries are placed once in shared memory, such that each initialization is a
+    lightweight task. Once one initialization converges below delta, all other runs terminate early.
+
+    Parameters
+    ----------
+    y, J, d, r, rK, n_povm, bsize, method, max_inits, max_iter, fixed_elements, verbose_level :
+        See run_mGST
+    delta : float
+        Value of the objective function over the full data set below which the optimization is successful
+    tries : SequenceTries
+        Prefix and suffix tries of J
+    num_workers : int
+        Number of worker processes
+
+    Returns
+    -------
+    K, X, E, rho, A, B : numpy arrays
+        Gate set estimate of the first successful initialization,
+        or of the initialization with the lowest objective function value if none was successful
+    res_list : list
+        Objective function values over the full data set after each iteration of the returned run
+    success : bool
+        Whether the objective function fell below delta
+    """
+    # Seeds are drawn from the global random state so that results are reproducible with np.random.seed
+    seeds = np.random.randint(0, 2**31 - 1, size=max_inits)
+    context = {
+        "d": d,
+        "r": r,
+        "rK": rK,
+        "n_povm": n_povm,
+        "bsize": bsize,
+        "method": method,
+        "max_iter": max_iter,
+        "delta": delta,
+        "fixed_elements": fixed_elements,
+    }
+    num_workers = min(num_workers, max_inits)
+    if verbose_level > 0:
+        qcvv_logger.info(f"Running {max_inits} initializations on {num_workers} worker processes...")
+    results = []
+    with SharedArrays({"y": y, "J": J, **tries._asdict()}) as shared:
+        pool, _ = shared_pool(shared, num_workers, context)
+        with pool:
+            for result in pool.imap_unordered(_multi_start_task, seeds):
+                if result is None:
+                    continue
+                results.append(result)
+                if result[-1]:
+                    break
+                if verbose_level > 0:
+                    qcvv_logger.info(f"Run {len(results)}/{max_inits} failed, trying new initialization...")
+            pool.close()
+            pool.join()
+    if results[-1][-1]:
+        return results[-1]
+    return min(results, key=lambda result: result[6][-1])
+
+
+def sequential_starts(
+    y, J, d, r, rK, n_povm, bsize, method, max_inits, max_iter, delta, fixed_elements, tries, verbose_level=0
+):  # pylint: disable=too-many-arguments
+    """Runs the batch optimization from up to max_inits random initializations one after another
+
+    Parameters and return values are the same as for multi_start; if no initialization is successful,
+    the estimate of the initialization with the lowest objective function value is returned.
+    """
+    results = []
+    for i in range(max_inits):
+        K, X, E, rho = random_gs(d, r, rK, n_povm)
+        result = batch_optimization(
+            K, X, E, rho, y, J, d, r, rK, n_povm, bsize, method, max_iter, delta, fixed_elements, tries, verbose_level
+        )
+        results.append(result)
+        if verbose_level == 2:
+            plot_objf(result[6], f"Objective function for batch optimization", delta=delta)
+        if result[-1]:
+            return result
+        if verbose_level > 0:
+            qcvv_logger.info(f"Run {i+1}/{max_inits} failed, trying new initialization...")
+    return min(results, key=lambda result: result[6][-1])
+
+
 def run_mGST(
     *args,
     method="SFN",
@@ -622,6 +823,7 @@ def run_mGST(
     fixed_elements=None,
     init=None,
     verbose_level=0,
+    num_workers=1,
 ):  # pylint: disable=too-many-branches, too-many-statements
     """Main mGST routine
 
@@ -657,6 +859,10 @@ def run_mGST(
     init : [ , , ]
         List of 3 numpy arrays in the format [X,E,rho], that can be used as an initialization;
         If no initialization is given a random initialization is used
+    num_workers : int
+        Number of worker processes over which random initializations are distributed; Default: 1.
+        Runs are stopped as soon as one initialization converges. Inside daemonic processes
+        initializations are always tried sequentially.
 
     Returns
     -------
@@ -688,6 +894,9 @@ def run_mGST(
             stacklevel=2,
         )
 
+    # The objective over the full data set is evaluated in every iteration, sharing partial products between sequences
+    tries = sequence_tries(J)
+
     success = False
     if verbose_level > 0:
         qcvv_logger.info(f"Starting mGST optimization...")
@@ -699,28 +908,16 @@ def run_mGST(
         A = np.array([la.cholesky(E[k].reshape(pdim, pdim) + 1e-14 * np.eye(pdim)).T.conj() for k in range(n_povm)])
         B = la.cholesky(rho.reshape(pdim, pdim))
         X = np.einsum("ijkl,ijnm -> iknlm", K, K.conj()).reshape((d, r, r))
-        res_list = [objf(X, E, rho, J, y)]
+        res_list = [objf_trie(X, E, rho, tries, y)]
     else:
-        for i in range(max_inits):
-            K, X, E, rho = random_gs(d, r, rK, n_povm)
-            A = np.array([la.cholesky(E[k].reshape(pdim, pdim) + 1e-14 * np.eye(pdim)).T.conj() for k in range(n_povm)])
-            B = la.cholesky(rho.reshape(pdim, pdim))
-            res_list = [objf(X, E, rho, J, y)]
-            with logging_redirect_tqdm(loggers=[qcvv_logger] if verbose_level > 0 else None):
-                for _ in trange(max_iter, disable=verbose_level == 0):
-                    yb, Jb = batch(y, J, bsize)
-                    K, X, E, rho, A, B = optimize(yb, Jb, d, r, rK, n_povm, method, K, rho, A, B, fixed_elements)
-                    res_list.append(objf(X, E, rho, J, y))
-                    if res_list[-1] < delta:
-                        qcvv_logger.info(f"Batch optimization successful, improving estimate over full data....")
-                        success = True
-                        break
-            if verbose_level == 2:
-                plot_objf(res_list, f"Objective function for batch optimization", delta=delta)
-            if success:
-                break
-            if verbose_level > 0:
-                qcvv_logger.info(f"Run {i+1}/{max_inits} failed, trying new initialization...")
+        num_workers = available_workers(num_workers)
+        start_args = (y, J, d, r, rK, n_povm, bsize, method, max_inits, max_iter, delta, fixed_elements, tries)
+        if num_workers > 1 and max_inits > 1:
+            K, X, E, rho, A, B, res_list, success = multi_start(*start_args, verbose_level, num_workers=num_workers)
+        else:
+            K, X, E, rho, A, B, res_list, success = sequential_starts(*start_args, verbose_level)
+        if success:
+            qcvv_logger.info(f"Batch optimization successful, improving estimate over full data....")
 
     if not success and init is None and verbose_level > 0:
         qcvv_logger.info(f"Success threshold not reached, attempting optimization over full data set...")
@@ -728,8 +925,8 @@ def run_mGST(
         res_list_mle = []
         for _ in trange(final_iter, disable=verbose_level == 0):
             K, X, E, rho, A, B = optimize(y, J, d, r, rK, n_povm, method, K, rho, A, B, fixed_elements, mle=True)
-            res_list.append(objf(X, E, rho, J, y))
-            res_list_mle.append(objf(X, E, rho, J, y, mle=True))
+            res_list.append(objf_trie(X, E, rho, tries, y))
+            res_list_mle.append(objf_trie(X, E, rho, tries, y, mle=True))
             if (
                 len(res_list_mle) >= 2
                 and np.abs(res_list_mle[-2] - res_list_mle[-1]) < res_list_mle[-1] * target_rel_prec
@@ -3,6 +3,7 @@ All functions compiled with numba, such as tensor contractions, derivatives...
 """
 
 import os
+from typing import NamedTuple
 
 from numba import njit, prange
 import numpy as np
@@ -104,7 +105,7 @@ def contract(X, j_vec):
     return res
 
 
-@njit(cache=True, fastmath=True)  # , parallel=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def objf(X, E, rho, J, y, mle=False):
     """Calculate the objective function value for matrices, POVM elements, and target values.
 
@@ -140,14 +141,22 @@ def objf(X, E, rho, J, y, mle=False):
         state = rho
         for ind in j[::-1]:
             state = X[ind] @ state
-        for o in range(n_povm):
-            if mle:
-                objf_ -= np.log(abs(E[o].conj() @ state)) * y[o, i]
-            else:
-                objf_ += abs(E[o].conj() @ state - y[o, i]) ** 2 / m / n_povm
+        objf_ += _objf_term(E, state, y[:, i], m, n_povm, mle)
     return objf_
 
 
+@njit(cache=True, fastmath=True)
+def _objf_term(E, state, y_i, m, n_povm, mle):
+    """Contribution of a single sequence with final state ``state`` and target values ``y_i`` to the objective."""
+    term: float = 0
+    for o in range(n_povm):
+        if mle:
+            term -= np.log(abs(E[o].conj() @ state)) * y_i[o]
+        else:
+            term += abs(E[o].conj() @ state - y_i[o]) ** 2 / m / n_povm
+    return term
+
+
 @njit(cache=True)
 def MVE_lower(X_true, E_true, rho_true, X, E, rho, J, n_povm):
     """Compute the lower bound of the mean value error (MVE) between true and estimated parameters.
@@ -247,7 +256,7 @@ def Mp_norm_lower(X_true, E_true, rho_true, X, E, rho, J, n_povm, p):
     return dist ** (1 / p) / m / n_povm, max_dist ** (1 / p)
 
 
-@njit(cache=True)  # , parallel=True)
+@njit(cache=True, parallel=True)
 def dK(X, K, E, rho, J, y, d, r, rK, mle=False):
     """Compute the derivative of the objective function with respect to the Kraus tensor K.
 
@@ -324,7 +333,7 @@ def dK(X, K, E, rho, J, y, d, r, rK, mle=False):
     return dK_.reshape(d, rK, pdim, pdim)
 
 
-@njit(cache=True)  # , parallel=False)
+@njit(cache=True, parallel=True)
 def dK_dMdM(X, K, E, rho, J, y, d, r, rK, mle=False):
     """Compute the derivatives of the objective function with respect to K and the
     product of derivatives of the measurement map with respect to K.
@@ -362,17 +371,19 @@ def dK_dMdM(X, K, E, rho, J, y, d, r, rK, mle=False):
     """
     K = K.reshape(d, rK, -1)
     pdim = int(np.sqrt(r))
-    n = d * rK * r
+    n_params = d * rK * r
     n_povm = y.shape[0]
     dK_ = np.zeros((d, rK, r)).astype(np.complex128)
-    dM11 = np.zeros(n**2).astype(np.complex128)
-    dM10 = np.zeros(n**2).astype(np.complex128)
+    dM11 = np.zeros(n_params**2).astype(np.complex128)
+    dM10 = np.zeros(n_params**2).astype(np.complex128)
     m = len(J)
-    for n in range(m):
+    for n in prange(m):  # pylint: disable=not-an-iterable
         j = J[n][J[n] >= 0]
         dM = np.ascontiguousarray(np.zeros((n_povm, d, rK, r)).astype(np.complex128))
+        dK_step = np.zeros((d, rK, r)).astype(np.complex128)
         p_ind_array = np.zeros(n_povm).astype(np.complex128)
         for o in range(n_povm):
+            p_ind = E[o].conj() @ rho
             for i, k in enumerate(j):
                 R = rho.copy()
                 for ind in j[i + 1 :][::-1]:
@@ -382,28 +393,28 @@ def dK_dMdM(X, K, E, rho, J, y, d, r, rK, mle=False):
                     L = L @ X[ind]
                 dM_loc = K[k].conj() @ np.kron(L.reshape((pdim, pdim)).T, R.reshape((pdim, pdim)).T)
                 p_ind = L @ X[k] @ R
+                dM[o, k] += dM_loc
                 if mle:
-                    dM[o, k] += dM_loc
-                    dK_[k] -= dM_loc * y[o, n] / p_ind
+                    dK_step[k] -= dM_loc * y[o, n] / p_ind
                 else:
-                    dM[o, k] += dM_loc
-                    D_ind = p_ind - y[o, n]
-                    dK_[k] += D_ind * dM_loc * 2 / m / n_povm
-            if len(j) == 0:
-                p_ind_array[o] = E[o].conj() @ rho
-            else:
-                p_ind_array[o] = p_ind
+                    dK_step[k] += (p_ind - y[o, n]) * dM_loc * 2 / m / n_povm
+            p_ind_array[o] = p_ind
+        dM11_step = np.zeros(n_params**2).astype(np.complex128)
+        dM10_step = np.zeros(n_params**2).astype(np.complex128)
         for o in range(n_povm):
             if mle:
-                dM11 += np.kron(dM[o].conj().reshape(-1), dM[o].reshape(-1)) * y[o, n] / p_ind_array[o] ** 2
-                dM10 += np.kron(dM[o].reshape(-1), dM[o].reshape(-1)) * y[o, n] / p_ind_array[o] ** 2
+                dM11_step += np.kron(dM[o].conj().reshape(-1), dM[o].reshape(-1)) * y[o, n] / p_ind_array[o] ** 2
+                dM10_step += np.kron(dM[o].reshape(-1), dM[o].reshape(-1)) * y[o, n] / p_ind_array[o] ** 2
             else:
-                dM11 += np.kron(dM[o].conj().reshape(-1), dM[o].reshape(-1)) * 2 / m / n_povm
-                dM10 += np.kron(dM[o].reshape(-1), dM[o].reshape(-1)) * 2 / m / n_povm
+                dM11_step += np.kron(dM[o].conj().reshape(-1), dM[o].reshape(-1)) * 2 / m / n_povm
+                dM10_step += np.kron(dM[o].reshape(-1), dM[o].reshape(-1)) * 2 / m / n_povm
+        dK_ += dK_step
+        dM11 += dM11_step
+        dM10 += dM10_step
     return (dK_.reshape((d, rK, pdim, pdim)), dM10, dM11)
 
 
-@njit(cache=True)  # , parallel=False)
+@njit(cache=True, parallel=True)
 def ddM(X, K, E, rho, J, y, d, r, rK, mle=False):
     """Compute the second derivative of the objective function with respect to the Kraus tensor K.
 
@@ -450,7 +461,7 @@ def ddM(X, K, E, rho, J, y, d, r, rK, mle=False):
     dconjdK = np.zeros((d**2, rK**2, r, r))
     dconjdK = np.ascontiguousarray(dconjdK.astype(np.complex128))
     m = len(J)
-    for k in range(d**2):
+    for k in prange(d**2):  # pylint: disable=not-an-iterable
         k1, k2 = local_basis(k, d, 2)
         for n in range(m):
             j = J[n][J[n] >= 0]
@@ -535,7 +546,7 @@ def ddM(X, K, E, rho, J, y, d, r, rK, mle=False):
     )
 
 
-@njit(cache=True)  # , parallel=True)
+@njit(cache=True, parallel=True)
 def dA(X, A, B, J, y, r, pdim, n_povm):
     """Compute the derivative of to the objective function with respect to the POVM tensor A
 
@@ -574,7 +585,7 @@ def dA(X, A, B, J, y, r, pdim, n_povm):
     dA_ = np.zeros((n_povm, pdim, pdim)).astype(np.complex128)
     m = len(J)
     # pylint: disable=not-an-iterable
-    for n in prange(m):
+    for n in prange(m):  # pylint: disable=not-an-iterable
         j = J[n][J[n] >= 0]
         inner_deriv = contract(X, j) @ rho
         dA_step = np.zeros((n_povm, pdim, pdim)).astype(np.complex128)
@@ -585,7 +596,7 @@ def dA(X, A, B, J, y, r, pdim, n_povm):
     return dA_ * 2 / m / n_povm
 
 
-@njit(cache=True)  # , parallel=True)
+@njit(cache=True, parallel=True)
 def dB(X, A, B, J, y, pdim):
     """Compute the derivative of the objective function with respect to the state tensor B.
 
@@ -625,7 +636,7 @@ def dB(X, A, B, J, y, pdim):
     return dB_
 
 
-@njit(cache=True)  # , parallel=True)
+@njit(cache=True, parallel=True)
 def ddA_derivs(X, A, B, J, y, r, pdim, n_povm, mle=False):
     """Calculate all nonzero terms of the second derivatives with respect to the POVM tensor A.
 
@@ -703,7 +714,7 @@ def ddA_derivs(X, A, B, J, y, r, pdim, n_povm, mle=False):
     return dA_, dMdM, dMconjdM, dconjdA
 
 
-@njit(cache=True)  # , parallel=True)
+@njit(cache=True, parallel=True)
 def ddB_derivs(X, A, B, J, y, r, pdim, mle=False):
     """Calculate all nonzero terms of the second derivative with respect to the state tensor B.
 
@@ -741,7 +752,6 @@ def ddB_derivs(X, A, B, J, y, r, pdim, mle=False):
         E[k] = (A[k].T.conj() @ A[k]).reshape(-1)
     rho = (B @ B.T.conj()).reshape(-1)
     dB_ = np.zeros((pdim, pdim)).astype(np.complex128)
-    dM = np.zeros((pdim, pdim)).astype(np.complex128)
     dMdM = np.zeros((r, r)).astype(np.complex128)
     dMconjdM = np.zeros((r, r)).astype(np.complex128)
     dconjdB = np.zeros((r, r)).astype(np.complex128)
@@ -749,19 +759,261 @@ def ddB_derivs(X, A, B, J, y, r, pdim, mle=False):
     for n in prange(m):  # pylint: disable=not-an-iterable
         j = J[n][J[n] >= 0]
         C = contract(X, j)
+        dB_step = np.zeros((pdim, pdim)).astype(np.complex128)
+        dMdM_step = np.zeros((r, r)).astype(np.complex128)
+        dMconjdM_step = np.zeros((r, r)).astype(np.complex128)
+        dconjdB_step = np.zeros((r, r)).astype(np.complex128)
         for o in range(n_povm):
             L = E[o].conj() @ C
             dM = L.reshape(pdim, pdim) @ B.conj()
             if mle:
                 p_ind = L @ rho
-                dMdM += np.outer(dM, dM) * y[o, n] / p_ind**2
-                dMconjdM += np.outer(dM.conj(), dM) * y[o, n] / p_ind**2
-                dB_ -= dM * y[o, n] / p_ind
-                dconjdB -= np.kron(L.reshape(pdim, pdim), np.eye(pdim).astype(np.complex128)) * y[o, n] / p_ind
+                dMdM_step += np.outer(dM, dM) * y[o, n] / p_ind**2
+                dMconjdM_step += np.outer(dM.conj(), dM) * y[o, n] / p_ind**2
+                dB_step -= dM * y[o, n] / p_ind
+                dconjdB_step -= np.kron(L.reshape(pdim, pdim), np.eye(pdim).astype(np.complex128)) * y[o, n] / p_ind
             else:
                 D_ind = L @ rho - y[o, n]
-                dMdM += np.outer(dM, dM) * 2 / m / n_povm
-                dMconjdM += np.outer(dM.conj(), dM) * 2 / m / n_povm
-                dB_ += D_ind * dM * 2 / m / n_povm
-                dconjdB += D_ind * np.kron(L.reshape(pdim, pdim), np.eye(pdim).astype(np.complex128)) * 2 / m / n_povm
+                dMdM_step += np.outer(dM, dM) * 2 / m / n_povm
+                dMconjdM_step += np.outer(dM.conj(), dM) * 2 / m / n_povm
+                dB_step += D_ind * dM * 2 / m / n_povm
+                dconjdB_step += (
+                    D_ind * np.kron(L.reshape(pdim, pdim), np.eye(pdim).astype(np.complex128)) * 2 / m / n_povm
+                )
+        dB_ += dB_step
+        dMdM += dMdM_step
+        dMconjdM += dMconjdM_step
+        dconjdB += dconjdB_step
     return dB_, dMdM, dMconjdM, dconjdB.T
+
+
+class SequenceTries(NamedTuple):
+    """Prefix and suffix tries of a set of gate sequences, used to share partial products between sequences.
+
+    Nodes of both tries are numbered level by level, node 0 being the empty sequence, so that every node comes after
+    its parent and all nodes of a level can be contracted in parallel.
+
+    Attributes
+    ----------
+    sequences : numpy.ndarray
+        The gate sequences of J with all padding moved to the end, of shape (m, length).
+    lengths : numpy.ndarray
+        The number of gates of each sequence.
+    prefix_nodes : numpy.ndarray
+        Prefix trie node of the first i gates of sequence n at [n, i], of shape (m, length + 1).
+    prefix_parent, prefix_gate, prefix_levels : numpy.ndarray
+        Parent node, last gate and level boundaries of the prefix trie.
+    suffix_nodes : numpy.ndarray
+        Suffix trie node of the gates of sequence n from position i on at [n, i], of shape (m, length + 1).
+    suffix_parent, suffix_gate, suffix_levels : numpy.ndarray
+        Parent node, first gate and level boundaries of the suffix trie.
+    """
+
+    sequences: np.ndarray
+    lengths: np.ndarray
+    prefix_nodes: np.ndarray
+    prefix_parent: np.ndarray
+    prefix_gate: np.ndarray
+    prefix_levels: np.ndarray
+    suffix_nodes: np.ndarray
+    suffix_parent: np.ndarray
+    suffix_gate: np.ndarray
+    suffix_levels: np.ndarray
+
+
+def _build_trie(sequences, lengths, suffix):
+    """Build the prefix or suffix trie of left-aligned sequences level by level, see :class:`SequenceTries`."""
+    m, length = sequences.shape
+    nodes = np.zeros((m, length + 1), dtype=np.int64)
+    parent = [np.zeros(1, dtype=np.int64)]
+    gate = [np.full(1, -1, dtype=np.int64)]
+    levels = [0, 1]
+    n_gates = max(int(sequences.max(initial=0)) + 1, 1)
+    rows = np.arange(m)
+    for level in range(1, int(lengths.max(initial=0)) + 1):
+        active = rows[lengths >= level]
+        if suffix:
+            positions = lengths[active] - level
+            parents = nodes[active, positions + 1]
+            gates = sequences[active, positions]
+        else:
+            positions = np.full(len(active), level)
+            parents = nodes[active, level - 1]
+            gates = sequences[active, level - 1]
+        keys, inverse = np.unique(parents * n_gates + gates, return_inverse=True)
+        nodes[active, positions] = levels[-1] + inverse.reshape(-1)
+        parent.append(keys // n_gates)
+        gate.append(keys % n_gates)
+        levels.append(levels[-1] + len(keys))
+    return nodes, np.concatenate(parent), np.concatenate(gate), np.array(levels, dtype=np.int64)
+
+
+def sequence_tries(J):
+    """Build the prefix and suffix tries of the gate sequences in J.
+
+    Parameters
+    ----------
+    J : numpy.ndarray
+        A 2D array of gate indices, where each row is a sequence padded with negative entries.
+
+    Returns
+    -------
+    SequenceTries
+        The tries of the sequences, to be passed to the trie-based kernels such as :func:`objf_trie`.
+    """
+    J = np.asarray(J)
+    order = np.argsort(J < 0, axis=1, kind="stable")
+    sequences = np.take_along_axis(J, order, axis=1).astype(np.int64)
+    lengths = (J >= 0).sum(axis=1).astype(np.int64)
+    return SequenceTries(
+        sequences,
+        lengths,
+        *_build_trie(sequences, lengths, suffix=False),
+        *_build_trie(sequences, lengths, suffix=True),
+    )
+
+
+@njit(cache=True, parallel=True)
+def trie_states(X, rho, parent, gate, levels):
+    """Compute the states X[j_i] ... X[j_L] rho of all nodes of a suffix trie.
+
+    Parameters
+    ----------
+    X : numpy.ndarray
+        A 3D array containing the input matrices, of shape (n_matrices, n_rows, n_columns).
+    rho : numpy.ndarray
+        A 1D array representing the density matrix.
+    parent, gate, levels : numpy.ndarray
+        The suffix trie, see :class:`SequenceTries`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The states of all trie nodes, of shape (n_nodes, r).
+    """
+    states = np.zeros((len(parent), len(rho))).astype(np.complex128)
+    states[0] = rho
+    for level in range(1, len(levels) - 1):
+        for node in prange(levels[level], levels[level + 1]):  # pylint: disable=not-an-iterable
+            states[node] = X[gate[node]] @ states[parent[node]]
+    return states
+
+
+@njit(cache=True, parallel=True)
+def trie_covectors(X, E, parent, gate, levels):
+    """Compute the covectors E[o]^* X[j_1] ... X[j_i] of all POVM elements and all nodes of a prefix trie.
+
+    Parameters
+    ----------
+    X : numpy.ndarray
+        A 3D array containing the input matrices, of shape (n_matrices, n_rows, n_columns).
+    E : numpy.ndarray
+        A 2D array representing the POVM elements, of shape (n_povm, r).
+    parent, gate, levels : numpy.ndarray
+        The prefix trie, see :class:`SequenceTries`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The covectors of all POVM elements and trie nodes, of shape (n_povm, n_nodes, r).
+    """
+    n_povm = E.shape[0]
+    covectors = np.zeros((n_povm, len(parent), E.shape[1])).astype(np.complex128)
+    for o in range(n_povm):
+        covectors[o, 0] = E[o].conj()
+    for level in range(1, len(levels) - 1):
+        for node in prange(levels[level], levels[level + 1]):  # pylint: disable=not-an-iterable
+            for o in range(n_povm):
+                covectors[o, node] = covectors[o, parent[node]] @ X[gate[node]]
+    return covectors
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def objf_trie(X, E, rho, tries, y, mle=False):
+    """Calculate the objective function value like :func:`objf`, sharing partial products through sequence tries.
+
+    Parameters
+    ----------
+    X : numpy.ndarray
+        A 3D array containing the input matrices, of shape (n_matrices, n_rows, n_columns).
+    E : numpy.ndarray
+        A 2D array representing the POVM elements, of shape (n_povm, r).
+    rho : numpy.ndarray
+        A 1D array representing the density matrix.
+    tries : SequenceTries
+        The tries of the sequences for which the objective function will be evaluated, see :func:`sequence_tries`.
+    y : numpy.ndarray
+        A 2D array of shape (n_povm, len(J)) containing the target values.
+    mle : bool
+        If True, the log-likelihood objective function is used, otherwise the least squares objective function is used
+
+    Returns
+    -------
+    float
+        The objective function value, equal to that of :func:`objf`.
+    """
+    states = trie_states(X, rho, tries.suffix_parent, tries.suffix_gate, tries.suffix_levels)
+    m = tries.sequences.shape[0]
+    n_povm = y.shape[0]
+    objf_: float = 0
+    for i in prange(m):  # pylint: disable=not-an-iterable
+        objf_ += _objf_term(E, states[tries.suffix_nodes[i, 0]], y[:, i], m, n_povm, mle)
+    return objf_
+
+
+@njit(cache=True, parallel=True)
+def dK_trie(X, K, E, rho, tries, y, d, r, rK, mle=False):
+    """Compute the derivative with respect to the Kraus tensor K like :func:`dK`, sharing partial products.
+
+    Instead of contracting the left and right parts of every sequence around every gate position, all partial
+    products are taken from the prefix and suffix tries of the sequences.
+
+    Parameters
+    ----------
+    X : numpy.ndarray
+        The input matrix X, of shape (pdim, pdim).
+    K : numpy.ndarray
+        The Kraus operator K, reshaped to (d, rK, -1).
+    E : numpy.ndarray
+        A 2D array representing the POVM elements, of shape (n_povm, r).
+    rho : numpy.ndarray
+        A 1D array representing the density matrix.
+    tries : SequenceTries
+        The tries of the sequences for which the derivatives will be computed, see :func:`sequence_tries`.
+    y : numpy.ndarray
+        A 2D array of shape (n_povm, len(J)) containing the target values.
+    d : int
+        The number of Kraus operators.
+    r : int
+        The rank of the problem.
+    rK : int
+        The number of rows in the reshaped Kraus operator K.
+    mle : bool
+        If True, the log-likelihood objective function is used, otherwise the least squares objective function is used
+
+    Returns
+    -------
+    numpy.ndarray
+        The derivative objective function with respect to the Kraus tensor K, equal to that of :func:`dK`.
+    """
+    K = K.reshape(d, rK, -1)
+    pdim = int(np.sqrt(r))
+    n_povm = y.shape[0]
+    states = trie_states(X, rho, tries.suffix_parent, tries.suffix_gate, tries.suffix_levels)
+    covectors = trie_covectors(X, E, tries.prefix_parent, tries.prefix_gate, tries.prefix_levels)
+    dK_ = np.zeros((d, rK, r)).astype(np.complex128)
+    m = tries.sequences.shape[0]
+    for n in prange(m):  # pylint: disable=not-an-iterable
+        dK_step = np.zeros((d, rK, r)).astype(np.complex128)
+        for i in range(tries.lengths[n]):
+            k = tries.sequences[n, i]
+            R = states[tries.suffix_nodes[n, i + 1]]
+            for o in range(n_povm):
+                L = covectors[o, tries.prefix_nodes[n, i]]
+                dM_loc = K[k].conj() @ np.kron(L.reshape(pdim, pdim).T, R.reshape(pdim, pdim).T)
+                if mle:
+                    dK_step[k] -= dM_loc * y[o, n] / (L @ X[k] @ R)
+                else:
+                    dK_step[k] += (L @ X[k] @ R - y[o, n]) * dM_loc * 2 / m / n_povm
+        dK_ += dK_step
+    return dK_.reshape(d, rK, pdim, pdim)
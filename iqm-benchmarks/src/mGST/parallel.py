@@ -0,0 +1,149 @@
+"""
+Shared-memory worker pools for multi-start optimization and bootstrapping
+"""
+
+from multiprocessing import shared_memory, util
+import multiprocessing as mp
+
+import numpy as np
+
+
+# Workers are spawned rather than forked, since forking after numba has started its parallel threading layer
+# can deadlock the child processes
+_mp_context = mp.get_context("spawn")
+
+# State of the current worker process, set once by the pool initializer
+_worker_state = {}
+
+
+class SharedArrays:
+    """Numpy arrays that are copied once into shared memory blocks and attached to by worker processes
+
+    Parameters
+    ----------
+    arrays : dict
+        Dictionary of numpy arrays to be shared, keyed by the name under which workers can access them
+
+    Notes:
+        The creating process owns the shared memory blocks and releases them in close(),
+        which is called automatically when the object is used as a context manager.
+    """
+
+    def __init__(self, arrays):
+        self.blocks = []
+        self.specs = {}
+        for key, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+            self.blocks.append(block)
+            self.specs[key] = (block.name, array.shape, array.dtype.str)
+
+    def close(self):
+        """Releases and unlinks all shared memory blocks"""
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _init_worker(specs, context, stop_event):
+    """Pool initializer which attaches a worker process to the shared arrays
+
+    Parameters
+    ----------
+    specs : dict
+        Shared memory block name, shape and dtype for each shared array, see SharedArrays.specs
+    context : dict
+        Additional read-only objects that are sent once to every worker
+    stop_event : multiprocessing.Event
+        Event that is set once the remaining tasks of the pool can be skipped
+    """
+    blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in specs.values()]
+    arrays = {
+        key: np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        for (key, (_, shape, dtype)), block in zip(specs.items(), blocks)
+    }
+    _worker_state.update(blocks=blocks, arrays=arrays, context=context, stop_event=stop_event)
+    # Runs when the worker exits after the pool is closed, but not when the pool is terminated
+    util.Finalize(None, _detach_worker, exitpriority=0)
+
+
+def _detach_worker():
+    """Pool finalizer which releases the views on the shared arrays and closes the shared memory blocks of a worker"""
+    blocks = _worker_state.get("blocks", [])
+    _worker_state.clear()
+    for block in blocks:
+        block.close()
+
+
+def worker_state():
+    """Returns the shared arrays, context and stop event of the current worker process
+
+    Returns
+    -------
+    arrays : dict
+        Numpy views of the shared arrays, which tasks must not modify
+    context : dict
+        Additional objects passed to the pool
+    stop_event : multiprocessing.Event
+        Event that signals that remaining tasks can terminate early
+    """
+    return _worker_state["arrays"], _worker_state["context"], _worker_state["stop_event"]
+
+
+def available_workers(num_workers):
+    """Returns the number of worker processes that can be started from the current process
+
+    Daemonic processes, such as the workers of a pool over qubit layouts, are not allowed to have children,
+    so nested parallelization falls back to sequential execution.
+
+    Parameters
+    ----------
+    num_workers : int
+        Requested number of worker processes
+
+    Returns
+    -------
+    num_workers : int
+        Number of worker processes that can be used
+    """
+    if num_workers is None or mp.current_process().daemon:
+        return 1
+    return max(1, int(num_workers))
+
+
+def shared_pool(shared, num_workers, context=None, stop_event=None):
+    """Creates a process pool whose workers are attached to shared arrays
+
+    Workers are started with the "spawn" method, so task functions must be importable from their module.
+    The pool should be closed and joined once all tasks are done, such that workers close their shared memory blocks.
+
+    Parameters
+    ----------
+    shared : SharedArrays
+        Arrays which workers can access through worker_state() without them being pickled for each task
+    num_workers : int
+        Number of worker processes
+    context : dict
+        Additional read-only objects which are sent once per worker instead of once per task
+    stop_event : multiprocessing.Event
+        Event that tasks can poll to terminate early; a new event is created if none is given
+
+    Returns
+    -------
+    pool : multiprocessing.Pool
+        The process pool
+    stop_event : multiprocessing.Event
+        The event shared with all workers
+    """
+    if stop_event is None:
+        stop_event = _mp_context.Event()
+    pool = _mp_context.Pool(num_workers, initializer=_init_worker, initargs=(shared.specs, context or {}, stop_event))
+    return pool, stop_event
@@ -0,0 +1,89 @@
+"""
+Timing of random Clifford sequence generation for Randomized Benchmarking
+
+The group-table path, which draws sequences and their inverses as index arrays and materializes the circuits at the
+end, is compared with the previous path, which composed every Clifford into a circuit and inverted the whole circuit
+with compute_inverse_clifford. Run from the iqm-benchmarks directory with
+
+    python tests/performance/clifford_sequences.py --system-size 2q --num-samples 1000 --seq-length 1000
+"""
+
+import argparse
+import random
+from time import perf_counter
+
+import numpy as np
+
+from iqm.benchmarks.randomized_benchmarking.clifford_group_tables import (
+    CliffordGroupTables,
+    materialize_clifford_sequences,
+)
+from iqm.benchmarks.randomized_benchmarking.randomized_benchmarking_common import (
+    compute_inverse_clifford,
+    import_native_gate_cliffords,
+)
+from iqm.qiskit_iqm import IQMCircuit as QuantumCircuit
+
+
+def compose_sequences(clifford_dict, seq_length, num_samples):
+    """Generates random Clifford sequences by composing circuits, as done before the group tables"""
+    clifford_keys = list(clifford_dict.keys())
+    num_qubits = next(iter(clifford_dict.values())).num_qubits
+    logic_qubits = list(range(num_qubits))
+    qc_list = []
+    for _ in range(num_samples):
+        qc = QuantumCircuit(num_qubits)
+        qc_inv = QuantumCircuit(num_qubits)
+        for _ in range(seq_length):
+            clifford = clifford_dict[random.choice(clifford_keys)]
+            qc.compose(clifford, qubits=logic_qubits, inplace=True)
+            qc_inv.compose(clifford, qubits=logic_qubits, inplace=True)
+            qc.barrier()
+        qc.compose(compute_inverse_clifford(qc_inv, clifford_dict), qubits=logic_qubits, inplace=True)
+        qc.measure_all()
+        qc_list.append(qc)
+    return qc_list
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser("clifford_sequences")
+    parser.add_argument("--system-size", choices=["1q", "2q"], default="2q", help="Clifford group to sample from")
+    parser.add_argument("--num-samples", type=int, default=1000, help="Number of random sequences")
+    parser.add_argument("--seq-length", type=int, default=1000, help="Number of Cliffords per sequence")
+    parser.add_argument(
+        "--old-samples",
+        type=int,
+        default=None,
+        help="Number of sequences timed on the previous path, extrapolated to --num-samples; all by default",
+    )
+    args = parser.parse_args()
+
+    clifford_dict = import_native_gate_cliffords(args.system_size)
+    num_qubits = next(iter(clifford_dict.values())).num_qubits
+    rgen = np.random.default_rng(0)
+    random.seed(0)
+
+    start = perf_counter()
+    tables = CliffordGroupTables.from_clifford_dict(clifford_dict)
+    t_tables = perf_counter() - start
+
+    start = perf_counter()
+    sequences, inverses = tables.random_sequences(args.seq_length, args.num_samples, rgen)
+    t_indices = perf_counter() - start
+
+    start = perf_counter()
+    materialize_clifford_sequences([sequences], [inverses], [tables], [list(range(num_qubits))], num_qubits)
+    t_circuits = perf_counter() - start
+
+    old_samples = args.num_samples if args.old_samples is None else min(args.old_samples, args.num_samples)
+    start = perf_counter()
+    compose_sequences(clifford_dict, args.seq_length, old_samples)
+    t_old = (perf_counter() - start) * args.num_samples / old_samples
+
+    print(f"{args.num_samples} sequences of length {args.seq_length} from {len(tables.labels)} Cliffords")
+    print(f"{'group tables (once per dictionary)':<50}{t_tables:>10.2f} s")
+    print(f"{'sequences and inverses as indices':<50}{t_indices:>10.2f} s")
+    print(f"{'materialized circuits':<50}{t_circuits:>10.2f} s")
+    extrapolated = "" if old_samples == args.num_samples else f", extrapolated from {old_samples} sequences"
+    print(f"{'previous path' + extrapolated:<50}{t_old:>10.2f} s")
+    print(f"{'speedup including materialization':<50}{t_old / (t_indices + t_circuits):>10.2f}x")
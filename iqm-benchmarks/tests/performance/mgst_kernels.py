@@ -0,0 +1,73 @@
+"""
+Timing of the mGST objective function and gradient kernels on a 2-qubit GST data set
+
+The per-sequence kernels objf and dK are compared with the trie-based objf_trie and dK_trie, both on the full data
+set, as used to check convergence, and on random batches including the construction of their tries, as used in the
+gradient descent steps. Run from the iqm-benchmarks directory with
+
+    python tests/performance/mgst_kernels.py --num-circuits 1000
+"""
+
+import argparse
+from time import perf_counter
+
+import numpy as np
+
+from mGST.additional_fns import batch, random_gs, random_seq_design
+from mGST.low_level_jit import contract, dK, dK_trie, objf, objf_trie, sequence_tries
+
+
+def mean_time(function, repetitions):
+    """Returns the mean run time of function in seconds, excluding a first call that triggers compilation"""
+    function()
+    start = perf_counter()
+    for _ in range(repetitions):
+        function()
+    return (perf_counter() - start) / repetitions
+
+
+def report(name, reference, trie, repetitions):
+    """Prints the run times of a reference kernel and its trie-based counterpart"""
+    t_reference = mean_time(reference, repetitions)
+    t_trie = mean_time(trie, repetitions)
+    print(f"{name:<28}{t_reference * 1e3:>12.2f} ms{t_trie * 1e3:>12.2f} ms{t_reference / t_trie:>10.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser("mgst_kernels")
+    parser.add_argument("--num-circuits", type=int, default=1000, help="Number of random GST sequences")
+    parser.add_argument("--rank", type=int, default=4, help="Kraus rank of the gate set")
+    parser.add_argument("--batch-size", type=int, default=120, help="Sequences per batch, 30 * pdim by default")
+    parser.add_argument("--repetitions", type=int, default=10, help="Number of timed calls per kernel")
+    args = parser.parse_args()
+
+    # Gate set with the dimensions of the 2QXYICZ gate set and the default sequence design of GSTConfiguration
+    d, r, n_povm = 6, 16, 4
+    np.random.seed(0)
+    J = np.array(random_seq_design(d, 1, 8, 14, int(np.ceil(args.num_circuits / 2)), args.num_circuits // 2))[:, ::-1]
+    _, X_true, E_true, rho_true = random_gs(d, r, args.rank, n_povm)
+    y = np.real(np.array([[E_true[o].conj() @ contract(X_true, j) @ rho_true for j in J] for o in range(n_povm)]))
+    K, X, E, rho = random_gs(d, r, args.rank, n_povm)
+    tries = sequence_tries(J)
+    yb, Jb = batch(y, J, args.batch_size)
+
+    np.testing.assert_allclose(objf_trie(X, E, rho, tries, y), objf(X, E, rho, J, y))
+    np.testing.assert_allclose(
+        dK_trie(X, K, E, rho, tries, y, d, r, args.rank), dK(X, K, E, rho, J, y, d, r, args.rank), atol=1e-10
+    )
+
+    print(f"{len(J)} sequences, {len(tries.suffix_parent)} suffix and {len(tries.prefix_parent)} prefix trie nodes")
+    print(f"{'kernel':<28}{'reference':>15}{'trie':>15}{'speedup':>11}")
+    report("objf", lambda: objf(X, E, rho, J, y), lambda: objf_trie(X, E, rho, tries, y), args.repetitions)
+    report(
+        "dK",
+        lambda: dK(X, K, E, rho, J, y, d, r, args.rank),
+        lambda: dK_trie(X, K, E, rho, tries, y, d, r, args.rank),
+        args.repetitions,
+    )
+    report(
+        f"dK, batch of {len(Jb)} with tries",
+        lambda: dK(X, K, E, rho, Jb, yb, d, r, args.rank),
+        lambda: dK_trie(X, K, E, rho, sequence_tries(Jb), yb, d, r, args.rank),
+        args.repetitions,
+    )
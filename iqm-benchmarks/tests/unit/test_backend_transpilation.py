@@ -2,10 +2,17 @@ import unittest
 
 import numpy as np
 from qiskit import QuantumCircuit
+from qiskit.circuit import Gate
 from qiskit.quantum_info import Operator
 from scipy.optimize import minimize
 
-from iqm.benchmarks.utils import perform_backend_transpilation, reduce_to_active_qubits, set_coupling_map
+from iqm.benchmarks.utils import (
+    circuit_fingerprint,
+    clear_transpilation_cache,
+    perform_backend_transpilation,
+    reduce_to_active_qubits,
+    set_coupling_map,
+)
 from iqm.qiskit_iqm import transpile_to_IQM
 from iqm.qiskit_iqm.fake_backends.fake_apollo import IQMFakeApollo
 from mGST.additional_fns import multikron
@@ -200,6 +207,43 @@ class TestPerformBackendTranspilation(unittest.TestCase):
                 equiv_rz = self.equiv_up_to_local_z(op_with, op_without)
                 self.assertTrue(equiv_rz, f"Circuit {i} failed unitary equivalence check after transpilation")
 
+    def test_transpilation_cache(self):
+        """Test that identical circuits are transpiled once and served from the cache afterwards."""
+        clear_transpilation_cache()
+        copies = [self.test_circuits[0].copy(name=f"ghz_{i}") for i in range(3)]
+
+        transpiled_first, _ = perform_backend_transpilation(
+            copies, self.backend, self.qubit_layout, self.coupling_map, optimize_sqg=True
+        )
+        transpiled_second, _ = perform_backend_transpilation(
+            copies, self.backend, self.qubit_layout, self.coupling_map, optimize_sqg=True
+        )
+
+        self.assertEqual([circ.name for circ in transpiled_second], ["ghz_0", "ghz_1", "ghz_2"])
+        for circ_first, circ_second in zip(transpiled_first, transpiled_second):
+            self.assertIsNot(circ_first, circ_second)
+            self.assertEqual(circ_first, circ_second)
+        self.assertEqual(transpiled_first[0], transpiled_first[2])
+
+    def test_transpilation_cache_custom_gates(self):
+        """Test that custom gates sharing a name but not a definition are not mixed up by the cache."""
+        clear_transpilation_cache()
+        circuits = []
+        for apply_gate in (QuantumCircuit.x, QuantumCircuit.h):
+            definition = QuantumCircuit(1, name="g")
+            apply_gate(definition, 0)
+            qc = QuantumCircuit(1)
+            qc.append(definition.to_gate(), [0])
+            circuits.append(qc)
+        opaque = QuantumCircuit(1)
+        opaque.append(Gate("g", 1, []), [0])
+        self.assertIsNone(circuit_fingerprint(opaque))
+
+        self.assertNotEqual(circuit_fingerprint(circuits[0]), circuit_fingerprint(circuits[1]))
+        for qc in circuits:
+            transpiled, _ = perform_backend_transpilation([qc], self.backend, self.qubit_layout, self.coupling_map)
+            self.assertTrue(Operator(reduce_to_active_qubits(transpiled[0])).equiv(Operator(qc)))
+
     def test_transpilation_with_parameter_binding(self):
         """Test transpilation with parameter binding."""
         from qiskit.circuit import Parameter
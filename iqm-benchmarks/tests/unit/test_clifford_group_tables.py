@@ -0,0 +1,123 @@
+import itertools
+import unittest
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Clifford
+
+from iqm.benchmarks.randomized_benchmarking import randomized_benchmarking_common
+from iqm.benchmarks.randomized_benchmarking.clifford_group_tables import (
+    CliffordGroupTables,
+    materialize_clifford_sequences,
+)
+
+
+def clifford_group_dict(num_qubits):
+    """Enumerates the Clifford group from H, S and CZ, labeled as the native gate dictionaries.
+
+    The symplectic parts are enumerated from the generators, and every Clifford is one of them followed by a Pauli.
+    """
+    generators = []
+    for gate, qubits in (
+        [("h", [q]) for q in range(num_qubits)]
+        + [("s", [q]) for q in range(num_qubits)]
+        + [("cz", list(pair)) for pair in itertools.combinations(range(num_qubits), 2)]
+    ):
+        circuit = QuantumCircuit(num_qubits)
+        getattr(circuit, gate)(*qubits)
+        generators.append((circuit, Clifford(circuit)))
+    identity = QuantumCircuit(num_qubits)
+    symplectic = {Clifford(identity).symplectic_matrix.tobytes(): (identity, Clifford(identity))}
+    frontier = list(symplectic.values())
+    while frontier:
+        new_frontier = []
+        for circuit, clifford in frontier:
+            for generator, generator_clifford in generators:
+                new_clifford = clifford.compose(generator_clifford)
+                key = new_clifford.symplectic_matrix.tobytes()
+                if key not in symplectic:
+                    symplectic[key] = (circuit.compose(generator), new_clifford)
+                    new_frontier.append(symplectic[key])
+        frontier = new_frontier
+
+    paulis = []
+    for pauli in itertools.product("ixyz", repeat=num_qubits):
+        circuit = QuantumCircuit(num_qubits)
+        for qubit, gate in enumerate(pauli):
+            if gate != "i":
+                getattr(circuit, gate)(qubit)
+        paulis.append((circuit, Clifford(circuit)))
+    cliffords = {}
+    for circuit, clifford in symplectic.values():
+        for pauli, pauli_clifford in paulis:
+            cliffords[str(clifford.compose(pauli_clifford).to_labels(mode="B"))] = circuit.compose(pauli)
+    return cliffords
+
+
+class TestCliffordGroupTables(unittest.TestCase):
+    def setUp(self):
+        self.cliffords = clifford_group_dict(1)
+        self.tables = CliffordGroupTables.from_clifford_dict(self.cliffords)
+
+    def test_compose_and_inverse(self):
+        cliffords = [Clifford(c) for c in self.tables.circuits]
+        self.assertEqual(len(cliffords), 24)
+        for first in range(24):
+            for second in range(24):
+                expected = str(cliffords[second].compose(cliffords[first]).to_labels(mode="B"))
+                self.assertEqual(self.tables.labels[self.tables.compose(first, second)], expected)
+            self.assertEqual(self.tables.compose(first, self.tables.inverse[first]), self.tables.identity)
+
+    def test_incomplete_dict(self):
+        cliffords = dict(self.cliffords)
+        cliffords.pop(next(iter(cliffords)))
+        with self.assertRaises(ValueError):
+            CliffordGroupTables.from_clifford_dict(cliffords)
+
+    def test_materialized_sequences_are_identity(self):
+        interleaved_gate = QuantumCircuit(1)
+        interleaved_gate.h(0)
+        for gate in (None, interleaved_gate):
+            interleaved_index = None if gate is None else self.tables.index_of(gate)
+            sequences, inverses = self.tables.random_sequences(20, 5, np.random.default_rng(3), interleaved_index)
+            circuits = materialize_clifford_sequences([sequences], [inverses], [self.tables], [[0]], 1, gate)
+            for circuit in circuits:
+                circuit.remove_final_measurements()
+                self.assertEqual(Clifford(circuit), Clifford(QuantumCircuit(1)))
+
+    def test_sequence_inverses_match_compute_inverse_clifford(self):
+        sequences, inverses = self.tables.random_sequences(30, 10, np.random.default_rng(7))
+        self.assertEqual(sequences.shape, (10, 30))
+        for sequence, inverse in zip(sequences, inverses):
+            circuit = QuantumCircuit(1)
+            for index in sequence:
+                circuit.compose(self.tables.circuits[index], inplace=True)
+            expected = randomized_benchmarking_common.compute_inverse_clifford(circuit, self.cliffords)
+            self.assertEqual(Clifford(self.tables.circuits[inverse]), Clifford(expected))
+
+
+class TestTwoQubitCliffordGroupTables(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.cliffords = clifford_group_dict(2)
+        cls.tables = CliffordGroupTables.from_clifford_dict(cls.cliffords)
+
+    def test_compose_and_inverse(self):
+        self.assertEqual(len(self.tables.labels), 11520)
+        elements = np.arange(len(self.tables.labels))
+        np.testing.assert_array_equal(self.tables.compose(elements, self.tables.inverse), self.tables.identity)
+        np.testing.assert_array_equal(self.tables.compose(self.tables.inverse, elements), self.tables.identity)
+
+        rgen = np.random.default_rng(5)
+        for first, second in rgen.integers(0, len(self.tables.labels), size=(200, 2)):
+            expected = Clifford(self.tables.circuits[second]).compose(Clifford(self.tables.circuits[first]))
+            self.assertEqual(self.tables.labels[self.tables.compose(first, second)], str(expected.to_labels(mode="B")))
+
+    def test_sequence_inverses_match_compute_inverse_clifford(self):
+        sequences, inverses = self.tables.random_sequences(15, 5, np.random.default_rng(9))
+        for sequence, inverse in zip(sequences, inverses):
+            circuit = QuantumCircuit(2)
+            for index in sequence:
+                circuit.compose(self.tables.circuits[index], inplace=True)
+            expected = randomized_benchmarking_common.compute_inverse_clifford(circuit, self.cliffords)
+            self.assertEqual(Clifford(self.tables.circuits[inverse]), Clifford(expected))
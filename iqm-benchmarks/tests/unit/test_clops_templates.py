@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+from qiskit.circuit import ParameterVector
+
+from iqm.benchmarks.quantum_volume.clops import SerializedTemplateBatch
+from iqm.iqm_client import IQMClient
+from iqm.qiskit_iqm import IQMCircuit as QuantumCircuit
+from iqm.qiskit_iqm.fake_backends.fake_apollo import IQMFakeApollo
+from iqm.qiskit_iqm.iqm_provider import IQMBackend
+
+
+class TestSerializedTemplateBatch(unittest.TestCase):
+    def setUp(self):
+        client = Mock(spec=IQMClient)
+        client.get_dynamic_quantum_architecture.return_value = IQMFakeApollo().architecture
+        client.create_run_request.side_effect = lambda circuits, shots, **_: SimpleNamespace(
+            circuits=circuits, shots=shots
+        )
+        self.backend = IQMBackend(client)
+        self.params = ParameterVector("p", 6)
+
+        # Templates use only some of the parameters, not necessarily the first ones
+        first = QuantumCircuit(2)
+        first.r(2 * self.params[3] + 0.3, self.params[5], 0)
+        first.cz(0, 1)
+        first.r(0.5, -self.params[3], 1)
+        first.measure_all()
+        second = QuantumCircuit(2)
+        second.r(self.params[0] * self.params[4], self.params[1] - 1.0, 1)
+        second.cz(0, 1)
+        second.r(self.params[2], 0.1, 0)
+        second.measure_all()
+        self.templates = [first, second]
+
+    def test_bind_matches_assign_parameters(self):
+        batch = SerializedTemplateBatch(self.backend, self.templates, self.params, shots=10)
+        values = np.random.default_rng(3).uniform(-np.pi, np.pi, size=(2, len(self.params)))
+        batch.bind(values)
+
+        expected = self.backend.create_run_request(
+            [qc.assign_parameters(dict(zip(self.params, row)), strict=False) for qc, row in zip(self.templates, values)]
+        )
+        for circuit, expected_circuit in zip(batch.run_request.circuits, expected.circuits):
+            self.assertEqual(len(circuit.instructions), len(expected_circuit.instructions))
+            for instruction, expected_instruction in zip(circuit.instructions, expected_circuit.instructions):
+                self.assertEqual(instruction.name, expected_instruction.name)
+                self.assertEqual(instruction.qubits, expected_instruction.qubits)
+                self.assertEqual(instruction.args.keys(), expected_instruction.args.keys())
+                for key, value in expected_instruction.args.items():
+                    if isinstance(value, float):
+                        self.assertAlmostEqual(instruction.args[key], value)
+                    else:
+                        self.assertEqual(instruction.args[key], value)
+
+    def test_unmatched_instructions(self):
+        self.backend.client.create_run_request.side_effect = lambda circuits, shots, **_: SimpleNamespace(
+            circuits=[circuit.model_copy(update={"instructions": circuit.instructions[1:]}) for circuit in circuits],
+            shots=shots,
+        )
+        with self.assertRaises(ValueError):
+            SerializedTemplateBatch(self.backend, self.templates, self.params, shots=10)
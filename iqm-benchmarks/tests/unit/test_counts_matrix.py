@@ -0,0 +1,97 @@
+import unittest
+
+import numpy as np
+import xarray as xr
+
+from iqm.benchmarks.benchmark_definition import add_counts_to_dataset
+from iqm.benchmarks.utils import (
+    bootstrap_counts,
+    bootstrap_counts_matrix,
+    counts_to_matrix,
+    marginal_distribution,
+    marginalize_counts_matrix,
+    matrix_to_counts,
+    xrvariable_to_counts,
+    xrvariable_to_counts_matrix,
+)
+
+
+class TestCountsMatrix(unittest.TestCase):
+    def setUp(self):
+        self.counts = [{"00": 5, "11": 3}, {"01": 2, "10": 6}, {"11": 8}]
+
+    def test_counts_to_matrix_round_trip(self):
+        outcomes, matrix = counts_to_matrix(self.counts)
+        self.assertEqual(outcomes.tolist(), ["00", "01", "10", "11"])
+        np.testing.assert_array_equal(matrix, [[5, 0, 0, 3], [0, 2, 6, 0], [0, 0, 0, 8]])
+        self.assertEqual(matrix_to_counts(outcomes, matrix), self.counts)
+
+    def test_marginalize_counts_matrix(self):
+        outcomes, matrix = counts_to_matrix(self.counts)
+        for indices in ([0], [1]):
+            new_outcomes, new_matrix = marginalize_counts_matrix(outcomes, matrix, indices)
+            expected = [marginal_distribution(c, indices) for c in self.counts]
+            self.assertEqual(matrix_to_counts(new_outcomes, new_matrix), expected)
+
+        # Bits follow the order of the given indices
+        new_outcomes, new_matrix = marginalize_counts_matrix(outcomes, matrix, [1, 0])
+        self.assertEqual(matrix_to_counts(new_outcomes, new_matrix)[1], {"10": 2, "01": 6})
+
+    def test_add_counts_to_dataset_accumulates(self):
+        dataset, _ = add_counts_to_dataset(self.counts, "q", xr.Dataset())
+        dataset, _ = add_counts_to_dataset([{"00": 1, "01": 1}], "q", dataset)
+        self.assertEqual(
+            xrvariable_to_counts(dataset, "q", 3), [{"00": 6, "01": 1, "11": 3}, {"01": 2, "10": 6}, {"11": 8}]
+        )
+
+    def test_sparse_storage(self):
+        counts = [{format(i, "08b"): i + 1} for i in range(20)]
+        dataset, _ = add_counts_to_dataset(counts, "q", xr.Dataset())
+        self.assertIn("q_outcome_index", dataset.variables)
+        self.assertEqual(xrvariable_to_counts(dataset, "q", 20), counts)
+        outcomes, matrix = xrvariable_to_counts_matrix(dataset, "q")
+        self.assertEqual(matrix_to_counts(outcomes, matrix), counts)
+
+    def test_zero_counts_are_kept(self):
+        counts = [{"00": 5, "11": 0}, {"01": 2, "10": 6}, {"11": 8, "00": 0}]
+        dataset, _ = add_counts_to_dataset(counts, "q", xr.Dataset())
+        self.assertEqual(
+            xrvariable_to_counts(dataset, "q", 3), [{"00": 5, "11": 0}, {"01": 2, "10": 6}, {"00": 0, "11": 8}]
+        )
+        outcomes, matrix = xrvariable_to_counts_matrix(dataset, "q")
+        np.testing.assert_array_equal(matrix, [[5, 0, 0, 0], [0, 2, 6, 0], [0, 0, 0, 8]])
+
+        dataset, _ = add_counts_to_dataset([{"01": 0}], "q", dataset)
+        self.assertEqual(xrvariable_to_counts(dataset, "q", 3)[0], {"00": 5, "01": 0, "11": 0})
+
+        legacy = xr.Dataset()
+        for ii, c in enumerate(counts):
+            legacy[f"q_counts_{ii}"] = xr.DataArray(list(c.values()), {f"q_state_{ii}": list(c.keys())})
+        legacy, _ = add_counts_to_dataset([{"01": 0}], "q", legacy)
+        self.assertEqual(xrvariable_to_counts(legacy, "q", 3)[0], {"00": 5, "01": 0, "11": 0})
+
+    def test_legacy_dataset(self):
+        dataset = xr.Dataset()
+        for ii, c in enumerate(self.counts):
+            dataset[f"q_counts_{ii}"] = xr.DataArray(list(c.values()), {f"q_state_{ii}": list(c.keys())})
+        outcomes, matrix = xrvariable_to_counts_matrix(dataset, "q")
+        self.assertEqual(matrix_to_counts(outcomes, matrix), self.counts)
+
+        dataset, _ = add_counts_to_dataset(self.counts, "q", dataset)
+        self.assertNotIn("q_counts_0", dataset.variables)
+        self.assertEqual(xrvariable_to_counts(dataset, "q", 3), [{k: 2 * v for k, v in c.items()} for c in self.counts])
+
+    def test_bootstrap_counts_matrix(self):
+        _, matrix = counts_to_matrix(self.counts)
+        samples = bootstrap_counts_matrix(matrix, 7, np.random.default_rng(5))
+        self.assertEqual(samples.shape, (7, 3, 4))
+        np.testing.assert_array_equal(samples.sum(axis=2), np.broadcast_to(matrix.sum(axis=1), (7, 3)))
+        # Outcomes never observed are never resampled
+        np.testing.assert_array_equal(samples[:, matrix == 0], 0)
+        np.testing.assert_array_equal(samples, bootstrap_counts_matrix(matrix, 7, np.random.default_rng(5)))
+
+    def test_bootstrap_counts(self):
+        samples = bootstrap_counts(self.counts[0], 10, np.random.default_rng(1), include_original_counts=True)
+        self.assertEqual(len(samples), 11)
+        self.assertIs(samples[0], self.counts[0])
+        self.assertTrue(all(set(s) == {"00", "11"} and sum(s.values()) == 8 for s in samples[1:]))
@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+from mGST.additional_fns import random_gs
+from mGST.low_level_jit import dK, dK_trie, objf, objf_trie, sequence_tries
+
+
+class TestMGSTKernels(unittest.TestCase):
+    def setUp(self):
+        # Two-qubit gate set with GST-like sequences: shared preparation and germ prefixes, padded with -1
+        rng = np.random.default_rng(11)
+        self.d, self.r, self.rK, self.n_povm = 6, 16, 2, 4
+        self.K, self.X, self.E, self.rho = random_gs(self.d, self.r, self.rK, self.n_povm)
+        germs = rng.integers(0, self.d, (8, 3))
+        fiducials = rng.integers(0, self.d, (6, 2))
+        sequences = [
+            np.concatenate([fiducials[f1], np.tile(germs[g], p), fiducials[f2]])
+            for g in range(len(germs))
+            for p in range(1, 4)
+            for f1 in range(len(fiducials))
+            for f2 in range(len(fiducials))
+        ]
+        self.J = np.full((len(sequences), 13), -1)
+        for n, sequence in enumerate(sequences):
+            self.J[n, : len(sequence)] = sequence
+        self.J[::5] = np.roll(self.J[::5], 2, axis=1)  # padding is not necessarily at the end
+        self.y = rng.random((self.n_povm, len(sequences)))
+        self.y /= self.y.sum(axis=0)
+
+    def test_sequence_tries(self):
+        tries = sequence_tries(self.J)
+        for n, row in enumerate(self.J):
+            sequence = row[row >= 0]
+            np.testing.assert_array_equal(tries.sequences[n, : tries.lengths[n]], sequence)
+            node = tries.suffix_nodes[n, 0]
+            for gate in sequence:
+                self.assertEqual(tries.suffix_gate[node], gate)
+                node = tries.suffix_parent[node]
+            self.assertEqual(node, 0)
+        # Shared prefixes and suffixes are stored only once
+        self.assertLess(len(tries.suffix_parent), tries.lengths.sum())
+        self.assertLess(len(tries.prefix_parent), tries.lengths.sum())
+
+    def test_trie_kernels_match(self):
+        tries = sequence_tries(self.J)
+        for mle in (False, True):
+            self.assertAlmostEqual(
+                objf_trie(self.X, self.E, self.rho, tries, self.y, mle),
+                objf(self.X, self.E, self.rho, self.J, self.y, mle),
+            )
+            np.testing.assert_allclose(
+                dK_trie(self.X, self.K, self.E, self.rho, tries, self.y, self.d, self.r, self.rK, mle),
+                dK(self.X, self.K, self.E, self.rho, self.J, self.y, self.d, self.r, self.rK, mle),
+                atol=1e-10,
+            )
+
+    def test_parallel_kernels_match_serial(self):
+        J, y = self.J[:40], self.y[:, :40]
+        for mle in (False, True):
+            self.assertAlmostEqual(
+                objf(self.X, self.E, self.rho, J, y, mle), objf.py_func(self.X, self.E, self.rho, J, y, mle)
+            )
+            np.testing.assert_allclose(
+                dK(self.X, self.K, self.E, self.rho, J, y, self.d, self.r, self.rK, mle),
+                dK.py_func(self.X, self.K, self.E, self.rho, J, y, self.d, self.r, self.rK, mle),
+                atol=1e-10,
+            )
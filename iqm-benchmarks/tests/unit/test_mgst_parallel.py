@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+
+from mGST import algorithm
+from mGST.additional_fns import random_gs
+from mGST.low_level_jit import contract
+from mGST.parallel import SharedArrays, available_workers, shared_pool, worker_state
+
+
+def _row_sum_task(index):
+    arrays, context, _ = worker_state()
+    return float(arrays["data"][index].sum()) + context["offset"]
+
+
+class TestMGSTParallel(unittest.TestCase):
+    def test_shared_pool_tasks_read_shared_arrays(self):
+        data = np.arange(12.0).reshape(4, 3)
+        with SharedArrays({"data": data}) as shared:
+            pool, _ = shared_pool(shared, 2, {"offset": 100})
+            with pool:
+                results = pool.map(_row_sum_task, range(len(data)))
+                pool.close()
+                pool.join()
+        self.assertEqual(results, list(data.sum(axis=1) + 100))
+
+    def test_available_workers(self):
+        self.assertEqual(available_workers(None), 1)
+        self.assertEqual(available_workers(0), 1)
+        self.assertEqual(available_workers(4), 4)
+
+    def test_multi_start_converges(self):
+        np.random.seed(0)
+        d, r, rK, n_povm, length = 3, 4, 1, 2, 6
+        _, X, E, rho = random_gs(d, r, rK, n_povm)
+        J = np.random.randint(0, d, (200, length))
+        y = np.real(np.array([[E[i].conj() @ contract(X, j) @ rho for j in J] for i in range(n_povm)]))
+
+        _, _, _, _, res_list = algorithm.run_mGST(
+            y, J, length, d, r, rK, n_povm, 50, 1000, max_inits=4, max_iter=40, final_iter=20, num_workers=2
+        )
+        delta = 5 * (1 - y.reshape(-1)) @ y.reshape(-1) / len(J) / n_povm / 1000
+        self.assertLess(res_list[-1], delta)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+import numpy as np
+from qiskit.quantum_info import Statevector
+
+from iqm.benchmarks.quantum_volume.quantum_volume import (
+    QuantumVolumeBenchmark,
+    clear_ideal_heavy_outputs_cache,
+    get_ideal_heavy_outputs,
+)
+
+
+def heavy_projector(probabilities):
+    """The heavy outputs as selected before the Statevector path, from a dictionary of output probabilities."""
+    median_prob = np.median(list(probabilities.values()))
+    return {k: 1.0 for k, v in probabilities.items() if v > median_prob}
+
+
+def ideal_probabilities(qc):
+    """The ideal output probabilities of all bitstrings, including those that never occur."""
+    probabilities = Statevector(qc.remove_final_measurements(inplace=False)).probabilities()
+    return {format(i, f"0{qc.num_qubits}b"): p for i, p in enumerate(probabilities)}
+
+
+class TestIdealHeavyOutputs(unittest.TestCase):
+    def test_matches_heavy_projector(self):
+        clear_ideal_heavy_outputs_cache()
+        for num_qubits in (2, 3, 4):
+            qc_list = [QuantumVolumeBenchmark.generate_single_circuit(num_qubits) for _ in range(5)]
+            # Two layouts, the larger batch coming first
+            sorted_indices = {(0,): [1, 3], (1,): [0, 2, 4]}
+            expected = [heavy_projector(ideal_probabilities(qc_list[i])) for i in [0, 2, 4, 1, 3]]
+            self.assertEqual(get_ideal_heavy_outputs(qc_list, sorted_indices, num_processes=1), expected)
+            # Served from the cache the second time
+            self.assertEqual(get_ideal_heavy_outputs(qc_list, sorted_indices, num_processes=1), expected)
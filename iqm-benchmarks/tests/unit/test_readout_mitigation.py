@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import patch
+import uuid
+
+import numpy as np
+
+from iqm.benchmarks.readout_mitigation import (
+    M3IQM,
+    READOUT_CALIBRATION_MAX_AGE,
+    clear_readout_calibration_cache,
+    get_readout_mitigator,
+)
+from iqm.qiskit_iqm.fake_backends.fake_apollo import IQMFakeApollo
+
+
+class TestReadoutCalibrationCache(unittest.TestCase):
+    def setUp(self):
+        clear_readout_calibration_cache()
+        self.addCleanup(clear_readout_calibration_cache)
+        self.backend = IQMFakeApollo()
+        self.calibrated = []
+
+        def cals_from_system(mit, qubits, shots=None):
+            self.calibrated.append(list(qubits))
+            mit.single_qubit_cals = [None] * mit.num_qubits
+            for q in qubits:
+                mit.single_qubit_cals[q] = np.array([[0.9, 0.2], [0.1, 0.8]]) + 0.001 * q
+
+        patcher = patch.object(M3IQM, "cals_from_system", autospec=True, side_effect=cals_from_system)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cache_hit_and_miss(self):
+        mit = get_readout_mitigator(self.backend, [[1, 2], {0: 2, 1: 3}])
+        self.assertEqual(self.calibrated, [[1, 2, 3]])
+        np.testing.assert_allclose(mit.single_qubit_cals[3], np.array([[0.9, 0.2], [0.1, 0.8]]) + 0.003)
+
+        # Only qubits without a cached matrix are calibrated
+        mit = get_readout_mitigator(self.backend, [[2, 3, 4]])
+        self.assertEqual(self.calibrated, [[1, 2, 3], [4]])
+        np.testing.assert_allclose(mit.single_qubit_cals[2], np.array([[0.9, 0.2], [0.1, 0.8]]) + 0.002)
+
+        get_readout_mitigator(self.backend, [[1, 4]])
+        self.assertEqual(len(self.calibrated), 2)
+
+        # Other calibration shots are not reused
+        get_readout_mitigator(self.backend, [[1]], mit_shots=500)
+        self.assertEqual(self.calibrated[-1], [1])
+
+    def test_calibration_set_change(self):
+        get_readout_mitigator(self.backend, [[1, 2]])
+        self.backend.architecture = self.backend.architecture.model_copy(update={"calibration_set_id": uuid.uuid4()})
+        get_readout_mitigator(self.backend, [[1, 2]])
+        self.assertEqual(self.calibrated, [[1, 2], [1, 2]])
+
+    def test_expiry(self):
+        with patch("iqm.benchmarks.readout_mitigation.time.time", return_value=1000.0):
+            get_readout_mitigator(self.backend, [[1]])
+        with patch("iqm.benchmarks.readout_mitigation.time.time", return_value=1000.0 + READOUT_CALIBRATION_MAX_AGE):
+            get_readout_mitigator(self.backend, [[1]])
+        self.assertEqual(len(self.calibrated), 1)
+        with patch("iqm.benchmarks.readout_mitigation.time.time", return_value=1001.0 + READOUT_CALIBRATION_MAX_AGE):
+            get_readout_mitigator(self.backend, [[1]])
+            self.assertEqual(len(self.calibrated), 2)
+            # Without a maximum age, the matrices measured just now are reused forever
+            get_readout_mitigator(self.backend, [[1]], max_calibration_age=None)
+        with patch("iqm.benchmarks.readout_mitigation.time.time", return_value=1e9):
+            get_readout_mitigator(self.backend, [[1]], max_calibration_age=None)
+        self.assertEqual(len(self.calibrated), 2)
+
+    def test_clear_cache(self):
+        get_readout_mitigator(self.backend, [[1]])
+        clear_readout_calibration_cache()
+        get_readout_mitigator(self.backend, [[1]])
+        self.assertEqual(self.calibrated, [[1], [1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import itertools
+import unittest
+
+import numpy as np
+from qiskit.quantum_info import random_clifford, random_unitary
+
+from iqm.benchmarks.utils_shadows import (
+    LocalShadowAccumulator,
+    counts_to_bit_array,
+    get_clifford_snapshots,
+    get_local_shadow,
+    unitary_snapshots,
+)
+
+
+class TestLocalShadows(unittest.TestCase):
+    def setUp(self):
+        self.cliffords_1q = {str(i): random_clifford(1, seed=i).to_circuit() for i in range(24)}
+        self.rng = np.random.default_rng(3)
+
+    def test_haar_shadow_matches_explicit_sum(self):
+        unitaries = np.array([random_unitary(2, seed=i).data for i in range(3)])
+        counts = {format(b, "03b"): int(self.rng.integers(1, 50)) for b in range(8)}
+        shots = sum(counts.values())
+        proj = np.eye(2)[:, :, None] * np.eye(2)[:, None, :]
+
+        expected = np.zeros((4, 4), dtype=complex)
+        for bit_string, count in counts.items():
+            rho = np.ones((1, 1))
+            for j in (2, 0):
+                s_j = int(bit_string[::-1][j])
+                rho = np.kron(rho, 3 * unitaries[j].conj().T @ proj[s_j] @ unitaries[j] - np.eye(2))
+            expected += rho * count / shots
+
+        np.testing.assert_allclose(get_local_shadow(counts, unitaries, [2, 0], "haar"), expected, atol=1e-12)
+        np.testing.assert_allclose(
+            unitary_snapshots(unitaries)[1, 0], 3 * unitaries[1].conj().T @ proj[0] @ unitaries[1] - np.eye(2)
+        )
+
+    def test_grouped_shadows_match_projected_counts(self):
+        num_neighbors = 3
+        counts = {
+            format(b, "05b")[:num_neighbors] + " " + format(b, "05b")[num_neighbors:]: int(self.rng.integers(0, 40))
+            for b in range(32)
+        }
+        labels = ["5", "17"]
+        projections = ["".join(p) for p in itertools.product("01", repeat=num_neighbors)]
+
+        accumulator = LocalShadowAccumulator([0, 1], "clifford", self.cliffords_1q, num_groups=len(projections))
+        bits, weights = counts_to_bit_array(counts)
+        groups = bits[:, 2:][:, ::-1] @ (1 << np.arange(num_neighbors - 1, -1, -1))
+        shadows = accumulator.add(bits, weights, labels, groups=groups)
+        accumulator.add(bits, weights, labels, groups=groups)
+
+        for idx, projection in enumerate(projections):
+            projected_counts = {b_s[-2:]: b_c for b_s, b_c in counts.items() if b_s[:num_neighbors] == projection}
+            expected = get_local_shadow(projected_counts, labels, [0, 1], "clifford", self.cliffords_1q)
+            np.testing.assert_allclose(shadows[idx], expected, atol=1e-12)
+            np.testing.assert_allclose(accumulator.mean[idx], expected, atol=1e-12)
+            self.assertAlmostEqual(np.trace(shadows[idx]).real, 1.0 if sum(projected_counts.values()) else 0.0)
+
+    def test_clifford_snapshots_follow_circuits(self):
+        snapshots = get_clifford_snapshots(self.cliffords_1q)
+        self.assertIs(get_clifford_snapshots(dict(self.cliffords_1q)), snapshots)
+
+        # Same labels, different circuits
+        shifted = {label: self.cliffords_1q[str((int(label) + 1) % 24)] for label in self.cliffords_1q}
+        shifted_snapshots = get_clifford_snapshots(shifted)
+        np.testing.assert_allclose(shifted_snapshots["0"], snapshots["1"])
+        self.assertFalse(np.allclose(shifted_snapshots["0"], snapshots["0"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
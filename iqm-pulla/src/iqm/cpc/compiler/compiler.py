@@ -42,8 +42,9 @@ from iqm.cpc.interface.compiler import (
     MoveGateFrameTrackingMode,
     MoveGateValidationMode,
 )
-from iqm.pulla.interface import CalibrationSet
+from iqm.pulla.interface import CalibrationSet, CalibrationSetId
 from iqm.pulla.utils import (
+    _changed_observations,
     _update_channel_props_from_calibration,
     build_settings,
     calset_to_cal_data_tree,
@@ -201,6 +202,8 @@ class Compiler:
         pp_stages: Post-processing stages to use. ``None`` means none.
         strict: If True, raises CalibrationError on calibration validation failures.
             If False, only logs warnings. Defaults to False.
+        calibration_set_id: ID of ``calibration_set``, if known. Enables caching the station settings.
+            It is reset to ``None`` whenever the calibration set is modified.
 
     Raises:
         CalibrationError: When strict=True and calibration validation fails during compiler initialization.
@@ -219,8 +222,10 @@ class Compiler:
         stages: Collection[CompilationStage] | None = None,
         pp_stages: Collection[CompilationStage] | None = None,
         strict: bool = False,  # consider extending to e.g. errors: Literal["raise", "warning", "ignore"] = "warning"
+        calibration_set_id: CalibrationSetId | None = None,
     ):
         self._calibration_set = calibration_set
+        self.calibration_set_id = calibration_set_id
         self.component_mapping = component_mapping
         self.options = options
         self.stages = stages or []
@@ -236,13 +241,31 @@ class Compiler:
                 raise CalibrationError(f"{exc}") from exc
             cpc_logger.warning("Calibration validation failed: %s", exc)
 
-    def _refresh(self) -> None:
-        """Refresh the compiler by re-creating the ScheduleBuilder and validating the calibration.
-        Must be called automatically by any method that modifies the calibration set, or the op_table
+    def _refresh(self, changed_observations: Collection[str] | None = None) -> None:
+        """Refresh the compiler after the calibration set or the op_table has been modified.
+
+        Must be called automatically by any method that modifies the calibration set, or the op_table.
+
+        Args:
+            changed_observations: Names of the calibration observations that have been added or modified.
+                If given, and the changes do not affect the control channel properties, only the calibration
+                data of the affected operations/implementations/loci is injected into the ScheduleBuilder
+                and validated, which keeps the cached GateImplementations of the unaffected ones.
+                ``None`` means the ScheduleBuilder is re-created and all the calibration data is validated.
+
         """
         _updated_channel_properties = _update_channel_props_from_calibration(
             self.builder.channels, self.builder.component_channels, self._calibration_set
         )
+        if changed_observations is not None and _updated_channel_properties == self.builder.channels:
+            partial_calibration = calset_to_cal_data_tree(self._calibration_set, changed_observations)
+            self.builder.inject_calibration(partial_calibration)
+            try:
+                self.builder.validate_calibration(partial_calibration)
+            except ValueError as exc:
+                raise CalibrationError(f"{exc}") from exc
+            return
+
         self.builder = ScheduleBuilder(
             self.builder.op_table,
             calset_to_cal_data_tree(self._calibration_set),
@@ -259,15 +282,24 @@ class Compiler:
         """Returns a copy of the current local calibration set."""
         return deepcopy(self._calibration_set)
 
-    def set_calibration(self, calibration: CalibrationSet) -> None:
+    def set_calibration(self, calibration: CalibrationSet, calibration_set_id: CalibrationSetId | None = None) -> None:
         """Sets the current calibration set to a given calibration set, then refreshes the compiler.
 
+        If ``calibration`` only adds or modifies observations of the current calibration set, only the
+        affected parts of the schedule builder are refreshed.
+
         Args:
             calibration: The calibration set to be set as the current calibration set.
+            calibration_set_id: ID of ``calibration``, if it is an unmodified calibration set from the database.
 
         """
+        # the current calibration set may have been modified in place, in which case we cannot diff it
+        changed = (
+            None if calibration is self._calibration_set else _changed_observations(self._calibration_set, calibration)
+        )
         self._calibration_set = calibration
-        self._refresh()
+        self.calibration_set_id = calibration_set_id
+        self._refresh(changed)
 
     @property
     def gates(self) -> dict[str, QuantumOp]:
@@ -283,7 +315,8 @@ class Compiler:
 
         """
         self.builder.op_table[gate_name].set_default_implementation(implementation_name)
-        self._refresh()
+        # default implementations are resolved on every request, only composite gates cache the choice
+        self.builder.composite_cache.flush()
 
     def set_default_implementation_for_loci(
         self, gate_name: str, implementation_name: str, loci: Iterable[Locus]
@@ -298,15 +331,16 @@ class Compiler:
         """
         for locus in loci:
             self.builder.op_table[gate_name].set_default_implementation_for_locus(implementation_name, locus)
-        self._refresh()
+        self.builder.composite_cache.flush()
 
     def amend_calibration_for_gate_implementation(
         self, gate_name: str, impl_name: str, locus: Locus, params: dict[str, Any]
     ) -> None:
         """Update the current local calibration set with calibration values for a specific gate/implementation/locus.
 
-        The calibration values are given as a dictionary
-        of parameter names and their values. This method refreshes the compiler after amending the calibration set.
+        The calibration values are given as a dictionary of parameter names and their values.
+        After amending the calibration set, this method refreshes only the calibration data of the amended
+        gate implementation/locus in the compiler.
 
         Args:
             gate_name: Name of the gate to which the calibration values are applied.
@@ -321,11 +355,15 @@ class Compiler:
             raise ValueError(f"{impl_name} is not a registered gate implementation of {gate_name}.")
 
         locus_str = "__".join(locus)
+        paths = []
         for param, value in params.items():
             path = f"gates.{gate_name}.{impl_name}.{locus_str}.{param}"
             self._calibration_set[path] = value
+            paths.append(path)
+        # the calibration set no longer matches the one stored under the id
+        self.calibration_set_id = None
 
-        self._refresh()
+        self._refresh(paths)
 
     def add_implementation(
         self,
@@ -423,6 +461,7 @@ class Compiler:
         """
         return {
             "calibration_set": self._calibration_set,
+            "calibration_set_id": self.calibration_set_id,
             "builder": self.builder,
             "component_mapping": self.component_mapping,
             "options": self.options,
@@ -515,6 +554,7 @@ class Compiler:
             circuit_metrics = context["circuit_metrics"]
             options = context["options"]
             custom_settings = context.get("custom_settings")
+            calibration_set_id = context.get("calibration_set_id")
         except Exception as exc:
             raise InsufficientContextError(f"Missing context data for building settings: {exc}") from exc
 
@@ -524,6 +564,7 @@ class Compiler:
             builder=builder,
             circuit_metrics=circuit_metrics,
             options=options,
+            calibration_set_id=calibration_set_id,
         )
         # if custom_settings are given, use them to override similarly named generated settings
         if custom_settings is not None:
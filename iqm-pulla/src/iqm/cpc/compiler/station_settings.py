@@ -70,6 +70,7 @@ the station.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Collection, Iterable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -77,7 +78,7 @@ from typing import TYPE_CHECKING
 from exa.common.data.parameter import CollectionType, DataType, Parameter, Setting
 from exa.common.data.setting_node import SettingNode
 from iqm.cpc.compiler.errors import CalibrationError
-from iqm.pulla.interface import CalibrationSet
+from iqm.pulla.interface import CalibrationSet, CalibrationSetId
 
 if TYPE_CHECKING:
     from exa.common.data.value import ObservationValue
@@ -302,6 +303,59 @@ _per_qpu_repetitions = (
 )
 
 
+@dataclass(frozen=True)
+class QPUElements:
+    """QPU elements for which station settings are built.
+
+    Together with a calibration set id, the elements identify a cached station settings template,
+    see :func:`build_station_settings_cached`.
+    """
+
+    circuit_qubits: frozenset[str]
+    """physical qubit names used in the circuit"""
+    circuit_couplers: frozenset[str]
+    """coupler names used in the circuit"""
+    measured_probe_lines: frozenset[str]
+    """probe line names used in the measurements"""
+    boundary_qubits: frozenset[str]
+    """physical qubits connected to the boundary_couplers but not in circuit_qubits"""
+    boundary_couplers: frozenset[str]
+    """coupler names of couplers connected to the circuit boundary but not in circuit_couplers"""
+    flux_pulsed_qubits: frozenset[str]
+    """names of qubits that have flux pulse capability"""
+
+
+SettingsTemplateKey = tuple[CalibrationSetId, QPUElements]
+"""Calibration set id and QPU elements, identifying a station settings template."""
+
+SETTINGS_TEMPLATE_CACHE_SIZE = 32
+"""Maximum number of station settings templates kept in :data:`_settings_template_cache`."""
+
+_settings_template_cache: OrderedDict[SettingsTemplateKey, SettingNode] = OrderedDict()
+"""Station settings trees built by :func:`build_station_settings_cached`, in least recently used order.
+The per-job values (:data:`_per_qpu_repetitions`) are patched into a copy of the template on every cache hit."""
+
+
+def clear_settings_template_cache() -> None:
+    """Remove all the cached station settings templates."""
+    _settings_template_cache.clear()
+
+
+def _copy_tree_structure(node: SettingNode) -> SettingNode:
+    """Copy the structure of a settings tree, sharing the immutable :class:`.Setting` objects with ``node``.
+
+    Replacing a setting in the copy does not affect ``node``, so this is a cheap copy-on-write
+    alternative to a deep copy of the tree.
+    """
+    return node.model_copy(
+        update={
+            "settings": dict(node.settings),
+            "subtrees": {key: _copy_tree_structure(child) for key, child in node.subtrees.items()},
+        },
+        deep=False,
+    )
+
+
 def _apply_static_settings(component: str, settings: dict[Parameter, ObservationValue], node: SettingNode) -> None:
     """Add the given static settings to the given settings tree for the given component."""
     for base_param, value in settings.items():
@@ -392,3 +446,57 @@ def build_station_settings(
         _create_and_add_setting(par.name, par, shots, root)
 
     return root
+
+
+def build_station_settings_cached(
+    *,
+    elements: QPUElements,
+    shots: int,
+    calibration_set: CalibrationSet,
+    calibration_set_id: CalibrationSetId | None = None,
+) -> SettingNode:
+    """Build the station settings like :func:`build_station_settings`, reusing cached settings trees.
+
+    If ``calibration_set_id`` is given, the settings tree is cached as a template keyed by the id and
+    ``elements``. Later calls with the same key skip building the tree, and only patch the number of shots
+    into a copy-on-write copy of the template. ``calibration_set_id`` must thus only be given if
+    ``calibration_set`` is the unmodified calibration set with that id.
+
+    Args:
+        elements: QPU elements for which the settings are built
+        shots: number of times to repeat each circuit's execution
+        calibration_set: calibration set as a mapping from observation paths to observation values
+        calibration_set_id: id of ``calibration_set``, or ``None`` if it is not known,
+            in which case the settings are not cached
+
+    Returns:
+        station settings tree
+
+    """
+
+    def build() -> SettingNode:
+        return build_station_settings(
+            circuit_qubits=elements.circuit_qubits,
+            circuit_couplers=elements.circuit_couplers,
+            measured_probe_lines=elements.measured_probe_lines,
+            shots=shots,
+            calibration_set=calibration_set,
+            boundary_qubits=elements.boundary_qubits,
+            boundary_couplers=elements.boundary_couplers,
+            flux_pulsed_qubits=elements.flux_pulsed_qubits,
+        )
+
+    if calibration_set_id is None:
+        return build()
+
+    key: SettingsTemplateKey = (calibration_set_id, elements)
+    if (template := _settings_template_cache.get(key)) is None:
+        template = _settings_template_cache[key] = build()
+        if len(_settings_template_cache) > SETTINGS_TEMPLATE_CACHE_SIZE:
+            _settings_template_cache.popitem(last=False)
+    else:
+        _settings_template_cache.move_to_end(key)
+    root = _copy_tree_structure(template)
+    for par in _per_qpu_repetitions:
+        _create_and_add_setting(par.name, par, shots, root)
+    return root
@@ -14,7 +14,9 @@
 
 """Pulse level access library for IQM's circuit-to-pulse compiler and Station Control API."""
 
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from importlib.metadata import version
 import logging
 import platform
@@ -109,6 +111,7 @@ class Pulla:
         self,
         calibration_set: CalibrationSet | None = None,
         circuit_execution_options: CircuitExecutionOptions | dict | None = None,
+        calibration_set_id: CalibrationSetId | None = None,
     ) -> Compiler:
         """Returns a new instance of the compiler with the default calibration set and standard stages.
 
@@ -117,6 +120,8 @@ class Pulla:
             circuit_execution_options: circuit execution options to use for the compiler. If a CircuitExecutionOptions
                 object is provided, the compiler use it as is. If a dict is provided, the default values will be
                 overridden for the present keys in that dict. If left ``None``, the default options will be used.
+            calibration_set_id: ID of ``calibration_set``, if known. Lets the compiler cache the station settings
+                it builds. Ignored if ``calibration_set`` is None, since the id of the default calibration set is used.
 
         Returns:
             The compiler object.
@@ -128,8 +133,11 @@ class Pulla:
             circuit_execution_options = CircuitExecutionOptions(
                 **STANDARD_CIRCUIT_EXECUTION_OPTIONS_DICT | circuit_execution_options  # type: ignore
             )
+        if calibration_set is None:
+            calibration_set, calibration_set_id = self.fetch_latest_calibration_set()
         return Compiler(
-            calibration_set=calibration_set or self.fetch_latest_calibration_set()[0],
+            calibration_set=calibration_set,
+            calibration_set_id=calibration_set_id,
             chip_topology=self._chip_topology,
             channel_properties=self._channel_properties,
             component_channels=self._component_channels,
@@ -252,6 +260,87 @@ class Pulla:
         else:
             return StationControlResult(sweep_id=job_id, task_id=job_id, status=TaskStatus.PENDING)
 
+    def execute_pipelined(
+        self,
+        compiler: Compiler,
+        circuit_batches: Iterable[Iterable[Any]],
+        shots: int,
+        *,
+        max_in_flight: int = 2,
+        ordered: bool = True,
+        poll_interval: float = 1.0,
+    ) -> Iterator[tuple[int, StationControlResult]]:
+        """Compiles and executes a stream of circuit batches, overlapping compilation with execution.
+
+        While the jobs of earlier batches wait in the queue, execute, and have their results fetched and decoded
+        in background threads, the next batch is compiled and submitted, which keeps the queue of the quantum computer
+        fed. At most ``max_in_flight`` jobs are submitted but not yet consumed by the caller at any time.
+        If the iteration is interrupted, e.g. by an exception or by closing the generator,
+        the jobs that are still in flight are aborted.
+
+        Args:
+            compiler: Compiler used to compile the batches and build their settings.
+            circuit_batches: Batches of circuits to compile and execute, one job per batch. May be a lazy iterable.
+            shots: Number of times to execute each circuit.
+            max_in_flight: Maximum number of submitted jobs whose results have not been yielded yet.
+            ordered: If True, the results are yielded in the order of ``circuit_batches``,
+                otherwise in the order in which the jobs complete.
+            poll_interval: Time between job status queries, in seconds.
+
+        Yields:
+            Index of the batch in ``circuit_batches``, and its execution result.
+
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be positive, got {max_in_flight}.")
+
+        in_flight: deque[tuple[int, uuid.UUID, Future[StationControlResult]]] = deque()
+
+        def pop_finished() -> tuple[int, uuid.UUID, Future[StationControlResult]]:
+            if not ordered:
+                wait([future for _, _, future in in_flight], return_when=FIRST_COMPLETED)
+                finished = next(job for job in in_flight if job[2].done())
+                in_flight.remove(finished)
+                return finished
+            return in_flight.popleft()
+
+        executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="pulla-pipeline")
+        try:
+            for index, circuits in enumerate(circuit_batches):
+                playlist, context = compiler.compile(circuits)
+                settings, context = compiler.build_settings(context, shots=shots)
+                while len(in_flight) >= max_in_flight:
+                    finished_index, _, future = pop_finished()
+                    yield finished_index, future.result()
+
+                job_id = self.execute(playlist, context, settings, verbose=False, wait_completion=False).sweep_id
+                future = executor.submit(self._poll_execution_result, job_id, context, poll_interval)
+                in_flight.append((index, job_id, future))
+
+            while in_flight:
+                finished_index, _, future = pop_finished()
+                yield finished_index, future.result()
+        finally:
+            for _, job_id, future in in_flight:
+                if not future.done():
+                    logger.info("Revoking job %s", job_id)
+                    self._station_control.abort_job(job_id)
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _poll_execution_result(
+        self, job_id: uuid.UUID, context: dict[str, Any], poll_interval: float
+    ) -> StationControlResult:
+        """Wait for the job to finish without blocking other jobs, and fetch its result.
+
+        Unlike :meth:`get_execution_result` with ``wait_completion=True``, does not display a progress bar,
+        so it can be called from several threads at once.
+        """
+        while True:
+            sc_result = self.get_execution_result(job_id, context, verbose=False, wait_completion=False)
+            if sc_result.status in (TaskStatus.READY, TaskStatus.FAILED):
+                return sc_result
+            time.sleep(poll_interval)
+
     def get_execution_result(
         self,
         job_id: uuid.UUID,
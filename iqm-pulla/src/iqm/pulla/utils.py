@@ -15,9 +15,11 @@
 """Utility functions for IQM Pulla."""
 
 from collections import namedtuple
-from collections.abc import Hashable, Iterable, Sequence, Set
+from collections.abc import Hashable, Iterable, Set
 from dataclasses import replace
+from functools import lru_cache
 from itertools import chain
+import sys
 from typing import Any
 
 import numpy as np
@@ -26,7 +28,7 @@ from exa.common.data.setting_node import SettingNode
 from exa.common.data.value import ObservationValue
 from exa.common.qcm_data.chip_topology import ChipTopology
 from iqm.cpc.compiler.errors import CalibrationError, InsufficientContextError, UnknownCircuitExecutionOptionError
-from iqm.cpc.compiler.station_settings import build_station_settings
+from iqm.cpc.compiler.station_settings import QPUElements, build_station_settings_cached
 from iqm.cpc.interface.compiler import Circuit as CPC_Circuit
 from iqm.cpc.interface.compiler import (
     CircuitBoundaryMode,
@@ -35,9 +37,9 @@ from iqm.cpc.interface.compiler import (
     HeraldingMode,
     ReadoutMappingBatch,
 )
-from iqm.pulla.interface import HERALDING_KEY, CalibrationSet, CircuitMeasurementResultsBatch
+from iqm.pulla.interface import HERALDING_KEY, CalibrationSet, CalibrationSetId, CircuitMeasurementResultsBatch
 from iqm.pulse.builder import CircuitOperation, ScheduleBuilder, build_quantum_ops
-from iqm.pulse.gate_implementation import CompositeGate, OpCalibrationDataTree
+from iqm.pulse.gate_implementation import CompositeGate, Locus, OpCalibrationDataTree
 from iqm.pulse.playlist.channel import ChannelProperties
 from iqm.pulse.playlist.instructions import Instruction
 from iqm.pulse.playlist.schedule import Schedule, Segment
@@ -393,38 +395,93 @@ def get_hash_for(circuit: CPC_Circuit) -> int:
     return hash(str_repr)
 
 
-def calset_to_cal_data_tree(calibration_set: CalibrationSet) -> OpCalibrationDataTree:
+@lru_cache(maxsize=10000)
+def _parse_locus(locus_str: str) -> Locus:
+    """Convert a locus string used in observation names into an interned locus tuple."""
+    return tuple(sys.intern(component) for component in locus_str.split(LOCUS_SEPARATOR)) if locus_str else ()
+
+
+@lru_cache(maxsize=100000)
+def _parse_gate_observation_name(name: str) -> tuple[str, str, Locus, tuple[str, ...]] | None:
+    """Split a calibration observation name into the corresponding calibration data tree path.
+
+    The results are cached, and all the path components and loci are interned, so that calibration sets
+    with the same observation names share the keys of their calibration data trees.
+
+    Args:
+        name: dotted calibration observation name
+
+    Returns:
+        operation name, implementation name, locus, and the parameter path within the locus node,
+        or ``None`` if ``name`` is not a gate calibration observation
+
+    Raises:
+        CalibrationError: ``name`` is a malformed gate calibration observation name
+
+    """
+    path = name.split(".")
+    if path[0] != "gates":
+        return None
+    if len(path) < 5:
+        raise CalibrationError(f"Calibration observation name '{name}' is malformed.")
+    # treat the locus specially
+    return sys.intern(path[1]), sys.intern(path[2]), _parse_locus(path[3]), tuple(sys.intern(p) for p in path[4:])
+
+
+def calset_to_cal_data_tree(
+    calibration_set: CalibrationSet,
+    observation_names: Iterable[str] | None = None,
+) -> OpCalibrationDataTree:
     """Build an iqm-pulse QuantumOp calibration data tree from a calibration set.
 
     Splits the dotted observation names that are prefixed with "gates." into the corresponding
     calibration data tree paths.
-    """
 
-    def set_path(node: dict[Hashable, Any], path: Sequence[Hashable], value: Any) -> None:
-        """Insert ``value`` into the tree ``node``, at the location given by ``path``.
+    Args:
+        calibration_set: calibration data
+        observation_names: If given, only these observations of ``calibration_set`` are converted,
+            which produces a partial calibration data tree suitable for :meth:`.ScheduleBuilder.inject_calibration`.
+            By default all the observations are converted.
 
-        Modifies ``node``.
-        """
-        if len(path) == 1:
-            node[path[0]] = value
-            return
-        # recurse into a subnode
-        set_path(node.setdefault(path[0], {}), path[1:], value)
+    Returns:
+        calibration data tree
+
+    """
+    if observation_names is None:
+        items: Iterable[tuple[str, Any]] = calibration_set.items()
+    else:
+        items = ((name, calibration_set[name]) for name in observation_names)
 
     tree: OpCalibrationDataTree = {}
-    for key, value in calibration_set.items():
-        path = key.split(".")
-        if path[0] == "gates":
-            if len(path) < 5:
-                raise CalibrationError(f"Calibration observation name '{key}' is malformed.")
-            # treat the locus specially
-            locus = tuple(path[3].split(LOCUS_SEPARATOR))
-            locus = () if locus == ("",) else locus
-            # mypy likes this
-            set_path(tree.setdefault(path[1], {}).setdefault(path[2], {}).setdefault(locus, {}), path[4:], value)  # type: ignore[arg-type]
+    for key, value in items:
+        if (parsed := _parse_gate_observation_name(key)) is None:
+            continue
+        op_name, impl_name, locus, param_path = parsed
+        node: dict[Hashable, Any] = tree.setdefault(op_name, {}).setdefault(impl_name, {}).setdefault(locus, {})
+        for name in param_path[:-1]:
+            node = node.setdefault(name, {})
+        node[param_path[-1]] = value
     return tree
 
 
+def _changed_observations(old: CalibrationSet, new: CalibrationSet) -> set[str] | None:
+    """Names of the observations in ``new`` that are missing from ``old`` or have a different value.
+
+    Returns:
+        names of the changed observations, or ``None`` if some observations of ``old`` are missing from ``new``
+
+    """
+    if old.keys() - new.keys():
+        return None
+
+    def values_differ(a: Any, b: Any) -> bool:
+        if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+            return not np.array_equal(a, b)
+        return a != b
+
+    return {name for name, value in new.items() if name not in old or values_differ(old[name], value)}
+
+
 def initialize_schedule_builder(
     calibration_set: CalibrationSet,
     chip_topology: ChipTopology,
@@ -532,6 +589,7 @@ def build_settings(
     circuit_metrics: Iterable[CircuitMetrics],
     *,
     options: CircuitExecutionOptions,
+    calibration_set_id: CalibrationSetId | None = None,
 ) -> SettingNode:
     """Construct the Station Control settings needed for executing a batch of quantum circuits.
 
@@ -541,6 +599,8 @@ def build_settings(
         builder: schedule builder object, encapsulating station properties and gate calibration data
         circuit_metrics: statistics about the circuits to be executed
         options: various discrete options for circuit execution that affect compilation
+        calibration_set_id: id of ``calibration_set`` if it is unmodified, used for caching the settings,
+            see :func:`.build_station_settings_cached`
 
     Returns:
         Station Control settings
@@ -571,21 +631,25 @@ def build_settings(
         circuit_couplers_set,
         device,
     )
-    settings = build_station_settings(
-        circuit_qubits=circuit_components_set & device.qubits,
-        circuit_couplers=circuit_couplers_set,
+    elements = QPUElements(
+        circuit_qubits=frozenset(circuit_components_set & device.qubits),
+        circuit_couplers=frozenset(circuit_couplers_set),
         # always turn all probe lines on, since figuring out exactly which lines we need for a batch
         # of circuits is needlessly complicated and usually would yield a small benefit
-        measured_probe_lines=device.probe_lines,
-        shots=shots,
-        calibration_set=calibration_set,
-        boundary_qubits=boundary_components & device.qubits,
-        boundary_couplers=boundary_couplers,
-        flux_pulsed_qubits=[
+        measured_probe_lines=frozenset(device.probe_lines),
+        boundary_qubits=frozenset(boundary_components & device.qubits),
+        boundary_couplers=frozenset(boundary_couplers),
+        flux_pulsed_qubits=frozenset(
             component
             for component, functions in builder.component_channels.items()
             if "flux" in functions and component in device.qubits
-        ],
+        ),
+    )
+    settings = build_station_settings_cached(
+        elements=elements,
+        shots=shots,
+        calibration_set=calibration_set,
+        calibration_set_id=calibration_set_id,
     )
 
     return settings
@@ -106,6 +106,7 @@ def qiskit_to_pulla(
     # create a compiler containing all the required station information
     compiler = pulla.get_standard_compiler(
         calibration_set=pulla.fetch_calibration_set_by_id(run_request.calibration_set_id),
+        calibration_set_id=run_request.calibration_set_id,
     )
     compiler.component_mapping = (
         None
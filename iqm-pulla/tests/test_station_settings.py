@@ -0,0 +1,166 @@
+# Copyright 2025 IQM
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the station settings template cache."""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from iqm.cpc.compiler import station_settings
+from iqm.cpc.compiler.station_settings import (
+    SETTINGS_TEMPLATE_CACHE_SIZE,
+    QPUElements,
+    build_station_settings,
+    build_station_settings_cached,
+    clear_settings_template_cache,
+)
+
+CALIBRATION_SET = {
+    "controllers.QB1.flux.voltage": 0.1,
+    "controllers.QB1.drive.frequency": 4.0e9,
+    "controllers.QB2.flux.voltage": 0.2,
+    "controllers.QB2.drive.frequency": 4.1e9,
+    "controllers.TC-1-2.flux.voltage": 0.3,
+    "controllers.PL-1.readout.center_frequency": 6.0e9,
+    "controllers.options.end_delay": 1e-4,
+}
+
+
+def qpu_elements(circuit_qubits: set[str], circuit_couplers: set[str] = frozenset()) -> QPUElements:
+    """QPU elements of a circuit on the given qubits of a two-qubit chip with flux-pulsed qubits."""
+    boundary_qubits = {"QB1", "QB2"} - circuit_qubits if circuit_couplers else set()
+    return QPUElements(
+        circuit_qubits=frozenset(circuit_qubits),
+        circuit_couplers=frozenset(circuit_couplers),
+        measured_probe_lines=frozenset({"PL-1"}),
+        boundary_qubits=frozenset(boundary_qubits),
+        boundary_couplers=frozenset({"TC-1-2"} - circuit_couplers),
+        flux_pulsed_qubits=frozenset({"QB1", "QB2"}),
+    )
+
+
+def uncached_settings(elements: QPUElements, shots: int):
+    """Station settings built from scratch."""
+    return build_station_settings(
+        circuit_qubits=elements.circuit_qubits,
+        circuit_couplers=elements.circuit_couplers,
+        measured_probe_lines=elements.measured_probe_lines,
+        shots=shots,
+        calibration_set=CALIBRATION_SET,
+        boundary_qubits=elements.boundary_qubits,
+        boundary_couplers=elements.boundary_couplers,
+        flux_pulsed_qubits=elements.flux_pulsed_qubits,
+    )
+
+
+@pytest.fixture
+def build_spy():
+    """Empty template cache, and a spy counting the station settings trees that are built from scratch."""
+    clear_settings_template_cache()
+    with patch.object(station_settings, "build_station_settings", wraps=build_station_settings) as spy:
+        yield spy
+    clear_settings_template_cache()
+
+
+def test_cache_hit_patches_shots(build_spy):
+    elements = qpu_elements({"QB1"})
+    calibration_set_id = uuid4()
+    first = build_station_settings_cached(
+        elements=elements, shots=100, calibration_set=CALIBRATION_SET, calibration_set_id=calibration_set_id
+    )
+    second = build_station_settings_cached(
+        elements=elements, shots=200, calibration_set=CALIBRATION_SET, calibration_set_id=calibration_set_id
+    )
+    assert build_spy.call_count == 1
+    assert first == uncached_settings(elements, 100)
+    assert second == uncached_settings(elements, 200)
+    assert second["options.averaging_bins"].value == 200
+    assert second["options.playlist_repeats"].value == 200
+
+
+def test_no_caching_without_calibration_set_id(build_spy):
+    elements = qpu_elements({"QB1"})
+    for _ in range(2):
+        build_station_settings_cached(elements=elements, shots=100, calibration_set=CALIBRATION_SET)
+    assert build_spy.call_count == 2
+
+
+def test_separate_entries_for_qpu_elements(build_spy):
+    calibration_set_id = uuid4()
+    layouts = [qpu_elements({"QB1"}), qpu_elements({"QB2"}), qpu_elements({"QB1", "QB2"}, {"TC-1-2"})]
+    results = [
+        build_station_settings_cached(
+            elements=elements, shots=100, calibration_set=CALIBRATION_SET, calibration_set_id=calibration_set_id
+        )
+        for elements in layouts
+    ]
+    assert build_spy.call_count == 3
+    for elements, result in zip(layouts, results):
+        assert result == uncached_settings(elements, 100)
+    assert results[0] != results[1]
+
+    # every layout is now served from its own template, and another calibration set is a separate entry
+    for elements, result in zip(layouts, results):
+        assert (
+            build_station_settings_cached(
+                elements=elements, shots=100, calibration_set=CALIBRATION_SET, calibration_set_id=calibration_set_id
+            )
+            == result
+        )
+    assert build_spy.call_count == 3
+    build_station_settings_cached(
+        elements=layouts[0], shots=100, calibration_set=CALIBRATION_SET, calibration_set_id=uuid4()
+    )
+    assert build_spy.call_count == 4
+
+
+def test_least_recently_used_template_is_evicted(build_spy):
+    elements = qpu_elements({"QB1"})
+    calibration_set_ids = [uuid4() for _ in range(SETTINGS_TEMPLATE_CACHE_SIZE + 1)]
+
+    def build(calibration_set_id):
+        build_station_settings_cached(
+            elements=elements, shots=100, calibration_set=CALIBRATION_SET, calibration_set_id=calibration_set_id
+        )
+
+    for calibration_set_id in calibration_set_ids[:-1]:
+        build(calibration_set_id)
+    # using the oldest template makes the second oldest the least recently used one
+    build(calibration_set_ids[0])
+    build(calibration_set_ids[-1])
+    assert build_spy.call_count == SETTINGS_TEMPLATE_CACHE_SIZE + 1
+
+    build(calibration_set_ids[0])
+    assert build_spy.call_count == SETTINGS_TEMPLATE_CACHE_SIZE + 1
+    build(calibration_set_ids[1])
+    assert build_spy.call_count == SETTINGS_TEMPLATE_CACHE_SIZE + 2
+
+
+def test_modifying_returned_settings_keeps_template(build_spy):
+    elements = qpu_elements({"QB1", "QB2"}, {"TC-1-2"})
+    calibration_set_id = uuid4()
+    settings = build_station_settings_cached(
+        elements=elements, shots=100, calibration_set=CALIBRATION_SET, calibration_set_id=calibration_set_id
+    )
+    settings["QB1__drive.frequency"] = settings["QB1__drive.frequency"].update(5.0e9)
+    settings["options.end_delay"] = settings["options.end_delay"].update(1.0)
+    del settings.subtrees["QB2__flux"]
+
+    settings = build_station_settings_cached(
+        elements=elements, shots=100, calibration_set=CALIBRATION_SET, calibration_set_id=calibration_set_id
+    )
+    assert build_spy.call_count == 1
+    assert settings == uncached_settings(elements, 100)
+    assert settings["QB1__drive.frequency"].value == 4.0e9
@@ -427,9 +427,11 @@ class ScheduleBuilder:
         Args:
             partial_calibration: data to be injected. Must have the same structure as :attr:`calibration` but does not
                 have to contain all operations/implementations/loci/values. Only the parts of the data that are
-                found will be merged into :attr:`calibration` (including any ``None`` values). :attr:`_cache` will
-                be invalidated for the found operations/implementations/loci and only if the new calibration data
-                actually differs from the previous.
+                found will be merged into :attr:`calibration` (including any ``None`` values), creating any missing
+                operation/implementation/locus nodes. :attr:`_cache` will be invalidated for the found
+                operations/implementations/loci and only if the new calibration data actually differs from the
+                previous. Changing the default calibration data (the empty locus) invalidates all the loci of the
+                implementation.
 
         """
         # composite gates are always flushed (though we could only flush the ones whose member gate cal is changed!)
@@ -437,35 +439,61 @@ class ScheduleBuilder:
         # merge the calibration changes
         for op, op_data in partial_calibration.items():
             for impl, impl_data in op_data.items():
+                impl_calibration = self.calibration.setdefault(op, {}).setdefault(impl, {})
                 for locus, locus_data in impl_data.items():
-                    prev_calibration = self.calibration[op][impl][locus]
+                    prev_calibration = impl_calibration.get(locus, {})
                     new_calibration = merge_dicts(prev_calibration, locus_data)
-                    self.calibration[op][impl][locus] = new_calibration
+                    impl_calibration[locus] = new_calibration
                     if (
                         op in self._cache
                         and impl in self._cache[op]
-                        and locus in self._cache[op][impl]
                         and _dicts_differ(prev_calibration, new_calibration)
                     ):
-                        # invalidate only the affected GateImplementations
-                        del self._cache[op][impl][locus]
-                        if self.op_table[op].factorizable:
+                        impl_cache = self._cache[op][impl]
+                        if not locus:
+                            # the default calibration data affects all the loci
+                            impl_cache.clear()
+                        elif self.op_table[op].factorizable:
                             # factorizable ops only have cal data for single-component loci,
                             # but we also need to flush all loci that include the single-component locus
                             locus_component = locus[0]
                             # dict size cannot change while you iterate over it, hence the list of keys
-                            for cached_locus in list(self._cache[op][impl]):
-                                if locus_component in set(cached_locus):
-                                    del self._cache[op][impl][cached_locus]
+                            for cached_locus in list(impl_cache):
+                                if locus_component in cached_locus:
+                                    del impl_cache[cached_locus]
+                        else:
+                            # invalidate only the affected GateImplementations
+                            impl_cache.pop(locus, None)
 
-    def validate_calibration(self) -> None:
+    def validate_calibration(self, partial_calibration: OpCalibrationDataTree | None = None) -> None:
         """Check that the calibration data matches the known quantum operations.
 
+        Args:
+            partial_calibration: If given, only the operations/implementations/loci found in it are validated,
+                using their current data in :attr:`calibration`. Typically the same data that was given to
+                :meth:`inject_calibration`. By default all of :attr:`calibration` is validated.
+
         Raises:
             ValueError: there is something wrong with the calibration data
 
         """
-        validate_op_calibration(self.calibration, self.op_table)
+        if partial_calibration is None:
+            validate_op_calibration(self.calibration, self.op_table)
+            return
+
+        calibration: OpCalibrationDataTree = {}
+        for op, op_data in partial_calibration.items():
+            for impl, impl_data in op_data.items():
+                impl_calibration = self.calibration.get(op, {}).get(impl, {})
+                if () in impl_data:
+                    # the default calibration data is merged into every locus
+                    loci = impl_calibration
+                else:
+                    loci = {locus: impl_calibration[locus] for locus in impl_data if locus in impl_calibration}
+                    if () in impl_calibration:
+                        loci[()] = impl_calibration[()]
+                calibration.setdefault(op, {})[impl] = loci
+        validate_op_calibration(calibration, self.op_table)
 
     def get_drive_channel(self, component: str) -> str:
         """Drive channel for the given QPU component.
@@ -42,10 +42,58 @@ Example:
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from itertools import product
 
 from dimod.typing import Variable
 from dimod.variables import Variables
+import numpy as np
+
+
+def _bitstrings_to_array(bit_strs: Sequence[str] | np.ndarray, num_bits: int) -> np.ndarray:
+    """Decodes bitstrings into a matrix of bits.
+
+    Args:
+        bit_strs: The bitstrings, all of length ``num_bits``. Alternatively, a matrix of bits with one row per
+            bitstring, which is only validated.
+        num_bits: The number of bits in each bitstring.
+
+    Returns:
+        A :class:`~numpy.ndarray` of type ``uint8`` with one row per bitstring and one column per bit.
+
+    Raises:
+        ValueError: If the bitstrings contain other characters than 0 and 1 or have the wrong length.
+
+    """
+    if isinstance(bit_strs, np.ndarray):
+        if bit_strs.shape[1:] != (num_bits,):
+            raise ValueError(f"All bitstrings need to have length {num_bits}.")
+        bits = bit_strs.astype(np.uint8, copy=False)
+        if np.any(bits != bit_strs) or np.any(bits > 1):
+            raise ValueError("The bitstrings may only contain the characters '0' and '1'.")
+        return bits
+    joined = "".join(bit_strs).encode("ascii")
+    if len(joined) != len(bit_strs) * num_bits:
+        raise ValueError(f"All bitstrings need to have length {num_bits}.")
+    bits = np.frombuffer(joined, dtype=np.uint8).reshape(len(bit_strs), num_bits) - ord("0")
+    if np.any(bits > 1):
+        raise ValueError("The bitstrings may only contain the characters '0' and '1'.")
+    return bits
+
+
+def _array_to_bitstrings(bits: np.ndarray) -> list[str]:
+    """Encodes a matrix of bits into bitstrings, the inverse of :func:`_bitstrings_to_array`.
+
+    Args:
+        bits: A :class:`~numpy.ndarray` of zeros and ones with one row per bitstring and one column per bit.
+
+    Returns:
+        The list of bitstrings, one for each row of ``bits``.
+
+    """
+    num_bits = bits.shape[1]
+    joined = (np.asarray(bits, dtype=np.uint8) + ord("0")).tobytes().decode("ascii")
+    return [joined[i : i + num_bits] for i in range(0, len(joined), num_bits)]
 
 
 class ProblemInstance(ABC):
@@ -85,6 +133,24 @@ class ProblemInstance(ABC):
 
         """
 
+    def qualities(self, bit_strs: Sequence[str] | np.ndarray) -> np.ndarray:
+        """Accepts a sequence of bitstrings and returns their qualities / energies as an array.
+
+        The default implementation calls :meth:`quality` for each bitstring. Subclasses may override it with a more
+        efficient batched calculation.
+
+        Args:
+            bit_strs: The bitstrings representing solution candidates. Alternatively, a matrix of bits with one row per
+                bitstring, such as the one returned by :meth:`~iqm.qaoa.backends.SamplerRandomBitstrings.sample_array`.
+
+        Returns:
+            A :class:`~numpy.ndarray` of the qualities of the bitstrings, in the same order.
+
+        """
+        if isinstance(bit_strs, np.ndarray):
+            bit_strs = _array_to_bitstrings(_bitstrings_to_array(bit_strs, self.dim))
+        return np.array([self.quality(bit_str) for bit_str in bit_strs], dtype=float)
+
     def fix_variables(self, variables: list[Variable] | dict[Variable, int]) -> None:
         """Fixes (assigns) some of the problem variables.
 
@@ -228,14 +294,11 @@ class ProblemInstance(ABC):
             ValueError: If the number of measurements in ``counts`` is 0 (e.g., if it's an empty dictionary).
 
         """
-        avg_quality: float = 0
-        number_of_measurements = 0
-        for bin_str, counter in counts.items():
-            avg_quality += self.quality(bin_str) * counter
-            number_of_measurements += counter
+        weights = np.fromiter(counts.values(), dtype=float, count=len(counts))
+        number_of_measurements = weights.sum()
         if number_of_measurements == 0:
             raise ValueError("There are no counts. The quality can't be averaged.")
-        return avg_quality / number_of_measurements
+        return float(self.qualities(list(counts)) @ weights / number_of_measurements)
 
     def average_quality_renormalized(self, counts: dict[str, int]) -> float:
         """Accepts a dictionary and returns the renormalized quality of the keys weighted by their values.
@@ -325,12 +388,28 @@ class ProblemInstance(ABC):
 
         return best_bitstring
 
+    def local_bitflip_bitstrings(self, bit_strs: Sequence[str]) -> list[str]:
+        """Replace each of the bitstrings with its lowest-energy unit-Hamming-distance neighbor.
+
+        By default, this calls :meth:`local_bitflip_bitstring` for each bitstring, but subclasses may override it with
+        a faster implementation that processes all bitstrings at once.
+
+        Args:
+            bit_strs: The bitstrings to be replaced by their lowest-energy unit Hamming distance neighbors.
+
+        Returns:
+            The list of replaced bitstrings, in the same order as ``bit_strs``.
+
+        """
+        return [self.local_bitflip_bitstring(bit_str) for bit_str in bit_strs]
+
     def local_bitflip_postprocessing(self, counts: dict[str, int]) -> dict[str, int]:
         r"""Postprocessing method for checking a unit Hamming distance neighborhood of the dictionary of counts.
 
         When implemented naively, the time complexity of this scales cubically :math:`\mathcal{O}(n^3)` in the number
-        of variables (linear from iterating over them and quadratic from calculating the energy), but some computation
-        might be saved in the calculation of the energy because it's repeatedly calculated for very similar bitstrings.
+        of variables (linear from iterating over them and quadratic from calculating the energy). All unique bitstrings
+        are therefore passed to :meth:`local_bitflip_bitstrings` together, which subclasses may implement faster, e.g.,
+        by calculating the energy changes of all single bit flips at once.
 
         .. warning::
            The bitstrings in the `counts` need to be ordered the same way as the variables of the problem. If you're
@@ -346,8 +425,8 @@ class ProblemInstance(ABC):
 
         """
         new_counts: dict[str, int] = {}
-        for bit_str, count in counts.items():
-            new_bit_str = self.local_bitflip_bitstring(bit_str)
+        new_bit_strs = self.local_bitflip_bitstrings(list(counts))
+        for new_bit_str, count in zip(new_bit_strs, counts.values(), strict=True):
             if new_bit_str in new_counts:
                 new_counts[new_bit_str] += count
             else:
@@ -382,25 +461,50 @@ class ProblemInstance(ABC):
             ValueError: If the quantile is not between 0 and 1 (included).
 
         """
-        if not 0 <= quantile <= 1:
-            raise ValueError("The quantile has to be a number between 0 and 1 (included).")
+        bit_strs, selected, selected_counts, _ = self._select_percentile(counts, quantile, best_percentile)
+        return {bit_strs[index]: int(count) for index, count in zip(selected, selected_counts, strict=True)}
 
-        total_counts = sum(counts.values())
-        to_select = int(total_counts * quantile)  # The number of counts to be included in ``selected_counts``.
+    def _select_percentile(
+        self, counts: dict[str, int], quantile: float, best_percentile: bool
+    ) -> tuple[list[str], np.ndarray, np.ndarray, np.ndarray]:
+        """Selects the best / worst ``quantile`` of ``counts``, see :meth:`percentile_counts`.
 
-        list_of_bitstrings = list(counts.keys())
-        sorted_bitstrings = sorted(list_of_bitstrings, key=self.quality, reverse=not best_percentile)
+        The qualities of all bitstrings are calculated at once by :meth:`qualities` and the bitstrings are stably
+        sorted by them. The selected bitstrings are then found from the cumulative sum of their counts.
 
-        selected_counts: dict[str, int] = {}
-        # Iterate over all bitstrings (sorted) and keep adding them to ``selected_counts`` as long as needed.
-        for bitstring in sorted_bitstrings:
-            if sum(selected_counts.values()) + counts[bitstring] >= to_select:
-                if to_select - sum(selected_counts.values()) > 0:
-                    selected_counts[bitstring] = to_select - sum(selected_counts.values())
-                break
-            selected_counts[bitstring] = counts[bitstring]
+        Args:
+            counts: The input dictionary of counts.
+            quantile: The quantile of counts to be selected.
+            best_percentile: Whether the "best" (lowest quality) or the "worst" (highest) bitstrings should be selected.
 
-        return selected_counts
+        Returns:
+            The list of all bitstrings of ``counts``, the indices of the selected bitstrings in it (in the sorted
+            order), their (possibly truncated) counts and their qualities.
+
+        Raises:
+            ValueError: If the quantile is not between 0 and 1 (included).
+
+        """
+        if not 0 <= quantile <= 1:
+            raise ValueError("The quantile has to be a number between 0 and 1 (included).")
+
+        bit_strs = list(counts)
+        weights = np.fromiter(counts.values(), dtype=np.int64, count=len(bit_strs))
+        to_select = int(int(weights.sum()) * quantile)  # The number of counts to be selected.
+
+        qualities = self.qualities(bit_strs)
+        order = np.argsort(qualities if best_percentile else -qualities, kind="stable")
+        cumulative_counts = np.cumsum(weights[order])
+        # The first bitstring (in the sorted order) whose counts reach ``to_select`` is the last one to be selected ...
+        last = int(np.searchsorted(cumulative_counts, to_select))
+        selected = order[: last + 1]
+        selected_counts = weights[selected]
+        # ... and only with the counts that are still missing, if any.
+        if last < len(order):
+            selected_counts[-1] = to_select - (cumulative_counts[last - 1] if last > 0 else 0)
+            if selected_counts[-1] <= 0:
+                selected, selected_counts = selected[:-1], selected_counts[:-1]
+        return bit_strs, selected, selected_counts, qualities[selected]
 
     def cvar(self, counts: dict[str, int], quantile: float = 0.05) -> float:
         """Calculates the Conditional Value at Risk (CVaR) of the given dictionary of counts at the given quantile.
@@ -422,4 +526,8 @@ class ProblemInstance(ABC):
             The CVaR of the counts.
 
         """
-        return self.average_quality_counts(self.percentile_counts(counts, quantile, True))
+        _, _, selected_counts, selected_qualities = self._select_percentile(counts, quantile, True)
+        number_of_measurements = selected_counts.sum()
+        if number_of_measurements == 0:
+            raise ValueError("There are no counts. The quality can't be averaged.")
+        return float(selected_qualities @ selected_counts / number_of_measurements)
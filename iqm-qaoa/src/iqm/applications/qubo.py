@@ -44,6 +44,7 @@ Example:
 
 """
 
+from collections.abc import Sequence
 from itertools import product
 
 from dimod import BinaryQuadraticModel, ConstrainedQuadraticModel, to_networkx_graph
@@ -51,10 +52,54 @@ from dimod.sym import Sense
 from dimod.typing import Variable
 from dimod.utilities import new_variable_label
 from dimod.vartypes import VartypeLike
-from iqm.applications.applications import ProblemInstance
+from iqm.applications.applications import ProblemInstance, _array_to_bitstrings, _bitstrings_to_array
 from iqm.applications.graph_utils import EDGE_ATTR_PRIORITY, NODE_ATTR_PRIORITY, _get_attr_with_priority
 import networkx as nx
 import numpy as np
+from scipy import sparse
+
+# The number of variables whose assignments are enumerated together as one block in :func:`_brute_force_qubo`.
+_BRUTE_FORCE_BLOCK_BITS = 16
+
+
+def _brute_force_qubo(bqm: BinaryQuadraticModel) -> tuple[float, float, float]:
+    """Calculates the lowest, highest and average energy of a binary ``bqm`` over all assignments of its variables.
+
+    The assignments of the first (up to) :data:`_BRUTE_FORCE_BLOCK_BITS` variables are enumerated together as one
+    block, whose energies are calculated with array operations. The assignments of the remaining variables are walked
+    in Gray-code order, so that only one variable changes between consecutive blocks. The energies of the block are
+    then updated incrementally, using one row of the interaction matrix per flip.
+
+    Args:
+        bqm: A :class:`~dimod.BinaryQuadraticModel` with binary variables.
+
+    Returns:
+        The lowest energy, the highest energy and the average energy.
+
+    """
+    linear, (row, col, quadratic), offset = bqm.to_numpy_vectors()
+    num_vars = len(linear)
+    interactions = np.zeros((num_vars, num_vars))
+    np.add.at(interactions, (row, col), quadratic)
+    interactions += interactions.T  # Symmetric, so that the energy is ``x @ linear + x @ interactions @ x / 2``.
+
+    block_bits = min(num_vars, _BRUTE_FORCE_BLOCK_BITS)
+    block = ((np.arange(2**block_bits)[:, np.newaxis] >> np.arange(block_bits)) & 1).astype(float)
+    block_interactions = interactions[:block_bits, :block_bits]
+    energies = block @ linear[:block_bits] + np.einsum("ij,ij->i", block @ block_interactions, block) / 2 + offset
+    # The change of the block energies caused by each of the remaining variables being set to 1.
+    cross_terms = block @ interactions[:block_bits, block_bits:]
+
+    rest = np.zeros(num_vars - block_bits)
+    lowest, highest, total = energies.min(), energies.max(), energies.sum()
+    for step in range(1, 2 ** (num_vars - block_bits)):
+        flip = (step & -step).bit_length() - 1  # The variable flipped between Gray codes ``step - 1`` and ``step``.
+        sign = 1.0 - 2.0 * rest[flip]
+        var = block_bits + flip
+        energies += sign * (linear[var] + interactions[var, block_bits:] @ rest + cross_terms[:, flip])
+        rest[flip] = 1.0 - rest[flip]
+        lowest, highest, total = min(lowest, energies.min()), max(highest, energies.max()), total + energies.sum()
+    return float(lowest), float(highest), float(total / 2**num_vars)
 
 
 class QUBOInstance(ProblemInstance):
@@ -209,6 +254,79 @@ class QUBOInstance(ProblemInstance):
         energy = self._bqm.energy(sol_vector)
         return float(energy)
 
+    def qualities(self, bit_strs: Sequence[str] | np.ndarray) -> np.ndarray:
+        r"""Accepts a sequence of bitstrings and returns their qualities / energies as an array.
+
+        All bitstrings are decoded into one matrix :math:`X` of bits, whose energies are calculated at once as
+        :math:`X h + \mathrm{diag}(X Q X^T) + c` with the local fields :math:`h`, the sparse matrix of interactions
+        :math:`Q` and the offset :math:`c` of :attr:`bqm`.
+
+        Args:
+            bit_strs: The bitstrings whose qualities are being calculated. Alternatively, a matrix of bits with one row
+                per bitstring.
+
+        Returns:
+            A :class:`~numpy.ndarray` of the energies of the input bitstrings.
+
+        """
+        bits = _bitstrings_to_array(bit_strs, self.dim)
+        # Like in :meth:`quality`, the i-th bit is the value of the variable labelled by i.
+        linear, (row, col, quadratic), offset = self._bqm.to_numpy_vectors(variable_order=range(self.dim))
+        interactions = sparse.csr_array((quadratic, (row, col)), shape=(self.dim, self.dim))
+        return bits @ linear + np.einsum("ij,ij->i", bits @ interactions, bits) + offset
+
+    def local_bitflip_bitstrings(self, bit_strs: Sequence[str]) -> list[str]:
+        r"""Replace each of the bitstrings with its lowest-energy unit-Hamming-distance neighbor.
+
+        Instead of re-evaluating the energy of every neighbor, the energy changes of flipping each of the bits are
+        calculated at once as :math:`\Delta_i = (1 - 2 x_i) (h_i + \sum_j J_{ij} x_j)` with the local fields :math:`h`
+        and the symmetric sparse matrix of interactions :math:`J`. All bitstrings are processed together as one matrix.
+
+        Args:
+            bit_strs: The bitstrings to be replaced by their lowest-energy unit Hamming distance neighbors.
+
+        Returns:
+            The list of replaced bitstrings, in the same order as ``bit_strs``.
+
+        """
+        bits = _bitstrings_to_array(bit_strs, self.dim)
+        linear, (row, col, quadratic), _ = self._bqm.to_numpy_vectors(variable_order=range(self.dim))
+        interactions = sparse.csr_array((quadratic, (row, col)), shape=(self.dim, self.dim))
+        deltas = (1.0 - 2.0 * bits) * (bits @ (interactions + interactions.T) + linear)
+        # Like in :meth:`local_bitflip_bitstring`, a bit is flipped only if that strictly lowers the energy.
+        best_flips = np.argmin(deltas, axis=1)
+        improved = np.flatnonzero(deltas[np.arange(len(bits)), best_flips] < 0)
+        bits[improved, best_flips[improved]] ^= 1
+        return _array_to_bitstrings(bits)
+
+    def initialize_properties(self, max_size: int | None = 30) -> None:
+        """The initialization method for upper/lower bound of the cost function and its average/best value.
+
+        This is the method from the parent class :class:`~iqm.applications.applications.ProblemInstance`, overridden
+        to use the QUBO structure of the cost function. The assignments are enumerated in blocks with energies updated
+        incrementally along a Gray code, which makes problem sizes up to around 30 feasible.
+
+        Args:
+            max_size: The maximum size of problems for which the properties may be calculated.
+
+        Raises:
+            ValueError: If :meth:`initialize_properties` was called on a :class:`QUBOInstance` object with dimension
+                larger than ``max_size``.
+
+        """
+        if max_size is not None and self.dim > max_size:
+            raise ValueError(
+                f"The problem dimension {self.dim} exceeds the maximum of {max_size}. For large dimensions (>30),"
+                f" the brute force approach of ``initialize_properties`` may be too slow. Change the ``max_size``"
+                f" parameter or set it to ``None`` to bypass this error."
+            )
+
+        lower_bound, upper_bound, average_quality = _brute_force_qubo(self._bqm)
+        self._upper_bound = upper_bound
+        self._lower_bound = lower_bound
+        self._average_quality = average_quality
+        self._best_quality = lower_bound
+
 
 class ConstrainedQuadraticInstance(ProblemInstance):
     """A class for constrainted quadratic binary problems.
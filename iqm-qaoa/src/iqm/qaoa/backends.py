@@ -24,10 +24,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 from typing import TYPE_CHECKING, Any
 import warnings
 
+import networkx as nx
 import numpy as np
 from qiskit.providers import BackendV2
 from qiskit.quantum_info import Statevector
@@ -38,12 +40,16 @@ with warnings.catch_warnings():
     warnings.filterwarnings("ignore", category=UserWarning)
     import quimb as qu
 
-from iqm.qaoa.circuits import qiskit_circuit, quimb_tn, transpiled_circuit
+from iqm.applications.applications import _array_to_bitstrings
+from iqm.qaoa.circuits import parametrized_transpiled_circuit, qiskit_circuit, quimb_tn
 from iqm.qaoa.transforming_functions import ham_graph_to_ham_operator
 from iqm.qiskit_iqm.iqm_provider import IQMProvider
 
 if TYPE_CHECKING:
     from iqm.qaoa.qubo_qaoa import QUBOQAOA
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import ParameterVector
+    import quimb.tensor as qtn
 
 
 class EstimatorBackend(ABC):
@@ -65,6 +71,73 @@ class EstimatorBackend(ABC):
 
         """
 
+    #: Whether the estimator implements :meth:`estimate_gradient` analytically.
+    provides_gradient: bool = False
+
+    def estimate_batch(
+        self, qaoa_object: QUBOQAOA, angles: np.ndarray, num_workers: int = 1, **kwargs: Any
+    ) -> np.ndarray:
+        """Estimates the expected value of the Hamiltonian for several sets of angles.
+
+        The default implementation calls :meth:`estimate` once for every set of angles, either sequentially or, if
+        ``num_workers`` is larger than 1, in a pool of processes. Estimators which can evaluate many sets of angles at
+        once (e.g., vectorized over the angles) override this method. The angles of ``qaoa_object`` are left unchanged.
+
+        Args:
+            qaoa_object: The :class:`~iqm.qaoa.qubo_qaoa.QUBOQAOA` object whose energy is to be estimated.
+            angles: A 2-dimensional :class:`~numpy.ndarray` whose rows are sets of angles in the format of
+                :attr:`~iqm.qaoa.generic_qaoa.QAOA.angles`.
+            num_workers: The number of processes to distribute the estimations over.
+            **kwargs: The keyword arguments to pass to :meth:`estimate`.
+
+        Returns:
+            A 1-dimensional :class:`~numpy.ndarray` of the estimated expected values, one for each row of ``angles``.
+
+        """
+        angles = np.atleast_2d(np.asarray(angles, dtype=float))
+        if num_workers > 1 and len(angles) > 1:
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                energies = executor.map(
+                    _estimate_with_angles,
+                    repeat(self),
+                    repeat(qaoa_object),
+                    angles,
+                    repeat(kwargs),
+                    chunksize=max(1, len(angles) // num_workers),
+                )
+                return np.fromiter(energies, dtype=float, count=len(angles))
+        return np.array([_estimate_with_angles(self, qaoa_object, row, kwargs) for row in angles], dtype=float)
+
+    def estimate_with_gradient(self, qaoa_object: QUBOQAOA) -> tuple[float, np.ndarray]:
+        """Estimates the expected value together with its gradient with respect to the angles.
+
+        Only available for estimators with :attr:`provides_gradient` set.
+
+        Args:
+            qaoa_object: The :class:`~iqm.qaoa.qubo_qaoa.QUBOQAOA` object whose energy is to be estimated.
+
+        Returns:
+            The estimated expected value of the Hamiltonian and its gradient with respect to
+            :attr:`~iqm.qaoa.generic_qaoa.QAOA.angles` as a :class:`~numpy.ndarray` of the same length as the angles.
+
+        Raises:
+            NotImplementedError: If the estimator doesn't provide an analytic gradient.
+
+        """
+        raise NotImplementedError(f"{type(self).__name__} doesn't provide an analytic gradient.")
+
+
+def _estimate_with_angles(
+    estimator: EstimatorBackend, qaoa_object: QUBOQAOA, angles: np.ndarray, kwargs: dict[str, Any]
+) -> float:
+    """Calls ``estimator.estimate`` with the angles of ``qaoa_object`` temporarily replaced by ``angles``."""
+    original_angles = qaoa_object._angles
+    qaoa_object._angles = np.asarray(angles, dtype=float)
+    try:
+        return estimator.estimate(qaoa_object, **kwargs)
+    finally:
+        qaoa_object._angles = original_angles
+
 
 class SamplerBackend(ABC):
     """The :class:`~abc.ABC` for sampler backends, i.e., those returning samples from the QAOA."""
@@ -94,6 +167,8 @@ class EstimatorSingleLayer(EstimatorBackend):
         The function calculates the energy (exp. val. of the Hamiltonian) by adding the expectation values
         of its individual terms expressed through equation (12) in :cite:`Ozaeta_2020`.
         The calculation includes a constant term (coming from the translation of a QUBO problem to a Hamiltonian).
+        All terms are evaluated at once from :attr:`~iqm.qaoa.qubo_qaoa.QUBOQAOA.sparse_couplings`, computing
+        the products of cosines over neighborhoods as sums of logarithms.
 
         Args:
             qaoa_object: The instance of :class:`~iqm.qaoa.qubo_qaoa.QUBOQAOA` whose expectation value is to be
@@ -108,82 +183,245 @@ class EstimatorSingleLayer(EstimatorBackend):
         """
         if qaoa_object.num_layers != 1:
             raise ValueError(f"The number of layers is not 1, but {qaoa_object.num_layers}")
-        energy = 0  # To be incremented by the exp. val. of the individual terms in the two following "for" loops.
-        g = qaoa_object.angles[0]  # variable gamma
-        b = qaoa_object.angles[1]  # variable beta
-        for node in qaoa_object.bqm.variables:
-            hi = qaoa_object.bqm.get_linear(node)
-            nn = {x[0] for x in qaoa_object.bqm.iter_neighborhood(node)}  # The set of nearest neighbours of "node".
-            prod_cos = 1
-            for n in nn:
-                prod_cos *= np.cos(
-                    2 * g * qaoa_object.bqm.get_quadratic(node, n)
-                )  # The product in the formula for expval_ci.
-            expval_ci = hi * np.sin(2 * b) * np.sin(2 * g * hi) * prod_cos
-            energy += expval_ci
-
-        for i, j in qaoa_object.bqm.quadratic:
-            hi = qaoa_object.bqm.get_linear(i)
-            hj = qaoa_object.bqm.get_linear(j)
-            jij = qaoa_object.bqm.get_quadratic(i, j)
-
-            # NN = nearest neighbours
-            nn_i = {x[0] for x in qaoa_object.bqm.iter_neighborhood(i)} - {j}  # The NN of i, excluding j
-            nn_j = {x[0] for x in qaoa_object.bqm.iter_neighborhood(j)} - {i}  # The NN of j, excluding i
-            nn_only_i = nn_i - nn_j - {j}  # The nodes which are NN of i, but not NN of j (or j itself)
-            nn_only_j = nn_j - nn_i - {i}  # The nodes which are NN of j, but not NN of i (or i itself)
-            nn_both = nn_j - nn_only_j  # The nodes which are NN of both i and j
-
-            prod_nn_i = np.prod(
-                [np.cos(2 * g * qaoa_object.bqm.get_quadratic(i, k)) for k in nn_i]
-            )  # The first product on the first line of expval_cij formula
-            prod_nn_j = np.prod(
-                [np.cos(2 * g * qaoa_object.bqm.get_quadratic(j, k)) for k in nn_j]
-            )  # The second product on the first line of expval_cij formula
-
-            prod_only_i = np.prod(
-                [np.cos(2 * g * qaoa_object.bqm.get_quadratic(i, k)) for k in nn_only_i]
-            )  # The first product on the second line of expval_cij formula
-            prod_only_j = np.prod(
-                [np.cos(2 * g * qaoa_object.bqm.get_quadratic(j, k)) for k in nn_only_j]
-            )  # The second product on the second line of expval_cij formula
-
-            prod_both_plus = np.prod(
-                [
-                    np.cos(2 * g * (qaoa_object.bqm.get_quadratic(i, k) + qaoa_object.bqm.get_quadratic(j, k)))
-                    for k in nn_both
-                ]
-            )  # The first product on the last line of expval_cij formula
-            prod_both_minus = np.prod(
-                [
-                    np.cos(2 * g * (qaoa_object.bqm.get_quadratic(i, k) - qaoa_object.bqm.get_quadratic(j, k)))
-                    for k in nn_both
-                ]
-            )  # The second product on the last line of expval_cij formula
-
-            # The entire first line of the expval_cij formula
-            first_part = (
-                0.5
-                * jij
-                * np.sin(4 * b)
-                * np.sin(2 * g * jij)
-                * (np.cos(2 * g * hi) * prod_nn_i + np.cos(2 * g * hj) * prod_nn_j)
-            )
-            factor1 = (
-                1 / 2 * jij * np.sin(2 * b) ** 2 * prod_only_i * prod_only_j
-            )  # The entire second line of the expval_cij formula
-            factor2 = (
-                np.cos(2 * g * (hi + hj)) * prod_both_plus - np.cos(2 * g * (hi - hj)) * prod_both_minus
-            )  # The entire last line of the expval_cij formula
-            second_part = factor1 * factor2
-
-            expval_cij = (
-                first_part - second_part
-            )  # The expval_cij formula is the difference of the 1st line and the product of the 2nd and 3rd line
-            energy += expval_cij
+        energies, _ = self._energies_and_gradients(qaoa_object, qaoa_object.angles[np.newaxis, :])
+        return float(energies[0])
+
+    provides_gradient = True
+
+    def estimate_batch(
+        self, qaoa_object: QUBOQAOA, angles: np.ndarray, num_workers: int = 1, **kwargs: Any
+    ) -> np.ndarray:
+        """Calculates the expectation value of the Hamiltonian for :math:`p=1` QAOA for several sets of angles.
+
+        All sets of angles are evaluated at once with array operations, see :meth:`estimate`.
+
+        Args:
+            qaoa_object: The instance of :class:`~iqm.qaoa.qubo_qaoa.QUBOQAOA` whose expectation value is to be
+                calculated.
+            angles: A 2-dimensional :class:`~numpy.ndarray` whose rows are pairs of angles ``[gamma, beta]``.
+            num_workers: Unused, since the evaluation is vectorized.
+            **kwargs: Unused.
+
+        Returns:
+            A 1-dimensional :class:`~numpy.ndarray` of the expectation values, one for each row of ``angles``.
+
+        Raises:
+            ValueError: If the provided :class:`~iqm.qaoa.qubo_qaoa.QUBOQAOA` object has more than 1 layer.
+
+        """
+        if qaoa_object.num_layers != 1:
+            raise ValueError(f"The number of layers is not 1, but {qaoa_object.num_layers}")
+        energies, _ = self._energies_and_gradients(qaoa_object, np.atleast_2d(np.asarray(angles, dtype=float)))
+        return energies
+
+    def estimate_with_gradient(self, qaoa_object: QUBOQAOA) -> tuple[float, np.ndarray]:
+        """Calculates the expectation value together with its analytic gradient with respect to ``[gamma, beta]``.
+
+        Args:
+            qaoa_object: The instance of :class:`~iqm.qaoa.qubo_qaoa.QUBOQAOA` whose expectation value is to be
+                calculated.
+
+        Returns:
+            The expectation value and its derivatives with respect to gamma and beta as a :class:`~numpy.ndarray`.
+
+        Raises:
+            ValueError: If the provided :class:`~iqm.qaoa.qubo_qaoa.QUBOQAOA` object has more than 1 layer.
+
+        """
+        if qaoa_object.num_layers != 1:
+            raise ValueError(f"The number of layers is not 1, but {qaoa_object.num_layers}")
+        energies, gradients = self._energies_and_gradients(qaoa_object, qaoa_object.angles[np.newaxis, :])
+        return float(energies[0]), gradients[0]
+
+    @staticmethod
+    def _energies_and_gradients(qaoa_object: QUBOQAOA, angles: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Evaluates equation (12) of :cite:`Ozaeta_2020` and its gradient for all rows of ``angles`` at once.
+
+        Every array below has one row per set of angles and one column per node, edge or triangle. Each cosine factor
+        is carried together with its derivative with respect to gamma, see :func:`_log_factors`.
+
+        Args:
+            qaoa_object: The instance of :class:`~iqm.qaoa.qubo_qaoa.QUBOQAOA` whose energy is to be calculated.
+            angles: A 2-dimensional :class:`~numpy.ndarray` whose rows are pairs of angles ``[gamma, beta]``.
+
+        Returns:
+            The energies, and the gradients with respect to ``[gamma, beta]`` as rows of a 2-dimensional array.
+
+        """
+        g = angles[:, :1]  # variable gamma
+        b = angles[:, 1:2]  # variable beta
+        couplings = qaoa_object.sparse_couplings
+        h = couplings.local_fields
+        rows, cols, jij = couplings.edge_rows, couplings.edge_cols, couplings.edge_weights
+        hi, hj = h[rows], h[cols]
+        num_edges = len(jij)
+
+        # The products of cosines over the neighbors of each node, as sums of logarithms over the edges of the node.
+        edge_cos, edge_dcos = _cos_with_derivative(g, jij)
+        edge_logs = _log_factors(edge_cos, edge_dcos)
+        node_logs = _grouped_log_factors(
+            np.concatenate([edge_cos, edge_cos], axis=1),
+            np.concatenate([edge_dcos, edge_dcos], axis=1),
+            np.concatenate([rows, cols]),
+            len(h),
+        )
+
+        # The exp. val. of the individual terms h_i Z_i, i.e. the expval_ci formula
+        prod_cos, dprod_cos = _product_from_logs(node_logs)
+        sin_h, cos_h = np.sin(2 * g * h), np.cos(2 * g * h)
+        energy = np.sum(h * np.sin(2 * b) * sin_h * prod_cos, axis=1)
+        denergy_dg = np.sum(h * np.sin(2 * b) * (2 * h * cos_h * prod_cos + sin_h * dprod_cos), axis=1)
+        denergy_db = np.sum(2 * h * np.cos(2 * b) * sin_h * prod_cos, axis=1)
+
+        # The products over the NN of i excluding j (and vice versa), obtained by removing the factor of the edge itself
+        nn_i_logs = node_logs[:, :, rows] - edge_logs
+        nn_j_logs = node_logs[:, :, cols] - edge_logs
+        prod_nn_i, dprod_nn_i = _product_from_logs(nn_i_logs)
+        prod_nn_j, dprod_nn_j = _product_from_logs(nn_j_logs)
+
+        # The products over the nodes k which are NN of both i and j, i.e. over the triangles containing the edge
+        tri_edges, jik, jjk = couplings.triangle_edges, couplings.triangle_row_weights, couplings.triangle_col_weights
+        both_i_logs = _grouped_log_factors(*_cos_with_derivative(g, jik), tri_edges, num_edges)
+        both_j_logs = _grouped_log_factors(*_cos_with_derivative(g, jjk), tri_edges, num_edges)
+        prod_both_plus, dprod_both_plus = _product_from_logs(
+            _grouped_log_factors(*_cos_with_derivative(g, jik + jjk), tri_edges, num_edges)
+        )
+        prod_both_minus, dprod_both_minus = _product_from_logs(
+            _grouped_log_factors(*_cos_with_derivative(g, jik - jjk), tri_edges, num_edges)
+        )
+
+        # The nodes which are NN of i, but not NN of j (or j itself), and vice versa
+        prod_only_i, dprod_only_i = _product_from_logs(nn_i_logs - both_i_logs)
+        prod_only_j, dprod_only_j = _product_from_logs(nn_j_logs - both_j_logs)
+
+        # The entire first line of the expval_cij formula, first_part = coeff_first * nn_part
+        sin_j, cos_j = np.sin(2 * g * jij), np.cos(2 * g * jij)
+        cos_hi, cos_hj = np.cos(2 * g * hi), np.cos(2 * g * hj)
+        nn_part = cos_hi * prod_nn_i + cos_hj * prod_nn_j
+        dnn_part = (
+            -2 * hi * np.sin(2 * g * hi) * prod_nn_i
+            + cos_hi * dprod_nn_i
+            - 2 * hj * np.sin(2 * g * hj) * prod_nn_j
+            + cos_hj * dprod_nn_j
+        )
+        first_part = 0.5 * jij * np.sin(4 * b) * sin_j * nn_part
+        dfirst_dg = 0.5 * jij * np.sin(4 * b) * (2 * jij * cos_j * nn_part + sin_j * dnn_part)
+        dfirst_db = 2 * jij * np.cos(4 * b) * sin_j * nn_part
+
+        # The second line of expval_cij is factor1 = 1/2 * jij * sin(2b)^2 * only_part, the last line is factor2
+        only_part = prod_only_i * prod_only_j
+        donly_part = dprod_only_i * prod_only_j + prod_only_i * dprod_only_j
+        cos_plus, cos_minus = np.cos(2 * g * (hi + hj)), np.cos(2 * g * (hi - hj))
+        factor2 = cos_plus * prod_both_plus - cos_minus * prod_both_minus
+        dfactor2 = (
+            -2 * (hi + hj) * np.sin(2 * g * (hi + hj)) * prod_both_plus
+            + cos_plus * dprod_both_plus
+            + 2 * (hi - hj) * np.sin(2 * g * (hi - hj)) * prod_both_minus
+            - cos_minus * dprod_both_minus
+        )
+        second_part = 1 / 2 * jij * np.sin(2 * b) ** 2 * only_part * factor2
+        dsecond_dg = 1 / 2 * jij * np.sin(2 * b) ** 2 * (donly_part * factor2 + only_part * dfactor2)
+        dsecond_db = jij * np.sin(4 * b) * only_part * factor2
+
+        # The expval_cij formula is the difference of the 1st line and the product of the 2nd and 3rd line
+        energy += np.sum(first_part - second_part, axis=1)
+        denergy_dg += np.sum(dfirst_dg - dsecond_dg, axis=1)
+        denergy_db += np.sum(dfirst_db - dsecond_db, axis=1)
 
         energy += qaoa_object.bqm.offset
-        return energy
+        return energy, np.stack([denergy_dg, denergy_db], axis=1)
+
+
+def _cos_with_derivative(g: np.ndarray, weights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Returns ``cos(2 * gamma * w)`` and its derivative with respect to gamma for all weights ``w``.
+
+    Args:
+        g: The gamma angles as a column array.
+        weights: A 1-dimensional array of weights.
+
+    Returns:
+        The cosines and their derivatives, with one row per gamma angle.
+
+    """
+    return np.cos(2 * g * weights), -2 * weights * np.sin(2 * g * weights)
+
+
+def _log_factors(values: np.ndarray, derivatives: np.ndarray) -> np.ndarray:
+    """Represents factors by their log-absolute values, signs and zeros, so that products become sums.
+
+    Together with each factor, its derivative is carried as a logarithmic derivative (for non-zero factors) or as is
+    (for zero factors), so that the derivatives of products can be recovered as well.
+
+    Args:
+        values: An array of factors.
+        derivatives: The derivatives of the factors.
+
+    Returns:
+        An array of shape ``(5, *values.shape)`` whose rows are the logarithms of the absolute values (0 for zero
+        factors), indicators of negative factors, indicators of zero factors, logarithmic derivatives of non-zero
+        factors and derivatives of zero factors.
+
+    """
+    is_zero = values == 0
+    safe_values = np.where(is_zero, 1.0, values)
+    return np.stack(
+        [
+            np.log(np.abs(safe_values)),
+            values < 0,
+            is_zero,
+            np.where(is_zero, 0.0, derivatives / safe_values),
+            np.where(is_zero, derivatives, 0.0),
+        ]
+    ).astype(float)
+
+
+def _grouped_log_factors(
+    values: np.ndarray, derivatives: np.ndarray, groups: np.ndarray, num_groups: int
+) -> np.ndarray:
+    """Sums the log-factor representations of ``values`` within groups of columns, see :func:`_log_factors`.
+
+    Args:
+        values: A 2-dimensional array of factors.
+        derivatives: The derivatives of the factors.
+        groups: The index of the group of each column.
+        num_groups: The number of groups.
+
+    Returns:
+        An array of shape ``(5, len(values), num_groups)`` representing the product of the factors of each group
+        in each row. Empty groups represent the empty product 1.
+
+    """
+    num_rows = len(values)
+    flat_groups = (groups + num_groups * np.arange(num_rows)[:, np.newaxis]).ravel()
+    return np.stack(
+        [
+            np.bincount(flat_groups, weights=factors.ravel(), minlength=num_rows * num_groups)
+            for factors in _log_factors(values, derivatives)
+        ]
+    ).reshape(5, num_rows, num_groups)
+
+
+def _product_from_logs(log_factors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Converts summed log-factor representations back to products and their derivatives, see :func:`_log_factors`.
+
+    Args:
+        log_factors: An array of summed log-factor representations, as returned by :func:`_grouped_log_factors`.
+
+    Returns:
+        The products and the derivatives of the products.
+
+    """
+    log_abs, negatives, zeros, log_derivatives, zero_derivatives = log_factors
+    num_zeros = np.rint(zeros)
+    nonzero_products = np.where(np.rint(negatives) % 2 == 1, -1.0, 1.0) * np.exp(log_abs)
+    products = np.where(num_zeros > 0, 0.0, nonzero_products)
+    # A product with a single vanishing factor has the derivative of that factor times the other factors
+    derivatives = np.where(
+        num_zeros == 0,
+        nonzero_products * log_derivatives,
+        np.where(num_zeros == 1, nonzero_products * zero_derivatives, 0.0),
+    )
+    return products, derivatives
 
 
 class EstimatorStateVector(EstimatorBackend):
@@ -266,17 +504,112 @@ class EstimatorFromSampler(EstimatorBackend):
 CRIT_DEG = 3  # The maximum degree for which QUIMB runs somewhat tolerably fast.
 
 
+def _light_cone_classes(qaoa_object: QUBOQAOA) -> list[tuple[tuple[int, ...], float]]:
+    """Groups the terms of the Hamiltonian of ``qaoa_object`` by the isomorphism class of their light cones.
+
+    The expectation value of a term depends only on the part of the Hamiltonian within distance ``num_layers`` of
+    the term's qubits. If these light cones of two terms are isomorphic (including the biases of the nodes and edges
+    and which nodes are measured), the two terms have the same expectation value, so it needs to be calculated only
+    once. This is common for problems on regular graphs. Terms with zero coefficient are left out.
+
+    Args:
+        qaoa_object: The :class:`~iqm.qaoa.qubo_qaoa.QUBOQAOA` object whose Hamiltonian terms are grouped.
+
+    Returns:
+        A list of pairs, one for each class. The first element is the qubits of a representative term of the class,
+        the second element is the sum of the coefficients of all terms in the class.
+
+    """
+    graph = qaoa_object.hamiltonian_graph
+    terms = [((q1, q2), bias) for (q1, q2), bias in qaoa_object.bqm.quadratic.items()]
+    terms += [((q1,), bias) for q1, bias in qaoa_object.bqm.linear.items()]
+    node_match = nx.algorithms.isomorphism.categorical_node_match("label", None)
+    edge_match = nx.algorithms.isomorphism.categorical_edge_match("bias", None)
+
+    classes: dict[str, list[list]] = {}
+    for where, coefficient in terms:
+        if coefficient == 0:
+            continue
+        nodes = set().union(
+            *(nx.single_source_shortest_path_length(graph, q, cutoff=qaoa_object.num_layers) for q in where)
+        )
+        light_cone = nx.Graph(graph.subgraph(nodes))
+        for q in light_cone:
+            light_cone.nodes[q]["label"] = (light_cone.nodes[q]["bias"], q in where)
+        candidates = classes.setdefault(
+            nx.weisfeiler_lehman_graph_hash(light_cone, node_attr="label", edge_attr="bias"), []
+        )
+        for candidate in candidates:
+            if nx.is_isomorphic(candidate[0], light_cone, node_match=node_match, edge_match=edge_match):
+                candidate[2] += coefficient
+                break
+        else:
+            candidates.append([light_cone, where, coefficient])
+    return [(where, coefficient) for candidates in classes.values() for _, where, coefficient in candidates]
+
+
+def _contraction_signature(tn: qtn.TensorNetwork) -> tuple:
+    """The structure of the full contraction of ``tn``, independent of the names of its indices."""
+    inputs, _, size_dict = tn.get_inputs_output_size_dict(output_inds=())
+    labels: dict[str, int] = {}
+    canonical_inputs = tuple(tuple(labels.setdefault(ind, len(labels)) for ind in term) for term in inputs)
+    return canonical_inputs, tuple(size_dict[ind] for ind in labels)
+
+
+def _quimb_expectations(
+    tn: qtn.Circuit, wheres: list[tuple[int, ...]], paths: dict[tuple, tuple]
+) -> list[tuple[complex, tuple, tuple]]:
+    """Calculates the expectation values of *Z* (or *ZZ*) on each of ``wheres`` in the circuit ``tn``.
+
+    The reverse-causal-cone tensor network of each term is simplified by :mod:`quimb` and then contracted with a path
+    from ``paths`` if one is known for its structure. Otherwise, a new path is searched for and added to ``paths``.
+
+    Args:
+        tn: The :mod:`quimb` circuit of the QAOA.
+        wheres: The qubits of the terms whose expectation values are calculated.
+        paths: The contraction paths keyed by :func:`_contraction_signature`, updated in-place.
+
+    Returns:
+        For each term, its expectation value, the signature of its tensor network and the contraction path used.
+
+    """
+    results = []
+    for where in wheres:
+        operator = qu.pauli("Z") if len(where) == 1 else qu.pauli("Z") & qu.pauli("Z")
+        rho = tn.local_expectation_tn(operator, where)
+        signature = _contraction_signature(rho)
+        if signature not in paths:
+            paths[signature] = tuple(rho.contraction_tree(output_inds=(), optimize="auto-hq").get_path())
+        value = rho.contract(all, output_inds=(), optimize=paths[signature])
+        results.append((value, signature, paths[signature]))
+    return results
+
+
 class EstimatorQUIMB(EstimatorBackend):
-    """The estimator class for calculating the expectation value using the tensor network package :mod:`quimb`."""
+    """The estimator class for calculating the expectation value using the tensor network package :mod:`quimb`.
+
+    Most of the time of the calculation is spent searching for contraction paths of the reverse-causal-cone tensor
+    networks. Since their structure doesn't depend on the angles, the paths are cached in the estimator and reused
+    in subsequent calls (e.g., during training). Terms whose light cones are isomorphic are calculated only once.
+
+    Args:
+        num_workers: The number of processes over which the calculation of the local expectation values is spread.
+
+    """
+
+    def __init__(self, num_workers: int = 1) -> None:
+        self.num_workers = num_workers
+        self._light_cone_cache: dict[tuple, list[tuple[tuple[int, ...], float]]] = {}
+        self._path_cache: dict[tuple, tuple] = {}
 
     def estimate(self, qaoa_object: QUBOQAOA) -> float:
         """Calculates the expectation value of the Hamiltonian by contracting the RCC tensor networks in :mod:`quimb`.
 
         Uses :func:`~iqm.qaoa.circuits.quimb_tn` to build a :class:`~quimb.tensor.circuit.Circuit`. This object
-        represents the QAOA circuit, so it can be used to calculate expectation values (using the function
-        :meth:`~quimb.tensor.circuit.Circuit.local_expectation`). The local expectation values are added to get
-        the expectation value of the full Hamiltonian. The calculation includes a constant term (coming from
-        the translation of a QUBO problem to a Hamiltonian).
+        represents the QAOA circuit, so it can be used to calculate local expectation values of the terms of
+        the Hamiltonian by contracting their reverse-causal-cone (RCC) tensor networks. The local expectation values
+        are added to get the expectation value of the full Hamiltonian. The calculation includes a constant term
+        (coming from the translation of a QUBO problem to a Hamiltonian).
 
         Args:
             qaoa_object: The instance of :class:`~iqm.qaoa.qubo_qaoa.QUBOQAOA` whose expectation value is to be
@@ -294,19 +627,37 @@ class EstimatorQUIMB(EstimatorBackend):
                 f"The average degree is higher than {CRIT_DEG}, the :mod:`quimb`-based estimator might be very slow.",
                 stacklevel=2,
             )
-        energy = 0
+        bqm = qaoa_object.bqm
+        key = (tuple(bqm.linear.items()), tuple(bqm.quadratic.items()), qaoa_object.num_layers)
+        if key not in self._light_cone_cache:
+            self._light_cone_cache[key] = _light_cone_classes(qaoa_object)
+        terms = self._light_cone_cache[key]
+        wheres = [where for where, _ in terms]
+
         tn = quimb_tn(qaoa_object)
-        for q1, q2 in qaoa_object.bqm.quadratic:
-            to_measure = qu.pauli("Z") & qu.pauli("Z")
-            energy += tn.local_expectation(to_measure, (q1, q2)) * qaoa_object.bqm.get_quadratic(q1, q2)
-        for q1 in qaoa_object.bqm.variables:
-            to_measure = qu.pauli("Z")
-            energy += tn.local_expectation(to_measure, (q1)) * qaoa_object.bqm.get_linear(q1)
-        return energy.real + qaoa_object.bqm.offset
+        if self.num_workers > 1 and len(wheres) > 1:
+            chunks = [wheres[i :: self.num_workers] for i in range(self.num_workers)]
+            with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+                chunk_results = executor.map(_quimb_expectations, repeat(tn), chunks, repeat(self._path_cache))
+                results = dict(zip(chain.from_iterable(chunks), chain.from_iterable(chunk_results), strict=True))
+            self._path_cache.update((signature, path) for _, signature, path in results.values())
+        else:
+            results = dict(zip(wheres, _quimb_expectations(tn, wheres, self._path_cache), strict=True))
+
+        energy = sum(coefficient * results[where][0] for where, coefficient in terms)
+        return float(np.real(energy)) + bqm.offset
 
 
 class SamplerRandomBitstrings(SamplerBackend):
-    """A sampler that ignores the QAOA and just produces random bitstrings of the correct length."""
+    """A sampler that ignores the QAOA and just produces random bitstrings of the correct length.
+
+    Args:
+        seed: Optional random seed for generating the bitstrings.
+
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        self._rng = np.random.default_rng(seed=seed)
 
     def sample(self, qaoa_object: QUBOQAOA, shots: int) -> dict[str, int]:
         """Produce random bitstrings to act as samples from the QAOA.
@@ -323,21 +674,79 @@ class SamplerRandomBitstrings(SamplerBackend):
             A dictionary whose keys are the produced random bitstrings and values their frequencies in the random set.
 
         """
-        counts: dict[str, int] = {}
-        for _ in range(shots):
-            bitstring = "".join(random.choice(["0", "1"]) for _ in range(qaoa_object.num_qubits))
-            if bitstring in counts:
-                counts[bitstring] += 1
-            else:
-                counts[bitstring] = 1
-        return counts
+        bits, counts = self.sample_array(qaoa_object, shots)
+        return dict(zip(_array_to_bitstrings(bits), counts.tolist(), strict=True))
+
+    def sample_array(self, qaoa_object: QUBOQAOA, shots: int) -> tuple[np.ndarray, np.ndarray]:
+        """Produce random bitstrings in a compact array form, without building the dictionary of counts.
+
+        The shots are generated as a matrix of random bytes, each packing 8 bits of a bitstring, whose unique rows
+        are then counted at once.
+
+        Args:
+            qaoa_object: The QAOA object, only used to get the number of qubits.
+            shots: The number of random strings to generate.
+
+        Returns:
+            A tuple of two :class:`~numpy.ndarray`. The first one has one row of bits for each unique produced
+            bitstring and can be passed directly to :meth:`~iqm.applications.applications.ProblemInstance.qualities`.
+            The second one contains the frequencies of these bitstrings.
+
+        """
+        num_qubits = qaoa_object.num_qubits
+        packed = self._rng.integers(0, 256, size=(shots, -(-num_qubits // 8)), dtype=np.uint8)
+        if num_qubits % 8:
+            # Clear the padding bits in the last byte, so that they don't affect the counting.
+            packed[:, -1] &= np.uint8((0xFF << (8 - num_qubits % 8)) & 0xFF)
+        unique_packed, counts = np.unique(packed, axis=0, return_counts=True)
+        return np.unpackbits(unique_packed, axis=1, count=num_qubits), counts
+
+
+def _bound_transpiled_circuit(
+    cache: dict[tuple, tuple[QuantumCircuit, ParameterVector, ParameterVector]],
+    qaoa_object: QUBOQAOA,
+    backend: BackendV2,
+    transpiler: str | None,
+    **kwargs: Any,
+) -> QuantumCircuit:
+    """Returns the transpiled QAOA circuit with the current angles of ``qaoa_object``, reusing cached transpilations.
+
+    The routing and transpilation of the circuit depend only on the problem, the number of layers, the transpiler and
+    its arguments, so they are done once with parametrized angles (see
+    :func:`~iqm.qaoa.circuits.parametrized_transpiled_circuit`). Subsequent calls only bind the angles.
+
+    Args:
+        cache: The dictionary of parametrized circuits of the sampler, which is updated in-place.
+        qaoa_object: The :class:`~iqm.qaoa.qubo_qaoa.QUBOQAOA` object whose circuit is needed.
+        backend: The backend that the circuit is to be run on.
+        transpiler: The transpiler used to build the circuit, see :func:`~iqm.qaoa.circuits.transpiled_circuit`.
+        **kwargs: Extra keyword arguments for constructing the transpiled circuit.
+
+    Returns:
+        The transpiled circuit with the angles of ``qaoa_object`` assigned.
+
+    """
+    bqm = qaoa_object.bqm
+    key = (
+        tuple(bqm.linear.items()),
+        tuple(bqm.quadratic.items()),
+        qaoa_object.num_layers,
+        transpiler,
+        repr(sorted(kwargs.items())),
+    )
+    if key not in cache:
+        cache[key] = parametrized_transpiled_circuit(qaoa_object, backend=backend, transpiler=transpiler, **kwargs)
+    qc, gammas, betas = cache[key]
+    # Parameters may be missing from the transpiled circuit if all gates depending on them were trivial.
+    return qc.assign_parameters({gammas: qaoa_object.gammas, betas: qaoa_object.betas}, strict=False)
 
 
 class SamplerSimulation(SamplerBackend):
     """A sampler that simulates the QAOA circuit in :mod:`qiskit`.
 
     Some simulators may need the circuit to be transpiled, so optionally a string describing the transpiler can be
-    provided.
+    provided. The transpiled circuit is cached with parametrized angles, so repeated sampling of the same problem
+    (e.g., during training) doesn't repeat the transpilation.
 
     Args:
         simulator: A simulator, (currently) assumed to be an object of class :class:`~qiskit_aer.AerSimulator`.
@@ -357,6 +766,7 @@ class SamplerSimulation(SamplerBackend):
             simulator = AerSimulator(method="statevector")
         self.simulator = simulator
         self.transpiler = transpiler
+        self._circuit_cache: dict[tuple, tuple[QuantumCircuit, ParameterVector, ParameterVector]] = {}
 
     def sample(self, qaoa_object: QUBOQAOA, shots: int, **kwargs: Any) -> dict[str, int]:
         """Samples from the QAOA using a simulation.
@@ -374,7 +784,9 @@ class SamplerSimulation(SamplerBackend):
             A dictionary whose keys are the measured bitstrings and values their frequencies in the results.
 
         """
-        qc = transpiled_circuit(qaoa_object, backend=self.simulator, transpiler=self.transpiler, **kwargs)
+        qc = _bound_transpiled_circuit(
+            self._circuit_cache, qaoa_object, backend=self.simulator, transpiler=self.transpiler, **kwargs
+        )
         job = self.simulator.run(qc, shots=shots)
         counts_from_job = job.result().get_counts()
         # Qiskit somehow reverses the order of the bitstrings.
@@ -389,7 +801,8 @@ class SamplerResonance(SamplerBackend):
         token: The API token to be used to connect to IQM Resonance.
         server_url: The URL to the quantum computer (defaults to Garnet).
         transpiler: The transpiling strategy to be used when building the quantum circuit for the QC. Defaults to
-            "SparseTranspiler"
+            "SparseTranspiler". The routed circuit is cached with parametrized angles, so it is built only once per
+            problem.
 
     """
 
@@ -402,13 +815,15 @@ class SamplerResonance(SamplerBackend):
         self.iqm_backend = IQMProvider(server_url, token=token).get_backend()
         self.token = token
         self.transpiler = transpiler
+        self._circuit_cache: dict[tuple, tuple[QuantumCircuit, ParameterVector, ParameterVector]] = {}
 
     def sample(self, qaoa_object: QUBOQAOA, shots: int, **kwargs: Any) -> dict[str, int]:
         """Samples from the QAOA on a quantum computer via IQM Resonance.
 
-        First, it creates a :class:`~qiskit.circuit.QuantumCircuit` (using a custom transpilation approach) and then
-        sends it to IQM Resonance. The dictionary of counts is obtained from `qiskit` and then the bitstrings are
-        **reversed**, so they don't use the `qiskit` convention of the first bit being on the right of the bitstring.
+        First, it creates a :class:`~qiskit.circuit.QuantumCircuit` (using a custom transpilation approach, cached
+        between calls) and then sends it to IQM Resonance. The dictionary of counts is obtained from `qiskit` and then
+        the bitstrings are **reversed**, so they don't use the `qiskit` convention of the first bit being on the right
+        of the bitstring.
 
         Args:
             qaoa_object: The :class:`~iqm.qaoa.generic_qaoa.QUBOQAOA` object, to be sampled from.
@@ -420,7 +835,9 @@ class SamplerResonance(SamplerBackend):
             A dictionary whose keys are the measured bitstrings and values their frequencies in the results.
 
         """
-        qc = transpiled_circuit(qaoa_object, backend=self.iqm_backend, transpiler=self.transpiler, **kwargs)
+        qc = _bound_transpiled_circuit(
+            self._circuit_cache, qaoa_object, backend=self.iqm_backend, transpiler=self.transpiler, **kwargs
+        )
         job = self.iqm_backend.run(qc, shots=shots)
         counts_from_job = job.result().get_counts()
         # Qiskit somehow reverses the order of the bitstrings.
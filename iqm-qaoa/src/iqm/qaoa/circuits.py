@@ -23,10 +23,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 import warnings
 
 from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.circuit import ParameterExpression, ParameterVector
 from qiskit.compiler.transpiler import transpile
 from qiskit.providers import BackendV2
 from qiskit_aer import AerSimulator
@@ -66,17 +68,41 @@ def qiskit_circuit(qaoa: QUBOQAOA, measurements: bool = True) -> QuantumCircuit:
     Returns:
         A quantum circuit corresponding to the QAOA, excluding any measurements.
 
+    """
+    return _qiskit_circuit_from_angles(qaoa, qaoa.gammas.tolist(), qaoa.betas.tolist(), measurements)
+
+
+def _qiskit_circuit_from_angles(
+    qaoa: QUBOQAOA,
+    gammas: Sequence[float | ParameterExpression],
+    betas: Sequence[float | ParameterExpression],
+    measurements: bool,
+) -> QuantumCircuit:
+    r"""Constructs the circuit of :func:`qiskit_circuit` with the given angles instead of those of ``qaoa``.
+
+    The angles may be :class:`~qiskit.circuit.Parameter`\s, in which case the circuit is parametrized.
+
+    Args:
+        qaoa: A :class:`~iqm.qaoa.qubo_qaoa.QUBOQAOA` object whose interaction strengths are used in the construction
+            of the :class:`~qiskit.circuit.QuantumCircuit`.
+        gammas: The angles of the phase separators, one per layer.
+        betas: The angles of the drivers, one per layer.
+        measurements: Should measurements be added at the end of the circuit?
+
+    Returns:
+        A quantum circuit corresponding to the QAOA.
+
     """
     qc = QuantumCircuit(qaoa.num_qubits)
     for qubit in range(qaoa.num_qubits):
         qc.h(qubit)
-    for p in range(qaoa.num_layers):
+    for gamma, beta in zip(gammas, betas, strict=True):
         for qubit in range(qaoa.num_qubits):
-            qc.rz(2 * qaoa.angles[2 * p] * qaoa.bqm.get_linear(qubit), qubit)
+            qc.rz(2 * gamma * qaoa.bqm.get_linear(qubit), qubit)
         for q1, q2 in qaoa.bqm.quadratic:
-            qc.rzz(2 * qaoa.angles[2 * p] * qaoa.bqm.get_quadratic(q1, q2), q1, q2)
+            qc.rzz(2 * gamma * qaoa.bqm.get_quadratic(q1, q2), q1, q2)
         for qubit in range(qaoa.num_qubits):
-            qc.rx(2 * qaoa.angles[2 * p + 1], qubit)
+            qc.rx(2 * beta, qubit)
     if measurements:
         qc.measure_all()
     return qc
@@ -190,6 +216,72 @@ def transpiled_circuit(
             ``None`` or "Default").
         ValueError: If the provided ``transpiler`` is not one of the allowed transpilers.
 
+    """
+    return _transpiled_circuit_from_angles(
+        qaoa, qaoa.gammas.tolist(), qaoa.betas.tolist(), backend=backend, transpiler=transpiler, **kwargs
+    )
+
+
+def parametrized_transpiled_circuit(
+    qaoa: QUBOQAOA,
+    backend: BackendV2 | None = None,
+    transpiler: str | None = None,
+    **kwargs: Any,
+) -> tuple[QuantumCircuit, ParameterVector, ParameterVector]:
+    """The function to return a parametrized :class:`~qiskit.circuit.QuantumCircuit` tailored to ``backend``.
+
+    The same as :func:`transpiled_circuit`, except that the QAOA angles are left as free parameters. The routing and
+    transpilation depend only on the problem and the ``backend``, so the returned circuit can be reused for any angles
+    by calling :meth:`~qiskit.circuit.QuantumCircuit.assign_parameters`.
+
+    Args:
+        qaoa: The :class:`~iqm.qaoa.qubo_qaoa.QUBOQAOA` object whose quantum circuit is constructed. Its angles
+            are not used, only its problem and number of layers.
+        backend: A backend that the circuit is to be run on.
+        transpiler: A string that describes which algorithm should be used for transpilation (if any), see
+            :func:`transpiled_circuit`.
+        **kwargs: Additional keyword arguments passed to :func:`~qiskit.provider.transpiler.transpile`, see
+            :func:`transpiled_circuit`.
+
+    Returns:
+        A parametrized quantum circuit transpiled to the topology of ``backend``, and the parameter vectors of its
+        gammas and betas.
+
+    """
+    gammas = ParameterVector("gamma", qaoa.num_layers)
+    betas = ParameterVector("beta", qaoa.num_layers)
+    qc = _transpiled_circuit_from_angles(
+        qaoa, list(gammas), list(betas), backend=backend, transpiler=transpiler, **kwargs
+    )
+    return qc, gammas, betas
+
+
+def _transpiled_circuit_from_angles(
+    qaoa: QUBOQAOA,
+    gammas: Sequence[float | ParameterExpression],
+    betas: Sequence[float | ParameterExpression],
+    backend: BackendV2 | None = None,
+    transpiler: str | None = None,
+    **kwargs: Any,
+) -> QuantumCircuit:
+    r"""Constructs the circuit of :func:`transpiled_circuit` with the given angles instead of those of ``qaoa``.
+
+    Args:
+        qaoa: The :class:`~iqm.qaoa.qubo_qaoa.QUBOQAOA` object whose quantum circuit is constructed.
+        gammas: The angles of the phase separators, one per layer. May be :class:`~qiskit.circuit.Parameter`\s.
+        betas: The angles of the drivers, one per layer. May be :class:`~qiskit.circuit.Parameter`\s.
+        backend: A backend that the circuit is to be run on.
+        transpiler: A string that describes which algorithm should be used for transpilation (if any).
+        **kwargs: Additional keyword arguments passed to :func:`~qiskit.provider.transpiler.transpile`.
+
+    Returns:
+        A quantum circuit transpiled to the topology of ``backend``.
+
+    Raises:
+        TypeError: If the ``backend`` is not an IQM backend and a custom ``transpiler`` is selected (i.e., other than
+            ``None`` or "Default").
+        ValueError: If the provided ``transpiler`` is not one of the allowed transpilers.
+
     """
     if backend is None:
         backend = AerSimulator(method="statevector")
@@ -198,11 +290,11 @@ def transpiled_circuit(
     if transpiler is None:
         if backend.coupling_map is not None:
             warnings.warn("The backend has a coupling map, but the circuit is not transpiled to it.", stacklevel=2)
-        return qiskit_circuit(qaoa, measurements=True)
+        return _qiskit_circuit_from_angles(qaoa, gammas, betas, measurements=True)
 
     # Use the default Qiskit transpilation
     if transpiler == "Default":
-        starting_circuit = qiskit_circuit(qaoa, measurements=True)
+        starting_circuit = _qiskit_circuit_from_angles(qaoa, gammas, betas, measurements=True)
         return transpile(starting_circuit, backend, **kwargs)
 
     if not isinstance(backend, IQMBackendBase):
@@ -212,7 +304,7 @@ def transpiled_circuit(
         # This `qpu` object is just a carrier of the QPU connectivity for `hardwired_router`.
         qpu = CrystalQPUFromBackend(backend)
         routed = hardwired_router(qaoa.bqm, qpu)
-        qc_hw = routed.build_qiskit(qaoa.betas.tolist(), qaoa.gammas.tolist())
+        qc_hw = routed.build_qiskit(list(betas), list(gammas))
 
         # Default layout method uses the VF2 algorithm to find an exact layout match.
         # An exact layout match is guaranteed to exist, so no further routing is needed.
@@ -230,7 +322,7 @@ def transpiled_circuit(
         # This `qpu` object is just a carrier of the QPU connectivity for `greedy_router`.
         qpu = CrystalQPUFromBackend(backend)
         routed = greedy_router(qaoa.bqm, qpu)
-        qc_sparse = routed.build_qiskit(qaoa.betas.tolist(), qaoa.gammas.tolist())
+        qc_sparse = routed.build_qiskit(list(betas), list(gammas))
 
         # Default layout method uses the VF2 algorithm to find an exact layout match.
         # An exact layout match is guaranteed to exist, so no further routing is needed.
@@ -248,7 +340,7 @@ def transpiled_circuit(
         # This `qpu` object is just a carrier of the QPU connectivity for `sn_router`.
         qpu = CrystalQPUFromBackend(backend)
         routed = sn_router(qaoa.bqm, qpu)
-        qc_sn = routed.build_qiskit(qaoa.betas.tolist(), qaoa.gammas.tolist())
+        qc_sn = routed.build_qiskit(list(betas), list(gammas))
 
         # Default layout method uses the VF2 algorithm to find an exact layout match.
         # An exact layout match is guaranteed to exist, so no further routing is needed.
@@ -267,7 +359,7 @@ def transpiled_circuit(
 
         # Here the variable has a different name from above to avoid confusing `mypy`.
         star_routed = star_router(qaoa.bqm, star_qpu)
-        qc_mvc = star_routed.build_qiskit(qaoa.betas.tolist(), qaoa.gammas.tolist())
+        qc_mvc = star_routed.build_qiskit(list(betas), list(gammas))
 
         handling_of_errors = ExistingMoveHandlingOptions("keep")
         # Optimization level > 1 causes the transpiler to put SQG on the resonator
@@ -28,7 +28,8 @@ the backend classes from the module :mod:`~iqm.qaoa.backends`.
 """
 
 from collections.abc import Sequence
-from typing import Any, Literal
+from functools import cached_property
+from typing import Any, Literal, NamedTuple
 
 from dimod import BinaryQuadraticModel, to_networkx_graph
 from iqm.applications.qubo import ConstrainedQuadraticInstance, QUBOInstance
@@ -38,6 +39,47 @@ import networkx as nx
 import numpy as np
 from scipy.optimize import minimize
 
+# The minimization methods of :func:`~scipy.optimize.minimize` which use the gradient of the minimized function
+_GRADIENT_METHODS = frozenset(
+    {
+        "cg",
+        "bfgs",
+        "newton-cg",
+        "l-bfgs-b",
+        "tnc",
+        "slsqp",
+        "trust-constr",
+        "dogleg",
+        "trust-ncg",
+        "trust-exact",
+        "trust-krylov",
+    }
+)
+# The relative step of forward finite differences, the same as the default of :func:`~scipy.optimize.minimize`
+_FINITE_DIFFERENCE_STEP = np.sqrt(np.finfo(float).eps)
+
+
+class SparseCouplings(NamedTuple):
+    r"""Sparse array representation of the problem Hamiltonian :math:`H = \sum_{i<j} J_{ij} Z_i Z_j + \sum_i h_i Z_i`.
+
+    Variables are indexed in the order of :attr:`QUBOQAOA.local_fields`. Every edge :math:`(i, j)` of the interaction
+    graph appears once in ``edge_rows``, ``edge_cols`` and ``edge_weights`` and twice in the symmetric CSR adjacency
+    ``indptr``, ``indices``, ``weights``. Triangles of the interaction graph are listed per edge: the triangle ``t``
+    closes the edge ``triangle_edges[t]`` with a common neighbor :math:`k` such that
+    ``triangle_row_weights[t]`` :math:`= J_{ik}` and ``triangle_col_weights[t]`` :math:`= J_{jk}`.
+    """
+
+    local_fields: np.ndarray
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+    edge_rows: np.ndarray
+    edge_cols: np.ndarray
+    edge_weights: np.ndarray
+    triangle_edges: np.ndarray
+    triangle_row_weights: np.ndarray
+    triangle_col_weights: np.ndarray
+
 
 class QUBOQAOA(QAOA):
     """The class for QAOA with quadratic unconstrained binary (QUBO) cost function.
@@ -110,6 +152,62 @@ class QUBOQAOA(QAOA):
         loc_fields, _, *_ = self._bqm.to_numpy_vectors(sort_indices=True)
         return loc_fields
 
+    @cached_property
+    def sparse_couplings(self) -> SparseCouplings:
+        """The sparse adjacency and triangles of the interaction graph, computed once from :attr:`bqm`.
+
+        Used by estimators which evaluate all terms of the Hamiltonian with vectorized array operations,
+        see :class:`SparseCouplings`.
+        """
+        loc_fields, (row, col, quad), *_ = self._bqm.to_numpy_vectors(sort_indices=True)
+        num_variables = len(loc_fields)
+        row, col = row.astype(np.int64), col.astype(np.int64)
+
+        # Symmetric CSR adjacency, neighbors of every node sorted by index
+        both_rows = np.concatenate([row, col])
+        both_cols = np.concatenate([col, row])
+        order = np.lexsort((both_cols, both_rows))
+        indices, weights = both_cols[order], np.concatenate([quad, quad])[order]
+        indptr = np.zeros(num_variables + 1, dtype=np.int64)
+        np.cumsum(np.bincount(both_rows, minlength=num_variables), out=indptr[1:])
+
+        # Every pair of neighbors (a, b) of a node k closes a triangle if (a, b) is an edge
+        edge_keys = np.minimum(row, col) * num_variables + np.maximum(row, col)
+        key_order = np.argsort(edge_keys)
+        triangle_edges, triangle_row_weights, triangle_col_weights = [], [], []
+        for k in range(num_variables):
+            start, stop = indptr[k], indptr[k + 1]
+            first, second = np.triu_indices(stop - start, 1)
+            if not len(first):
+                continue
+            neighbors, neighbor_weights = indices[start:stop], weights[start:stop]
+            keys = neighbors[first] * num_variables + neighbors[second]
+            positions = np.minimum(np.searchsorted(edge_keys, keys, sorter=key_order), len(key_order) - 1)
+            is_edge = edge_keys[key_order[positions]] == keys
+            edges = key_order[positions[is_edge]]
+            weights_first, weights_second = neighbor_weights[first[is_edge]], neighbor_weights[second[is_edge]]
+            # Neighbors are sorted, so the first one of the pair is the row of the edge if the row is the smaller index
+            row_is_first = row[edges] < col[edges]
+            triangle_edges.append(edges)
+            triangle_row_weights.append(np.where(row_is_first, weights_first, weights_second))
+            triangle_col_weights.append(np.where(row_is_first, weights_second, weights_first))
+
+        def _concatenate(arrays: list[np.ndarray], dtype: type) -> np.ndarray:
+            return np.concatenate(arrays) if arrays else np.zeros(0, dtype=dtype)
+
+        return SparseCouplings(
+            local_fields=loc_fields,
+            indptr=indptr,
+            indices=indices,
+            weights=weights,
+            edge_rows=row,
+            edge_cols=col,
+            edge_weights=quad,
+            triangle_edges=_concatenate(triangle_edges, np.int64),
+            triangle_row_weights=_concatenate(triangle_row_weights, float),
+            triangle_col_weights=_concatenate(triangle_col_weights, float),
+        )
+
     def train(
         self,
         estimator: EstimatorBackend | None = None,
@@ -145,6 +243,8 @@ class QUBOQAOA(QAOA):
             "Trust-Krylov",
             "trust-krylov",
         ] = "COBYLA",
+        initial_angles_grid: np.ndarray | None = None,
+        num_workers: int = 1,
         **kwargs: Any,
     ) -> None:
         """The function that performs the training of the angles.
@@ -155,7 +255,15 @@ class QUBOQAOA(QAOA):
         Args:
             estimator: An estimator :class:`~iqm.qaoa.backends.EstimatorBackend` to be used to calculating expectation
                 values for the minimization.
-            min_method: The minimization method passed to the :func:`~scipy.optimize.minimize` function.
+            min_method: The minimization method passed to the :func:`~scipy.optimize.minimize` function. For methods
+                which use gradients, the gradient is calculated analytically if the ``estimator`` provides it and by
+                forward finite differences evaluated in one :meth:`~iqm.qaoa.backends.EstimatorBackend.estimate_batch`
+                call otherwise.
+            initial_angles_grid: An optional 2-dimensional array whose rows are candidate initial angles. All of them
+                are evaluated in one :meth:`~iqm.qaoa.backends.EstimatorBackend.estimate_batch` call and the
+                minimization starts from the best one. If not provided, the minimization starts from the current
+                :attr:`~iqm.qaoa.generic_qaoa.QAOA.angles`.
+            num_workers: The number of processes over which the ``estimator`` may distribute batches of estimations.
             **kwargs: The keyword arguments to pass to the ``estimator``'s
                 :meth:`~iqm.qaoa.backends.EstimatorBackend.estimate`.
 
@@ -185,7 +293,37 @@ class QUBOQAOA(QAOA):
             self._angles = local_angles
             return estimator.estimate(self, **kwargs)
 
-        solution = minimize(function_to_minimize, x0=self.angles, method=min_method)
+        def function_and_gradient(local_angles: np.ndarray) -> tuple[float, np.ndarray]:
+            """Auxiliary function returning both the energy and its gradient for gradient-based minimization.
+
+            Uses the analytic gradient of ``estimator`` if it has one. Otherwise the forward finite-difference
+            stencil around ``local_angles`` is evaluated in one batch, which also yields the energy itself.
+
+            Args:
+                local_angles: A :class:`~numpy.ndarray` of the angles to try.
+
+            Returns:
+                The energy from ``estimator`` using the input angles and its gradient.
+
+            """
+            self._angles = local_angles
+            if estimator.provides_gradient:
+                return estimator.estimate_with_gradient(self)
+            steps = _FINITE_DIFFERENCE_STEP * np.maximum(1.0, np.abs(local_angles))
+            stencil = np.vstack([local_angles, local_angles + np.diag(steps)])
+            energies = estimator.estimate_batch(self, stencil, num_workers=num_workers, **kwargs)
+            return energies[0], (energies[1:] - energies[0]) / steps
+
+        x0 = self.angles
+        if initial_angles_grid is not None:
+            initial_angles_grid = np.atleast_2d(np.asarray(initial_angles_grid, dtype=float))
+            grid_energies = estimator.estimate_batch(self, initial_angles_grid, num_workers=num_workers, **kwargs)
+            x0 = initial_angles_grid[np.argmin(grid_energies)]
+
+        if min_method.lower() in _GRADIENT_METHODS:
+            solution = minimize(function_and_gradient, x0=x0, method=min_method, jac=True)
+        else:
+            solution = minimize(function_to_minimize, x0=x0, method=min_method)
         self._angles = solution.x
         self._trained = True
 
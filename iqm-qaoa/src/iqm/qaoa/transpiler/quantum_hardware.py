@@ -34,6 +34,7 @@ from iqm.qiskit_iqm.iqm_backend import IQMBackendBase
 from matplotlib.axes import Axes
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
 
 if TYPE_CHECKING:
     from iqm.qaoa.transpiler.routing import Mapping
@@ -61,7 +62,8 @@ A custom type alias of :class:`frozenset` of :class:`HardQubit` to refer to inte
 class QPU:
     r"""A parent class for all QPU architectures.
 
-    The main purpose of the QPU class is to store the :attr:`hardware_graph` and the :attr:`shortest_path`/s in there.
+    The main purpose of the QPU class is to store the :attr:`hardware_graph` and the :attr:`distance_matrix` (and
+    :attr:`shortest_path`/s) in there.
     The method :meth:`draw` can be used independently to plot the graph (using the :attr:`hardware_layout`), but it's
     meant to be used by the :meth:`~iqm.qaoa.transpiler.routing.Layer.draw` method of the class
     :class:`~iqm.qaoa.transpiler.routing.Layer`.
@@ -82,7 +84,15 @@ class QPU:
             self._hardware_layout = nx.planar_layout(self._hardware_graph)
         else:
             self._hardware_layout = hardware_layout
-        self._shortest_path = dict(nx.shortest_path(self._hardware_graph))
+        self._qubit_index = {hard_qb: index for index, hard_qb in enumerate(self._hardware_graph.nodes())}
+        num_qubits = len(self._qubit_index)
+        # Disconnected pairs of qubits get a distance larger than any path in the graph.
+        self._distance_matrix = np.full((num_qubits, num_qubits), num_qubits, dtype=int)
+        for source, lengths in nx.all_pairs_shortest_path_length(self._hardware_graph):
+            self._distance_matrix[self._qubit_index[source], [self._qubit_index[target] for target in lengths]] = list(
+                lengths.values()
+            )
+        self._shortest_path: dict[HardQubit, dict[HardQubit, list[HardQubit]]] | None = None
 
     @property
     def qubits(self) -> set[HardQubit]:
@@ -116,10 +126,39 @@ class QPU:
         """The dictionary of dictionaries of shortest paths.
 
         It's defined so that ``shortest_path[source][target]`` is the list of nodes lying on the/a shortest path
-        between the ``source`` and ``target`` nodes.
+        between the ``source`` and ``target`` nodes. The paths are calculated on first access. If only the lengths of
+        the paths are needed, use :meth:`distance` instead.
         """
+        if self._shortest_path is None:
+            self._shortest_path = dict(nx.shortest_path(self._hardware_graph))
         return self._shortest_path
 
+    @property
+    def qubit_index(self) -> dict[HardQubit, int]:
+        """The index of each :class:`HardQubit` in the rows and columns of :attr:`distance_matrix`."""
+        return self._qubit_index
+
+    @property
+    def distance_matrix(self) -> np.ndarray:
+        r"""The integer matrix of the numbers of edges on the shortest paths between all pairs of :class:`HardQubit`\s.
+
+        The rows and columns are indexed by :attr:`qubit_index`.
+        """
+        return self._distance_matrix
+
+    def distance(self, hard_qb0: HardQubit, hard_qb1: HardQubit) -> int:
+        r"""The number of edges on a shortest path between two :class:`HardQubit`\s.
+
+        Args:
+            hard_qb0: The first hardware qubit.
+            hard_qb1: The second hardware qubit.
+
+        Returns:
+            The distance between the qubits on the QPU graph, i.e., 1 for neighboring qubits.
+
+        """
+        return int(self._distance_matrix[self._qubit_index[hard_qb0], self._qubit_index[hard_qb1]])
+
     def draw(
         self,
         mapping: Mapping | None = None,
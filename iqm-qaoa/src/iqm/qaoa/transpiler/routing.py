@@ -46,8 +46,8 @@ class Mapping:
     """Mapping between logical and hardware qubits.
 
     It maintains two dictionaries: :attr:`log2hard` and :attr:`hard2log` which are mappings between logical
-    and hardware qubits. They are automatically kept in sync. The names for the hardware and logical qubits are
-    extracted from ``qpu`` and ``problem_bqm`` at initialization.
+    and hardware qubits. They are kept in sync by the methods of the class. The names for the hardware and logical
+    qubits are extracted from ``qpu`` and ``problem_bqm`` at initialization.
 
     Args:
         qpu: a :class:`~iqm.qaoa.transpiler.quantum_hardware.QPU` object describing the topology of the QPU, used to
@@ -102,6 +102,9 @@ class Mapping:
 
             self._hard2log = initial_mapping
 
+        # The inverse dictionary is stored too, so that lookups of hardware qubits don't need to invert ``_hard2log``.
+        self._log2hard: dict = {log_qb: hard_qb for hard_qb, log_qb in self._hard2log.items()}
+
     @property
     def hard2log(self) -> dict[HardQubit, LogQubit]:
         """The dictionary containing the mapping from hardware qubits to logical qubits."""
@@ -109,8 +112,12 @@ class Mapping:
 
     @property
     def log2hard(self) -> dict[LogQubit, HardQubit]:
-        """The dictionary :attr:`log2hard` is calculated lazily from :attr:`hard2log`."""
-        return {log_qb: hard_qb for hard_qb, log_qb in self._hard2log.items()}
+        """The dictionary containing the mapping from logical qubits to hardware qubits, inverse to :attr:`hard2log`.
+
+        Both dictionaries are updated together by the methods of :class:`Mapping`, so neither should be modified
+        directly.
+        """
+        return self._log2hard
 
     def swap_log(self, gate: LogEdge) -> None:
         """Swap association between a pair of logical qubits.
@@ -122,9 +129,10 @@ class Mapping:
 
         """
         qb0, qb1 = gate
-        hard_qb0 = self.log2hard[qb0]
-        hard_qb1 = self.log2hard[qb1]
+        hard_qb0 = self._log2hard[qb0]
+        hard_qb1 = self._log2hard[qb1]
         self._hard2log[hard_qb0], self._hard2log[hard_qb1] = qb1, qb0
+        self._log2hard[qb0], self._log2hard[qb1] = hard_qb1, hard_qb0
 
     def swap_hard(self, gate: HardEdge) -> None:
         """Swap association between a pair of hardware qubits.
@@ -136,7 +144,9 @@ class Mapping:
 
         """
         qb0, qb1 = gate
-        self._hard2log[qb0], self._hard2log[qb1] = self._hard2log[qb1], self._hard2log[qb0]
+        log_qb0, log_qb1 = self._hard2log[qb0], self._hard2log[qb1]
+        self._hard2log[qb0], self._hard2log[qb1] = log_qb1, log_qb0
+        self._log2hard[log_qb0], self._log2hard[log_qb1] = qb1, qb0
 
     def move_hard(self, source_qubit: HardQubit, target_qubit: HardQubit) -> None:
         """Move a logical qubit from a one hardware qubit to a an unassigned hardware qubit on the QPU.
@@ -168,9 +178,10 @@ class Mapping:
             )
         corresponding_log_qb = self._hard2log[source_qubit]
 
-        # Modify ``self._hard2log``
+        # Modify ``self._hard2log`` and ``self._log2hard``
         self._hard2log[target_qubit] = corresponding_log_qb
         del self._hard2log[source_qubit]
+        self._log2hard[corresponding_log_qb] = target_qubit
 
     def update(self, layer: Layer) -> None:
         """Update the mapping based on the swap gates found in a :class:`~iqm.qaoa.transpiler.routing.Layer` object.
@@ -63,32 +63,94 @@ def _int_pair_distance(
 
     """
     r = 0
+    log2hard = routing.mapping.log2hard
     for log_qb0, log_qb1 in buffer_interactions:
         if any_distance and r > 0:
             return r
-        hard_qb0, hard_qb1 = routing.mapping.log2hard[log_qb0], routing.mapping.log2hard[log_qb1]
+        hard_qb0, hard_qb1 = log2hard[log_qb0], log2hard[log_qb1]
         if swap_pair is None or swap_pair is not None and (hard_qb0 in swap_pair or hard_qb1 in swap_pair):
-            r += len(routing.qpu.shortest_path[hard_qb0][hard_qb1]) - 2
+            r += routing.qpu.distance(hard_qb0, hard_qb1) - 1
     return r
 
 
-def _int_pair_distance_change(routing: Routing, buffer_interactions: set[LogEdge], swap: HardEdge) -> int:
-    """Calculate the change of distances between logical qubits in ``buffer_interactions`` after a swap.
+def _buffer_partners(routing: Routing, buffer_interactions: set[LogEdge]) -> dict[HardQubit, list[HardQubit]]:
+    """The table of interaction partners of the hardware qubits involved in ``buffer_interactions``.
+
+    Maps each hardware qubit hosting a logical qubit from ``buffer_interactions`` to the hardware qubits hosting its
+    interaction partners in the buffer. Together with the distance matrix of the QPU, this allows evaluating the effect
+    of a swap on the distances in the buffer without iterating over the whole buffer, see
+    :func:`_int_pair_distance_change`. While the buffer doesn't change, the table is kept up to date with
+    :func:`_swap_buffer_partners`.
 
     Args:
         routing: The :class:`~iqm.qaoa.transpiler.routing.Routing` object that the whole algorithm is working on.
         buffer_interactions: The interactions in the 'buffer' waiting to be executed.
+
+    Returns:
+        The dictionary of interaction partners.
+
+    """
+    log2hard = routing.mapping.log2hard
+    partners: dict[HardQubit, list[HardQubit]] = {}
+    for log_qb0, log_qb1 in buffer_interactions:
+        hard_qb0, hard_qb1 = log2hard[log_qb0], log2hard[log_qb1]
+        partners.setdefault(hard_qb0, []).append(hard_qb1)
+        partners.setdefault(hard_qb1, []).append(hard_qb0)
+    return partners
+
+
+def _swap_buffer_partners(partners: dict[HardQubit, list[HardQubit]], swap: HardEdge) -> None:
+    """Updates the table of interaction partners from :func:`_buffer_partners` after ``swap`` has been applied.
+
+    This function modifies ``partners`` in-place.
+
+    Args:
+        partners: The interaction partners of the hardware qubits involved in the buffer.
+        swap: The pair of hardware qubits that has just been swapped.
+
+    """
+    hard_qb0, hard_qb1 = swap
+    relabel = {hard_qb0: hard_qb1, hard_qb1: hard_qb0}
+    moved = {hard_qb1: partners.pop(hard_qb0, None), hard_qb0: partners.pop(hard_qb1, None)}
+    # The other qubits interacting with the swapped ones need their lists of partners relabeled (once each).
+    affected = {partner for hard_qb_partners in moved.values() if hard_qb_partners for partner in hard_qb_partners}
+    for partner in affected - set(relabel):
+        partners[partner] = [relabel.get(other, other) for other in partners[partner]]
+    for hard_qb, hard_qb_partners in moved.items():
+        if hard_qb_partners is not None:
+            partners[hard_qb] = [relabel.get(partner, partner) for partner in hard_qb_partners]
+
+
+def _int_pair_distance_change(routing: Routing, partners: dict[HardQubit, list[HardQubit]], swap: HardEdge) -> int:
+    """Calculate the change of distances between logical qubits in the buffer after a swap.
+
+    Only the interactions involving one of the swapped qubits change their distance, so only those are looked up in
+    the table of interaction ``partners``.
+
+    Args:
+        routing: The :class:`~iqm.qaoa.transpiler.routing.Routing` object that the whole algorithm is working on.
+        partners: The interaction partners of the hardware qubits involved in the buffer, see
+            :func:`_buffer_partners`.
         swap: The pair of qubits to be swapped.
 
     Returns:
         The distance change before - after the swap.
 
     """
-    dist_before = _int_pair_distance(routing, buffer_interactions, swap)
-    routing.mapping.swap_hard(swap)
-    dist_after = _int_pair_distance(routing, buffer_interactions, swap)
-    routing.mapping.swap_hard(swap)
-    return dist_before - dist_after
+    hard_qb0, hard_qb1 = swap
+    distances = routing.qpu.distance_matrix
+    index0, index1 = routing.qpu.qubit_index[hard_qb0], routing.qpu.qubit_index[hard_qb1]
+    change = 0
+    # An interaction between the swapped qubits themselves keeps its distance.
+    for moving, staying, moving_partners in (
+        (index0, index1, partners.get(hard_qb0, ())),
+        (index1, index0, partners.get(hard_qb1, ())),
+    ):
+        for partner in moving_partners:
+            if partner not in swap:
+                partner_index = routing.qpu.qubit_index[partner]
+                change += distances[moving, partner_index] - distances[staying, partner_index]
+    return int(change)
 
 
 def _execute_all_possible_int_gates(
@@ -213,27 +275,29 @@ def _update_after_removal(
 def _execute_swaps(
     matching: set[tuple[HardQubit, HardQubit]],
     routing: Routing,
-    buffer_interactions: set[LogEdge],
+    partners: dict[HardQubit, list[HardQubit]],
     problem_graph: nx.Graph,
 ) -> None:
     """Takes a set of swaps in ``matching`` and applies them to the routing.
 
-    Checks if the swaps decrease the distances between logical qubits in ``buffer_interactions``. Afterwards
-    updates the distances in ``problem_graph``.
-    This function modifies ``problem_graph`` and :class:`~iqm.qaoa.transpiler.routing.Routing` in-place.
+    Checks if the swaps decrease the distances between logical qubits in the buffer. Afterwards updates the distances
+    in ``problem_graph``.
+    This function modifies ``problem_graph``, ``partners`` and :class:`~iqm.qaoa.transpiler.routing.Routing` in-place.
 
     Args:
         matching: A set of logical gates (presumably a matching).
         routing: The :class:`~iqm.qaoa.transpiler.routing.Routing` object that the whole algorithm is working on.
-        buffer_interactions: The interactions in the 'buffer' waiting to be executed.
+        partners: The interaction partners of the hardware qubits involved in the buffer, see
+            :func:`_buffer_partners`.
         problem_graph: A graph containing all not-yet-executed interactions (with edge bias corresponding
             to the distance on the HW graph)
 
     """
     for edge in matching:
         # Once more check that the distance really decreases by applying this swap
-        if _int_pair_distance_change(routing, buffer_interactions, HardEdge(edge)) >= 1:
+        if _int_pair_distance_change(routing, partners, HardEdge(edge)) >= 1:
             routing.apply_swap(HardEdge(edge))
+            _swap_buffer_partners(partners, HardEdge(edge))
             log1, log2 = routing.mapping.hard2log[edge[0]], routing.mapping.hard2log[edge[1]]
             _update_distances(routing, log1, problem_graph)
             _update_distances(routing, log2, problem_graph)
@@ -259,12 +323,17 @@ def _decrease_int_pair_distance(routing: Routing, buffer_interactions: set[LogEd
 
     """
     gate_executed = False
+    # The buffer doesn't change here, so its table of partners only needs updating after the applied swaps.
+    partners = _buffer_partners(routing, buffer_interactions)
     for _ in range(len(routing.mapping.hard2log)):
         swap_graph: nx.Graph = nx.Graph()
         for hard_qb0, hard_qb1 in routing.active_subgraph.edges():
+            # Only swaps involving a qubit from the buffer can change the distances.
+            if hard_qb0 not in partners and hard_qb1 not in partners:
+                continue
             swap_gate = HardEdge((hard_qb0, hard_qb1))
             if routing.layers[-1].swap_gate_applicable(swap_gate):
-                diff = _int_pair_distance_change(routing, buffer_interactions, swap_gate)
+                diff = _int_pair_distance_change(routing, partners, swap_gate)
                 # If ``swap_gate`` decreases the distances, it is added to ``swap_graph``
                 if diff in {2, 1}:
                     swap_graph.add_edge(hard_qb0, hard_qb1, weight=diff)
@@ -273,7 +342,7 @@ def _decrease_int_pair_distance(routing: Routing, buffer_interactions: set[LogEd
             # We can only execute the swaps that are compatible (i.e., they don't swap the same qubit).
             # The matching is weighted by how much do the swaps decrease the distances.
             matching = nx.max_weight_matching(swap_graph)
-            _execute_swaps(matching, routing, buffer_interactions, problem_graph)
+            _execute_swaps(matching, routing, partners, problem_graph)
             gate_executed = True
         else:
             break
@@ -412,10 +481,9 @@ def _update_distances(routing: Routing, log_q: LogQubit, problem_graph: nx.Graph
             to the distance on the HW graph).
 
     """
+    log2hard = routing.mapping.log2hard
     for neighbor in problem_graph.neighbors(log_q):
-        distance = (
-            len(routing.qpu.shortest_path[routing.mapping.log2hard[log_q]][routing.mapping.log2hard[neighbor]]) - 2
-        )
+        distance = routing.qpu.distance(log2hard[log_q], log2hard[neighbor]) - 1
         problem_graph[neighbor][log_q]["bias"] = distance
 
 
@@ -502,8 +570,8 @@ def _get_initial_objects(
     for q1, q2 in route.remaining_interactions.edges:
         hard1, hard2 = route.mapping.log2hard[q1], route.mapping.log2hard[q2]
         # The distance of the interaction in terms of number of swaps needed to be able to execute the interaction.
-        # It corresponds to the length of the shortest path minus two (excluding the first and last node of the path).
-        problem_graph.add_edge(q1, q2, bias=len(route.qpu.shortest_path[hard1][hard2]) - 2)
+        # It corresponds to the number of edges on the shortest path minus one.
+        problem_graph.add_edge(q1, q2, bias=route.qpu.distance(hard1, hard2) - 1)
 
     # Iterate over all gates in the first two layers (chain unpacks the two layers and all gates in them)
     for int_gate in chain.from_iterable(first_two_int_layers):
@@ -25,7 +25,6 @@ Also contains a little helper function ``_find_nearest``.
 """
 
 from collections.abc import Sequence
-import re
 import warnings
 
 from iqm.qaoa.qubo_qaoa import QUBOQAOA
@@ -104,11 +103,7 @@ class TreeQAOA(QUBOQAOA):
             h_av += g.nodes[i]["bias"]
         h_av /= g.number_of_nodes()
 
-        pattern = re.compile(r"^RESULTS_D(\d+)$")
-        # Extract integers from matching variable names
-        implemented_ds = [
-            int(match.group(1)) for each_variable in dir(angles) if (match := pattern.match(each_variable))
-        ]
+        implemented_ds = angles.implemented_branchings()
 
         d_round = round(d_av)  # Round input to integer
 
@@ -143,7 +138,7 @@ class TreeQAOA(QUBOQAOA):
                 stacklevel=2,
             )
 
-        results = getattr(angles, f"RESULTS_D{d_round - 1:d}")
+        results = angles.tree_angles(d_round - 1)
 
         max_precomputed_layers = len(results[h_close]["gammas"])  # As of 25.8.2025 this is expected to be 6.
         # Get angles:
@@ -13,6 +13,8 @@
 # limitations under the License.
 """Serializers and deserializers for :class:`~iqm.models.playlist.playlist.Playlist`"""
 
+from functools import lru_cache
+
 import iqm.data_definitions.common.v1.playlist_pb2 as pb
 from iqm.models.playlist import ChannelDescription, IQChannelConfig, RealChannelConfig, Segment, instructions, waveforms
 from iqm.models.playlist.channel_descriptions import ReadoutChannelConfig
@@ -113,7 +115,8 @@ def _waveform_to_proto(waveform: waveforms.CanonicalWaveform) -> pb.Waveform:
             ret_wf.gaussian_smoothed_square.center_offset = waveform.center_offset
 
         case waveforms.Samples():
-            ret_wf.samples.samples.extend(waveform.samples)
+            # converting to a list first is much faster than extending with the numpy array elements
+            ret_wf.samples.samples.extend(waveform.samples.tolist())
 
         case waveforms.Constant():
             ret_wf.constant.SetInParent()
@@ -138,9 +141,55 @@ def _waveform_to_proto(waveform: waveforms.CanonicalWaveform) -> pb.Waveform:
     return ret_wf
 
 
+@lru_cache(maxsize=10000)
+def _packed_waveform(waveform: waveforms.CanonicalWaveform) -> bytes:
+    """Serialized protobuf representation of the given waveform.
+
+    Waveforms are immutable, and compare and hash by their contents, so the results can be cached and reused
+    by all playlists that contain an identical waveform, e.g. the same :class:`.Samples` table.
+    """
+    return _waveform_to_proto(waveform).SerializeToString()
+
+
+def _pack_channel(
+    channel_name: str, channel_description: ChannelDescription, proto_channel: pb.ChannelDescription
+) -> None:
+    """Pack the given channel description into the given protobuf channel."""
+    proto_channel.controller_name = channel_name
+
+    match channel_description.channel_config:
+        case IQChannelConfig(sampling_rate):  # type: ignore[misc]
+            proto_channel.channel_config.iq_channel.sample_rate = sampling_rate
+        case RealChannelConfig(sampling_rate):  # type: ignore[misc]
+            proto_channel.channel_config.real_channel.sample_rate = sampling_rate
+        case ReadoutChannelConfig(sampling_rate):  # type: ignore[misc]
+            proto_channel.channel_config.ro_channel.sample_rate = sampling_rate
+
+    proto_channel.instruction_table.extend(
+        _instruction_to_proto(
+            instruction,
+            channel_description._reverse_instruction_index,
+            channel_description._reverse_waveform_index,
+            channel_description._reverse_acquisition_index,
+        )
+        for instruction in channel_description.instruction_table
+    )
+
+    for waveform in channel_description.waveform_table:
+        proto_channel.waveform_table.add().MergeFromString(_packed_waveform(waveform))
+
+    proto_channel.acquisition_table.extend(
+        _aqcuisition_method_to_proto(acquisition, channel_description._reverse_waveform_index)
+        for acquisition in channel_description.acquisition_table
+    )
+
+
 def pack_playlist(playlist: Playlist) -> pb.Playlist:
     """Pack the given playlist into a protobuf format for further serialization.
 
+    The serialized waveforms are cached, so repeatedly packing playlists that share waveforms
+    (e.g. recompiled versions of the same circuits) only converts each distinct waveform once.
+
     Args:
         playlist: playlist to pack
 
@@ -152,39 +201,13 @@ def pack_playlist(playlist: Playlist) -> pb.Playlist:
 
     # segments
     for segment in playlist.segments:
-        pb_schedule = pb.Schedule()
+        pb_schedule = proto_playlist.schedules.add()
         for channel_name, instr_refs in segment.instructions.items():
             pb_schedule.channels[channel_name].instruction_refs.extend(instr_refs)
-        proto_playlist.schedules.append(pb_schedule)
 
     # channel descriptions
     for channel_name, channel_description in playlist.channel_descriptions.items():
-        proto_playlist.channels[channel_name].controller_name = channel_name
-
-        match channel_description.channel_config:
-            case IQChannelConfig(sampling_rate):  # type: ignore[misc]
-                proto_playlist.channels[channel_name].channel_config.iq_channel.sample_rate = sampling_rate
-            case RealChannelConfig(sampling_rate):  # type: ignore[misc]
-                proto_playlist.channels[channel_name].channel_config.real_channel.sample_rate = sampling_rate
-            case ReadoutChannelConfig(sampling_rate):  # type: ignore[misc]
-                proto_playlist.channels[channel_name].channel_config.ro_channel.sample_rate = sampling_rate
-
-        for instruction in channel_description.instruction_table:
-            instr = _instruction_to_proto(
-                instruction,
-                channel_description._reverse_instruction_index,
-                channel_description._reverse_waveform_index,
-                channel_description._reverse_acquisition_index,
-            )
-            proto_playlist.channels[channel_name].instruction_table.append(instr)
-
-        for waveform in channel_description.waveform_table:
-            wf_pb = _waveform_to_proto(waveform)
-            proto_playlist.channels[channel_name].waveform_table.append(wf_pb)
-
-        for acquisition in channel_description.acquisition_table:
-            acq_pb = _aqcuisition_method_to_proto(acquisition, channel_description._reverse_waveform_index)
-            proto_playlist.channels[channel_name].acquisition_table.append(acq_pb)
+        _pack_channel(channel_name, channel_description, proto_playlist.channels[channel_name])
 
     return proto_playlist
 
@@ -0,0 +1,132 @@
+# Copyright 2024 IQM
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the playlist serializers.
+
+Running this module as a script benchmarks :func:`pack_playlist` on a large randomized benchmarking playlist::
+
+    python tests/test_playlist_serializers.py
+"""
+
+import time
+
+from iqm.models.playlist import ChannelDescription, IQChannelConfig, Segment, instructions, waveforms
+from iqm.models.playlist.channel_descriptions import ReadoutChannelConfig
+from iqm.models.playlist.playlist import Playlist
+import numpy as np
+
+from iqm.station_control.client.serializers.playlist_serializers import (
+    _packed_waveform,
+    pack_playlist,
+    unpack_playlist,
+)
+
+NUM_CLIFFORD_PULSES = 24
+PULSE_SAMPLES = 40
+
+
+def rb_playlist(num_qubits: int, num_sequences: int, sequence_length: int, seed: int = 1) -> Playlist:
+    """Randomized-benchmarking-like playlist: random sequences of Clifford pulses on each qubit, then a readout.
+
+    Every qubit has its own calibrated set of Clifford pulses given as :class:`.Samples`, so the same waveforms
+    appear in every sequence, as they do in real RB playlists.
+    """
+    rng = np.random.default_rng(seed)
+    playlist = Playlist()
+    drives = []
+    pulses = []
+    for qubit in range(num_qubits):
+        drive = ChannelDescription(IQChannelConfig(2e9), f"QB{qubit + 1}__drive.awg")
+        playlist.add_channel(drive)
+        drives.append(drive)
+        pulses.append(
+            [
+                instructions.Instruction(
+                    PULSE_SAMPLES,
+                    instructions.IQPulse(
+                        waveforms.Samples(rng.normal(size=PULSE_SAMPLES)),
+                        waveforms.Samples(rng.normal(size=PULSE_SAMPLES)),
+                        scale_i=float(rng.random()),
+                        scale_q=float(rng.random()),
+                        phase=float(rng.random()),
+                    ),
+                )
+                for _ in range(NUM_CLIFFORD_PULSES)
+            ]
+        )
+    readout = ChannelDescription(ReadoutChannelConfig(2e9), "PL-1__readout")
+    playlist.add_channel(readout)
+    acquisition = instructions.ComplexIntegration(
+        label="readout",
+        delay_samples=8,
+        weights=instructions.IQPulse(waveforms.Constant(64), waveforms.Constant(64), 1.0, 0.0, 0.0),
+    )
+    trigger = instructions.Instruction(
+        64, instructions.ReadoutTrigger(instructions.Instruction(64, instructions.Wait()), (acquisition,))
+    )
+
+    for _ in range(num_sequences):
+        segment = Segment()
+        for drive, qubit_pulses in zip(drives, pulses):
+            segment.instructions[drive.controller_name] = [
+                drive.add_instruction(qubit_pulses[index])
+                for index in rng.integers(NUM_CLIFFORD_PULSES, size=sequence_length)
+            ]
+        segment.instructions[readout.controller_name] = [readout.add_instruction(trigger)]
+        playlist.segments.append(segment)
+    return playlist
+
+
+def test_cached_packing_is_identical_to_uncached_packing():
+    playlist = rb_playlist(num_qubits=3, num_sequences=10, sequence_length=20)
+    _packed_waveform.cache_clear()
+    uncached = pack_playlist(playlist).SerializeToString(deterministic=True)
+    assert _packed_waveform.cache_info().currsize > 0
+
+    # a recompiled playlist has equal but not identical waveforms, which must hit the cache
+    recompiled = rb_playlist(num_qubits=3, num_sequences=10, sequence_length=20)
+    hits = _packed_waveform.cache_info().hits
+    cached = pack_playlist(recompiled).SerializeToString(deterministic=True)
+    assert _packed_waveform.cache_info().hits > hits
+    assert cached == uncached
+
+
+def test_pack_unpack_round_trip():
+    playlist = rb_playlist(num_qubits=2, num_sequences=5, sequence_length=10)
+    unpacked = unpack_playlist(pack_playlist(playlist))
+    assert [segment.instructions for segment in unpacked.segments] == [
+        segment.instructions for segment in playlist.segments
+    ]
+    for name, channel in playlist.channel_descriptions.items():
+        assert unpacked.channel_descriptions[name].instruction_table == channel.instruction_table
+        assert unpacked.channel_descriptions[name].waveform_table == channel.waveform_table
+
+
+def benchmark_pack_playlist(num_qubits: int = 20, num_sequences: int = 1000, sequence_length: int = 200) -> None:
+    """Print the packing times of a large RB playlist with an empty and with a filled waveform cache."""
+    playlist = rb_playlist(num_qubits, num_sequences, sequence_length)
+    _packed_waveform.cache_clear()
+    start = time.perf_counter()
+    pack_playlist(playlist)
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    pack_playlist(playlist)
+    warm = time.perf_counter() - start
+    print(
+        f"{num_qubits} qubits, {num_sequences} sequences of {sequence_length} Cliffords: "
+        f"packing {cold:.3f} s with an empty waveform cache, {warm:.3f} s with a filled one"
+    )
+
+
+if __name__ == "__main__":
+    benchmark_pack_playlist()